@@ -0,0 +1,4 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+"""Performance benchmarks for the validate rule engine (see benchmarks/README.md)."""
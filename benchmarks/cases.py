@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# benchmarks/cases.py
+"""
+Synthetic tables and rules for the validate rule types (CHECK_TYPES).
+
+Every case is one rule over string columns shaped like what read_input()
+returns (dtype str, empty cells as ""). Two knobs shape the data:
+
+- cardinality: number of distinct valid values per column (also the size of
+  the reference table for foreign_key);
+- violation_rate: fraction of rows the rule should flag.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Case:
+    """One rule and the tables it reads; the rule runs on the first table."""
+
+    rule: dict[str, Any]
+    frames: dict[str, pd.DataFrame]
+
+    @property
+    def table(self) -> str:
+        return next(iter(self.frames))
+
+
+def _vocab(fmt: str, n: int) -> np.ndarray:
+    return np.array([fmt.format(j) for j in range(max(n, 1))], dtype=object)
+
+
+def _column(
+    rng: np.random.Generator, rows: int, valid: np.ndarray, bad: np.ndarray, rate: float
+) -> pd.Series:
+    """rows values drawn from valid, with about rate of them drawn from bad instead."""
+    values = valid[rng.integers(0, len(valid), rows)]
+    flip = rng.random(rows) < rate
+    values[flip] = bad[rng.integers(0, len(bad), int(flip.sum()))]
+    return pd.Series(values, dtype="str")
+
+
+def _ids(rng: np.random.Generator, rows: int, rate: float) -> np.ndarray:
+    """0..rows-1 with about rate of them replaced by a copy of another id."""
+    ids = np.arange(rows)
+    flip = rng.random(rows) < rate
+    ids[flip] = rng.integers(0, max(rows, 1), int(flip.sum()))
+    return ids
+
+
+def _rule(rtype: str, **spec: Any) -> dict[str, Any]:
+    return {"id": f"bench_{rtype}", "type": rtype, "severity": "fail", **spec}
+
+
+def _keys_case(rtype: str) -> Callable[..., Case]:
+    def build(rng, rows, rate, cardinality):
+        ids = _ids(rng, rows, rate)
+        df = pd.DataFrame(
+            {
+                "k1": pd.Series(ids // max(cardinality, 1), dtype="str"),
+                "k2": pd.Series(ids % max(cardinality, 1), dtype="str"),
+            }
+        )
+        return Case(_rule(rtype, keys=["k1", "k2"]), {"data": df})
+
+    return build
+
+
+def _unique(rng, rows, rate, cardinality):
+    df = pd.DataFrame({"id": pd.Series(_ids(rng, rows, rate), dtype="str")})
+    return Case(_rule("unique", columns=["id"]), {"data": df})
+
+
+def _enum(rng, rows, rate, cardinality):
+    allow = _vocab("v{}", cardinality)
+    df = pd.DataFrame({"value": _column(rng, rows, allow, _vocab("bad_{}", cardinality), rate)})
+    return Case(_rule("enum", column="value", allow=allow.tolist()), {"data": df})
+
+
+def _range(rng, rows, rate, cardinality):
+    valid = np.array([f"{x:.3f}" for x in np.linspace(0, 100, max(cardinality, 1))], dtype=object)
+    bad = np.array(["150", "-1", "n/a"], dtype=object)
+    df = pd.DataFrame({"value": _column(rng, rows, valid, bad, rate)})
+    return Case(_rule("range", column="value", min=0, max=100), {"data": df})
+
+
+def _foreign_key(rng, rows, rate, cardinality):
+    keys = _vocab("K{:08d}", cardinality)
+    src = pd.DataFrame({"ref": _column(rng, rows, keys, _vocab("X{:08d}", cardinality), rate)})
+    ref = pd.DataFrame({"key": pd.Series(keys, dtype="str")})
+    rule = _rule(
+        "foreign_key",
+        **{"from": {"table": "data", "field": "ref"}, "to": {"table": "ref", "field": "key"}},
+    )
+    return Case(rule, {"data": src, "ref": ref})
+
+
+def _required(rng, rows, rate, cardinality):
+    bad = np.array(["", "  "], dtype=object)
+    df = pd.DataFrame({"value": _column(rng, rows, _vocab("v{}", cardinality), bad, rate)})
+    return Case(_rule("required", columns=["value"]), {"data": df})
+
+
+def _url(rng, rows, rate, cardinality):
+    valid = _vocab("https://example.org/r/{}", cardinality)
+    bad = _vocab("example.org/r/{}", cardinality)
+    df = pd.DataFrame({"value": _column(rng, rows, valid, bad, rate)})
+    return Case(_rule("url", column="value"), {"data": df})
+
+
+def _non_empty_trimmed(rng, rows, rate, cardinality):
+    bad = np.array(["", " ", "\t"], dtype=object)
+    df = pd.DataFrame({"value": _column(rng, rows, _vocab("v{}", cardinality), bad, rate)})
+    return Case(_rule("non_empty_trimmed", column="value"), {"data": df})
+
+
+def _regex(rng, rows, rate, cardinality):
+    valid = _vocab("ABC-{:06d}", cardinality)
+    bad = _vocab("abc_{}", cardinality)
+    df = pd.DataFrame({"value": _column(rng, rows, valid, bad, rate)})
+    rule = _rule("regex", column="value", regex=r"[A-Z]{3}-\d{6}", mode="not_matches")
+    return Case(rule, {"data": df})
+
+
+CASES: dict[str, Callable[..., Case]] = {
+    "dup": _keys_case("dup"),
+    "no_duplicate_rows": _keys_case("no_duplicate_rows"),
+    "unique": _unique,
+    "enum": _enum,
+    "range": _range,
+    "foreign_key": _foreign_key,
+    "required": _required,
+    "url": _url,
+    "non_empty_trimmed": _non_empty_trimmed,
+    "regex": _regex,
+}
+
+
+def make_case(
+    rtype: str,
+    rows: int,
+    *,
+    violation_rate: float = 0.01,
+    cardinality: int = 1000,
+    seed: int = 0,
+) -> Case:
+    """Build the benchmark case for a rule type (a key of CASES)."""
+    rng = np.random.default_rng(seed)
+    return CASES[rtype](rng, rows, violation_rate, cardinality)
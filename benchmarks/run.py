@@ -0,0 +1,206 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# benchmarks/run.py
+"""
+Time every validate rule type on synthetic data and compare with a baseline.
+
+For each rule type and size, the compiled rule runs on an in-memory table
+(`repeat` times, best time kept) with a fresh ColumnCache / ReferenceIndexes per
+run, so derived views and key indexes are part of the measurement. Peak memory
+comes from one further run under tracemalloc.
+
+Usage:
+    python -m benchmarks.run [--sizes 1e4,1e6,1e7] [--rules enum,regex]
+        [--violation-rate 0.01] [--cardinality 1000] [--repeat 3]
+        [--output results.json] [--save-baseline benchmarks/baselines/local.json]
+        [--compare benchmarks/baselines/local.json] [--threshold 0.25]
+
+With --compare, exits 1 when any (rule type, size) present in both runs is
+slower than the baseline's rows/sec by more than --threshold (a fraction).
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.metadata as md
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from fairy.validation.column_cache import ColumnCache
+from fairy.validation.foreign_keys import ReferenceIndexes
+from fairy.validation.rulepack_runner import CHECK_TYPES, compile_rulepack
+
+from .cases import Case, make_case
+
+DEFAULT_SIZES = (10_000, 1_000_000, 10_000_000)
+
+# Run parameters a baseline is only comparable under
+_PARAMS = ("violation_rate", "cardinality", "seed")
+
+
+def _core_version() -> str:
+    try:
+        return md.version("fairy-core")
+    except md.PackageNotFoundError:
+        return "unknown"
+
+
+def _run_once(rule, case: Case) -> str:
+    df = case.frames[case.table]
+    cache = ReferenceIndexes(case.frames) if rule.cross_table else ColumnCache(df)
+    status, _ev = rule.run(df, case.frames, cache)
+    return status
+
+
+def measure(case: Case, *, repeat: int = 3, memory: bool = True) -> dict[str, Any]:
+    """rows, best wall time, rows/sec, tracemalloc peak bytes and status of one case."""
+    plan = compile_rulepack({"resources": [{"pattern": "*", "rules": [case.rule]}]})
+    (rule,) = plan.rules_for(Path(f"{case.table}.csv"))
+    rows = len(case.frames[case.table])
+    best = float("inf")
+    status = ""
+    for _ in range(max(repeat, 1)):
+        t0 = time.perf_counter()
+        status = _run_once(rule, case)
+        best = min(best, time.perf_counter() - t0)
+    out: dict[str, Any] = {
+        "rows": rows,
+        "seconds": round(best, 6),
+        "rows_per_s": round(rows / best, 1) if best > 0 else None,
+        "status": status,
+    }
+    if memory:
+        tracemalloc.start()
+        try:
+            _run_once(rule, case)
+            out["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return out
+
+
+def run_suite(
+    rules: list[str],
+    sizes: list[int],
+    *,
+    violation_rate: float = 0.01,
+    cardinality: int = 1000,
+    seed: int = 0,
+    repeat: int = 3,
+    memory: bool = True,
+    log=print,
+) -> dict[str, Any]:
+    """Measure every (rule type, size); the JSON document baselines are made of."""
+    results: dict[str, dict[str, Any]] = {}
+    for rtype in rules:
+        for rows in sizes:
+            case = make_case(
+                rtype, rows, violation_rate=violation_rate, cardinality=cardinality, seed=seed
+            )
+            m = measure(case, repeat=repeat, memory=memory)
+            results.setdefault(rtype, {})[str(rows)] = m
+            peak = f"{m['peak_bytes'] / 1e6:9.1f} MB" if "peak_bytes" in m else ""
+            log(f"{rtype:<18} {rows:>11,} {m['rows_per_s'] / 1e6:9.2f} M rows/s {peak}")
+    return {
+        "meta": {
+            "fairy_core": _core_version(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "violation_rate": violation_rate,
+            "cardinality": cardinality,
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """One message per (rule type, size) more than threshold slower than the baseline."""
+    for p in _PARAMS:
+        if current["meta"].get(p) != baseline["meta"].get(p):
+            raise ValueError(
+                f"baseline was recorded with {p}={baseline['meta'].get(p)!r}, "
+                f"this run used {current['meta'].get(p)!r}"
+            )
+    slower = []
+    for rtype, by_size in current["results"].items():
+        for rows, m in by_size.items():
+            base = baseline["results"].get(rtype, {}).get(rows)
+            if not base or not base.get("rows_per_s") or not m.get("rows_per_s"):
+                continue
+            ratio = m["rows_per_s"] / base["rows_per_s"]
+            if ratio < 1 - threshold:
+                slower.append(
+                    f"{rtype} @ {int(rows):,} rows: {m['rows_per_s'] / 1e6:.2f} M rows/s vs "
+                    f"baseline {base['rows_per_s'] / 1e6:.2f} ({(1 - ratio) * 100:.0f}% slower)"
+                )
+    return slower
+
+
+def _sizes(text: str) -> list[int]:
+    return [int(float(s)) for s in text.split(",") if s.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    p.add_argument("--sizes", type=_sizes, default=list(DEFAULT_SIZES), help="e.g. 1e4,1e6")
+    p.add_argument("--rules", default=",".join(sorted(CHECK_TYPES)), help="comma-separated")
+    p.add_argument("--violation-rate", type=float, default=0.01)
+    p.add_argument("--cardinality", type=int, default=1000)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    p.add_argument("--output", type=Path, help="write this run's results as JSON")
+    p.add_argument("--save-baseline", type=Path, metavar="PATH")
+    p.add_argument("--compare", type=Path, metavar="PATH", help="baseline JSON to compare with")
+    p.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown (fraction)")
+    args = p.parse_args(argv)
+
+    rules = [r.strip() for r in args.rules.split(",") if r.strip()]
+    unknown = sorted(set(rules) - CHECK_TYPES)
+    if unknown:
+        p.error(f"unknown rule types: {', '.join(unknown)}")
+
+    current = run_suite(
+        rules,
+        args.sizes,
+        violation_rate=args.violation_rate,
+        cardinality=args.cardinality,
+        seed=args.seed,
+        repeat=args.repeat,
+        memory=not args.no_memory,
+    )
+    for path in (args.output, args.save_baseline):
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(current, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        try:
+            slower = compare(current, baseline, args.threshold)
+        except ValueError as e:
+            print(f"cannot compare: {e}", file=sys.stderr)
+            return 2
+        for line in slower:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if slower:
+            return 1
+        print(f"no regression beyond {args.threshold:.0%} of {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
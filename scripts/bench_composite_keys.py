@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark the composite-key duplicate engine (fairy.validation.keys).
+
+Builds a synthetic table with N rows x K string key columns (default 10M x 3)
+and times:
+  - duplicate_mask()            per-column codes folded into one uint64 key
+  - DataFrame.duplicated()      pandas reference
+  - apply(tuple, axis=1)        the old check_unique path (only with --legacy;
+                                very slow at 10M rows)
+
+Usage:
+    python scripts/bench_composite_keys.py [--rows 10000000] [--keys 3]
+        [--cardinality 200] [--legacy]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from fairy.validation.keys import duplicate_mask
+
+
+def _table(rows: int, keys: int, cardinality: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    cols = {}
+    for k in range(keys):
+        vocab = np.array([f"k{k}_{i}" for i in range(cardinality)], dtype=object)
+        cols[f"key{k}"] = pd.Series(vocab[rng.integers(0, cardinality, rows)], dtype="str")
+    return pd.DataFrame(cols)
+
+
+def _time(label: str, fn, rows: int):
+    t0 = time.perf_counter()
+    out = fn()
+    dt = time.perf_counter() - t0
+    print(f"{label:<28} {dt:8.2f}s  {rows / dt / 1e6:8.2f} M rows/s  dups={int(out.sum())}")
+    return out
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    p.add_argument("--rows", type=int, default=10_000_000)
+    p.add_argument("--keys", type=int, default=3)
+    p.add_argument("--cardinality", type=int, default=200)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--legacy", action="store_true", help="also time the row-wise tuple apply")
+    args = p.parse_args()
+
+    t0 = time.perf_counter()
+    df = _table(args.rows, args.keys, args.cardinality, args.seed)
+    cols = list(df.columns)
+    print(f"generated {args.rows:,} rows x {args.keys} keys in {time.perf_counter() - t0:.1f}s")
+
+    ours = _time("duplicate_mask", lambda: duplicate_mask(df, cols), args.rows)
+    ref = _time("DataFrame.duplicated", lambda: df.duplicated(subset=cols).to_numpy(), args.rows)
+    if args.legacy:
+        _time(
+            "apply(tuple, axis=1)",
+            lambda: df[cols].astype(object).apply(tuple, axis=1).duplicated().to_numpy(),
+            args.rows,
+        )
+
+    if not np.array_equal(ours, ref):
+        print("MISMATCH between duplicate_mask and DataFrame.duplicated")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import sys
 
-from .cmd_rulepack import main as rulepack_main
 from .common import version_text
 from .parser import build_parser
 
@@ -28,6 +27,8 @@ def main(argv=None) -> int:
     # --- compat: `run --mode rulepack ...` with no subcommand
     if args.command == "run" and getattr(args, "run_command", None) is None:
         if getattr(args, "mode", None) == "rulepack":
+            from .cmd_rulepack import main as rulepack_main
+
             return rulepack_main(args)
         # elif args.mode == "legacy":
         #     return cmd_validate.main(args)  # wire if/when you support it
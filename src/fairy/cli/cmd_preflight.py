@@ -2,15 +2,19 @@ from __future__ import annotations
 
 import argparse
 import json
+import time
 from pathlib import Path
 
 from fairy.core.services.preflight_profiles import get_registry
 
 from ..core.services.manifest import build_manifest_v1
 from ..core.services.preflight_profiles import run_profile
-from ..core.services.provenance import sha256_file
+from ..core.services.provenance import sha256_files
+from ..validation.hooks import HOOKS, write_text
+from ..validation.timing import dumps_timed
 from .common import ParamsFileError, load_params_file
 from .output_md import emit_preflight_markdown
+from .watch import add_watch_args, watch
 
 # Pull FAIRy version text if you want to embed it later; keep simple for now
 try:
@@ -38,7 +42,7 @@ def add_subparser(sub):
         usage=(
             "fairy preflight [profile] --rulepack RULEPACK [--samples SAMPLES] "
             "[--files FILES] [--inputs PATH ...] (--out-dir OUT_DIR | --out OUT) "
-            "[--fairy-version FAIRY_VERSION] [--param-file PATH]"
+            "[--fairy-version FAIRY_VERSION] [--param-file PATH] [--watch]"
         ),
         formatter_class=argparse.RawTextHelpFormatter,
         epilog=(
@@ -100,6 +104,13 @@ def add_subparser(sub):
         metavar="PATH",
         help="Path to a YAML file with tunable parameters injected into ctx['params']",
     )
+    pf.add_argument(
+        "--timings",
+        action="store_true",
+        help="Add per-rule wall time, rows scanned and peak memory, plus a run-level "
+        "phase breakdown, to the JSON report (slower: traces allocations)",
+    )
+    add_watch_args(pf)
     pf.set_defaults(func=main)
 
 
@@ -214,6 +225,10 @@ def main(args) -> int:
         print(f"Error: unknown profile '{profile_id}'")
         return 2
 
+    if getattr(args, "watch", False) and args.watch_interval <= 0:
+        print("Error: --watch-interval must be a positive number of seconds")
+        return 2
+
     # load params file if provided
     try:
         params = load_params_file(str(param_file) if param_file else None)
@@ -221,20 +236,47 @@ def main(args) -> int:
         print(str(e))
         return 2
 
+    if getattr(args, "watch", False):
+        return _watch(args, profile_id, inputs_map, param_file)
+    return _run(args, profile_id, inputs_map, params)
+
+
+def _watch(args, profile_id: str, inputs_map: dict, param_file: Path | None) -> int:
+    """
+    --watch: re-run the profile whenever the rulepack, an input or the params
+    file is saved. Each run is a full one (preflight keeps no per-rule results).
+    """
+    watched = [Path(args.rulepack), *(Path(p) for p in inputs_map.values())]
+    if param_file:
+        watched.append(Path(param_file))
+
+    def run() -> tuple[int, list[Path]]:
+        try:
+            params = load_params_file(str(param_file) if param_file else None)
+            return _run(args, profile_id, inputs_map, params), watched
+        except Exception as e:  # keep watching: the next save may fix it
+            print(f"Error: {e}")
+            return 2, watched
+
+    return watch(run, watched, interval=args.watch_interval)
+
+
+def _run(args, profile_id: str, inputs_map: dict, params: dict) -> int:
     report = run_profile(
         profile_id,
         rulepack=args.rulepack,
         inputs=inputs_map,
         fairy_version=args.fairy_version,
         params=params,
+        timings=getattr(args, "timings", False),
     )
     report_path, md_path, manifest_path, cache_path, inputs_manifest_path = _resolve_output_paths(
         args
     )
 
-    report_path.write_text(
-        json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True),
-        encoding="utf-8",
+    write_text(
+        report_path,
+        dumps_timed(report, lambda r: json.dumps(r, ensure_ascii=False, indent=2, sort_keys=True)),
     )
 
     # Extract data from new v1 structure
@@ -257,24 +299,29 @@ def main(args) -> int:
     _save_last_codes(cache_path, curr_codes)
 
     # Pass new structure to markdown emitter (it will handle the migration)
+    t0 = time.perf_counter()
     emit_preflight_markdown(md_path, report, resolved_codes, prior_codes)
+    HOOKS.emit("on_write", path=str(md_path), seconds=time.perf_counter() - t0)
 
     _emit_inputs_manifest(inputs_manifest_path, report)
 
+    report_sha, md_sha, inputs_manifest_sha = sha256_files(
+        [report_path, md_path, inputs_manifest_path], newline_stable=True
+    ).digests
     files_list = [
         {
             "path": report_path.name,
-            "sha256": sha256_file(report_path, newline_stable=True),
+            "sha256": report_sha,
             # role inferred
         },
         {
             "path": md_path.name,
-            "sha256": sha256_file(md_path, newline_stable=True),
+            "sha256": md_sha,
             # role inferred
         },
         {
             "path": inputs_manifest_path.relative_to(manifest_path.parent).as_posix(),
-            "sha256": sha256_file(inputs_manifest_path, newline_stable=True),
+            "sha256": inputs_manifest_sha,
             # role inferred
         },
     ]
@@ -289,10 +336,7 @@ def main(args) -> int:
         files=files_list,
     )
 
-    manifest_path.write_text(
-        json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True),
-        encoding="utf-8",
-    )
+    write_text(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True))
 
     # Console summary (trimmed)
     print("")
@@ -4,8 +4,6 @@ from hashlib import sha256
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 try:
     from fairy import __version__ as FAIRY_VERSION
 except Exception:
@@ -23,6 +21,8 @@ def load_params_file(path: str | None) -> dict[str, Any]:
     p = Path(path)
     if not p.exists():
         raise ParamsFileError(f"Param file not found: {path}")
+    import yaml
+
     try:
         with p.open("r", encoding="utf-8") as f:
             data = yaml.safe_load(f)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from ..core.fileio import write_text_atomic
+
 
 def emit_markdown(md_path: Path, payload: dict) -> None:
     """Very small markdown summary until template improves."""
@@ -221,6 +223,6 @@ def emit_preflight_markdown(
         lines += resolved_block
     lines += [""]
 
-    # Write file
+    # Write file (atomically: watch mode rewrites it while others may be reading)
     md_path.parent.mkdir(parents=True, exist_ok=True)
-    md_path.write_text("\n".join(lines), encoding="utf-8")
+    write_text_atomic(md_path, "\n".join(lines))
@@ -1,11 +1,82 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 from pathlib import Path
 
-from . import validate as cmd_validate
-from .cmd_preflight import add_subparser as add_preflight
-from .cmd_rulepack import add_subparser as add_rulepack
+# Subcommands: name -> (module whose add_subparser(sub) defines it, help for `fairy --help`).
+# A module is only imported once its command is chosen (see _LazySubParsersAction), so
+# `fairy --version` and `fairy --help` do not pay for pandas, pydantic or the GEO stack.
+# tests/cli/test_parser_lazy.py checks every command's help against eager registration.
+_COMMANDS = {
+    "validate": (
+        "fairy.cli.validate",
+        "Engine / CI mode. Run checks and write reports (PASS/WARN/FAIL).",
+    ),
+    "preflight": (
+        "fairy.cli.cmd_preflight",
+        "Operator mode. Profile-based workflows that write handoff-ready artifacts to --out-dir.",
+    ),
+    "rulepack": (
+        "fairy.cli.cmd_rulepack",
+        "Load a YAML rulepack and validate its shape (no execution).",
+    ),
+    "serve": (
+        "fairy.cli.serve",
+        "Resident service: answer validate/preflight requests as JSON over HTTP.",
+    ),
+}
+
+
+class _LazySubParsersAction(argparse._SubParsersAction):
+    """
+    Subparsers listed up front but defined by their module only when chosen.
+
+    argparse has no public hook for this, so it leans on _SubParsersAction
+    internals (_ChoicesPseudoAction, _choices_actions, _name_parser_map); where
+    those are missing the commands are registered eagerly instead (_LAZY).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy: dict[str, tuple[str, argparse.Action]] = {}
+
+    def add_lazy(self, name: str) -> None:
+        module, help = _COMMANDS[name]
+        choice = self._ChoicesPseudoAction(name, (), help)
+        self._choices_actions.append(choice)
+        self._name_parser_map[name] = None  # a valid choice, defined on first use
+        self._lazy[name] = (module, choice)
+
+    def _load(self, name: str) -> None:
+        module, choice = self._lazy.pop(name)
+        del self._name_parser_map[name]
+        self._choices_actions.remove(choice)
+        importlib.import_module(module).add_subparser(self)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        if values and values[0] in self._lazy:
+            self._load(values[0])
+        super().__call__(parser, namespace, values, option_string)
+
+
+def _lazy_supported() -> bool:
+    sub = argparse.ArgumentParser().add_subparsers()
+    return all(
+        hasattr(sub, attr)
+        for attr in ("_ChoicesPseudoAction", "_choices_actions", "_name_parser_map")
+    )
+
+
+_LAZY = _lazy_supported()
+
+
+def _add_commands(sub: argparse._SubParsersAction, names: tuple[str, ...]) -> None:
+    for name in names:
+        if _LAZY:
+            sub.add_lazy(name)
+        else:
+            importlib.import_module(_COMMANDS[name][0]).add_subparser(sub)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -13,12 +84,10 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument(
         "--version", action="store_true", help="Print engine + rulepack version and exit."
     )
-    sub = p.add_subparsers(dest="command", metavar="<command>")
+    sub = p.add_subparsers(dest="command", metavar="<command>", action=_LazySubParsersAction)
 
     # top-level commands
-    cmd_validate.add_subparser(sub)
-    add_preflight(sub)
-    add_rulepack(sub)
+    _add_commands(sub, ("validate", "preflight", "rulepack", "serve"))
 
     # --- Back-compat umbrella: `run ...`
     run = sub.add_parser(
@@ -32,9 +101,9 @@ def build_parser() -> argparse.ArgumentParser:
     run.add_argument("--param-file", type=Path)
 
     # Also allow explicit subcommand style: `run rulepack ...`
-    run_sub = run.add_subparsers(dest="run_command", metavar="<subcommand>")
-    cmd_validate.add_subparser(run_sub)
-    add_preflight(run_sub)
-    add_rulepack(run_sub)
+    run_sub = run.add_subparsers(
+        dest="run_command", metavar="<subcommand>", action=_LazySubParsersAction
+    )
+    _add_commands(run_sub, ("validate", "preflight", "rulepack"))
     # ---
     return p
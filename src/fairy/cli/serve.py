@@ -0,0 +1,402 @@
+# src/fairy/cli/serve.py
+"""
+fairy serve: a resident validation service for callers that cannot afford a
+process start per check (e.g. a web upload path validating small CSVs).
+
+The service speaks JSON over HTTP, on a Unix socket (--socket PATH) or on
+localhost (--host/--port):
+
+    POST /validate   {"rulepack": PATH, "inputs": {NAME: PATH} | "input": PATH, ...options}
+    POST /preflight  {"profile": "geo", "rulepack": PATH, "samples": PATH, "files": PATH}
+                     {"profile": "generic", "rulepack": PATH, "inputs": [A, B]}
+    GET  /health
+
+and answers {"exit_code": 0|1, "report": {...}}, where report is what the
+matching CLI command writes as its JSON report. Between requests it keeps
+fairy-core imported, each validate rulepack compiled (recompiled when the
+file's sha256 changes) and, with a result cache (--cache-dir), the opened
+foreign-key reference indexes. It listens on loopback only unless told
+otherwise (--allow-remote): it has no authentication, and requests name
+server paths and get cell values back. Requests run on a fixed pool of worker threads behind a
+bounded queue; when both are full a request is refused at once with 503 and
+Retry-After rather than left to wait.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.server
+import ipaddress
+import json
+import signal
+import socketserver
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from fairy.core.services.preflight_profiles import run_profile
+from fairy.validation.key_index import KeyIndex
+from fairy.validation.result_cache import ResultCache
+from fairy.validation.rulepack_runner import run_rulepack
+
+from .validate import PlanCache, _exit_code, _legacy_inputs, _run_options
+
+try:
+    from fairy import __version__ as FAIRY_VERSION
+except Exception:
+    FAIRY_VERSION = "0.1.0"
+
+DEFAULT_PORT = 8765
+# Requests carry paths and options, not data
+_MAX_BODY = 1 << 20
+
+# Per-request validate options: the CLI flags of the same name (minus cache,
+# jobs and outputs, which belong to the service or the caller)
+_VALIDATE_OPTIONS = {
+    "stream": False,
+    "chunksize": None,
+    "fail_fast": False,
+    "max_violations": None,
+    "sample": None,
+    "seed": None,
+    "max_evidence_rows": None,
+}
+
+
+class RequestError(ValueError):
+    """A request the service cannot run as given (answered with 400)."""
+
+
+class Busy(RuntimeError):
+    """Every worker and queue slot is taken (answered with 503)."""
+
+
+class _WarmCache(ResultCache):
+    """ResultCache that keeps recently opened key indexes in memory between requests."""
+
+    def __init__(self, root: Path | str, max_indexes: int = 64):
+        super().__init__(root)
+        self._indexes: OrderedDict[Path, KeyIndex] = OrderedDict()
+        self._max_indexes = max_indexes
+        self._lock = threading.Lock()
+
+    def open_key_index(self, path: Path) -> KeyIndex | None:
+        # Index paths are content-addressed, so a held index never goes stale
+        with self._lock:
+            index = self._indexes.get(path)
+            if index is not None:
+                self._indexes.move_to_end(path)
+                return index
+        index = super().open_key_index(path)
+        if index is not None:
+            with self._lock:
+                self._indexes[path] = index
+                while len(self._indexes) > self._max_indexes:
+                    self._indexes.popitem(last=False)
+        return index
+
+
+def _path(body: dict[str, Any], key: str) -> Path:
+    raw = body.get(key)
+    if not isinstance(raw, str) or not raw:
+        raise RequestError(f"{key} must be a path string")
+    p = Path(raw).expanduser()
+    if not p.exists():
+        raise RequestError(f"{key} not found: {p}")
+    return p
+
+
+class Service:
+    """
+    Runs validate and preflight requests on a pool of `workers` threads, with at
+    most `queue_size` more waiting; submit() raises Busy beyond that.
+    """
+
+    def __init__(self, *, workers: int = 2, queue_size: int = 8, cache: ResultCache | None = None):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.cache = cache
+        self.plans = PlanCache()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fairy-serve")
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, body: dict[str, Any]) -> dict[str, Any]:
+        """Run one request and return its {"exit_code", "report"} answer."""
+        handler = {"validate": self.validate, "preflight": self.preflight}[kind]
+        if not self._slots.acquire(blocking=False):
+            raise Busy(f"all {self.workers} workers and {self.queue_size} queue slots are busy")
+        with self._lock:
+            self._in_flight += 1
+        try:
+            return self._pool.submit(handler, body).result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def validate(self, body: dict[str, Any]) -> dict[str, Any]:
+        unknown = set(body) - {"rulepack", "inputs", "input", *_VALIDATE_OPTIONS}
+        if unknown:
+            raise RequestError(f"unknown option(s): {', '.join(sorted(unknown))}")
+        rp_path = _path(body, "rulepack")
+        if isinstance(body.get("inputs"), dict) and body["inputs"]:
+            inputs = {str(name): _path(body["inputs"], name) for name in body["inputs"]}
+        elif "input" in body:
+            try:
+                inputs = _legacy_inputs(_path(body, "input"))
+            except ValueError as e:
+                raise RequestError(str(e)) from None
+        else:
+            raise RequestError("validate needs inputs (an object of name: path) or input")
+        opts = {k: body.get(k, default) for k, default in _VALIDATE_OPTIONS.items()}
+        if opts["sample"] is not None:
+            opts["sample"] = str(opts["sample"])
+        args = argparse.Namespace(
+            **opts, jobs=1, cache=False, cache_dir=None, evidence_sidecar=None, timings=False
+        )
+        try:
+            options = _run_options(args)
+            plan = self.plans.get(rp_path)
+        except (TypeError, ValueError) as e:
+            raise RequestError(str(e)) from None
+        now = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+        cache = self.cache if options["sample"] is None else None
+        report = run_rulepack(inputs, plan, rp_path, now, cache=cache, **options)
+        return {"exit_code": _exit_code(report), "report": report}
+
+    def preflight(self, body: dict[str, Any]) -> dict[str, Any]:
+        profile = body.get("profile", "geo")
+        rp_path = _path(body, "rulepack")
+        if profile == "geo":
+            inputs = {"samples": _path(body, "samples"), "files": _path(body, "files")}
+        elif profile in ("spellbook", "generic"):
+            paths = body.get("inputs")
+            if not isinstance(paths, list) or len(paths) != 2:
+                raise RequestError(f"{profile} profile requires inputs: [A, B]")
+            pair = {"input_01": paths[0], "input_02": paths[1]}
+            inputs = {name: _path(pair, name) for name in pair}
+        else:
+            raise RequestError(f"unknown profile '{profile}'")
+        params = body.get("params") or {}
+        if not isinstance(params, dict):
+            raise RequestError("params must be an object")
+        report = run_profile(
+            profile,
+            rulepack=rp_path,
+            inputs=inputs,
+            fairy_version=body.get("fairy_version", FAIRY_VERSION),
+            params=params,
+        )
+        summary = report.get("summary") or {}
+        ready = summary.get("submission_ready", summary.get("by_level", {}).get("fail", 0) == 0)
+        return {"exit_code": 0 if ready else 1, "report": report}
+
+    def health(self) -> dict[str, Any]:
+        with self._lock:
+            in_flight = self._in_flight
+        return {
+            "status": "ok",
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "in_flight": in_flight,
+            "rulepacks": len(self.plans),
+        }
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    server_version = "fairy-serve"
+    service: Service  # set on the per-server subclass
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port)
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if getattr(self.server, "verbose", False):
+            super().log_message(format, *args)
+
+    def _reply(
+        self, status: int, payload: dict[str, Any], headers: dict[str, str] | None = None
+    ) -> None:
+        blob = json.dumps(payload, sort_keys=True).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(blob)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(blob)
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._reply(200, self.service.health())
+        else:
+            self._reply(404, {"error": f"no such endpoint: GET {self.path}"})
+
+    def do_POST(self) -> None:
+        kind = self.path.strip("/")
+        if kind not in ("validate", "preflight"):
+            self._reply(404, {"error": f"no such endpoint: POST {self.path}"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > _MAX_BODY:
+            self._reply(413, {"error": f"request body over {_MAX_BODY} bytes"})
+            return
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(body, dict):
+                raise RequestError("request body must be a JSON object")
+            self._reply(200, self.service.submit(kind, body))
+        except Busy as e:
+            self._reply(503, {"error": str(e)}, {"Retry-After": "1"})
+        except ValueError as e:  # RequestError, or a body that is not JSON
+            self._reply(400, {"exit_code": 2, "error": str(e)})
+        except Exception as e:
+            self._reply(500, {"exit_code": 2, "error": f"{type(e).__name__}: {e}"})
+
+
+class _TCPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+else:  # Windows: --socket is refused in main
+    _UnixServer = None  # type: ignore[assignment,misc]
+
+
+def make_server(
+    service: Service,
+    *,
+    socket_path: Path | None = None,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    verbose: bool = False,
+) -> socketserver.BaseServer:
+    """An HTTP server (not yet serving) for service, on socket_path or host:port."""
+    handler = type("Handler", (_Handler,), {"service": service})
+    if socket_path is not None:
+        if socket_path.exists() and socket_path.is_socket():
+            socket_path.unlink()  # left behind by a previous run
+        server: socketserver.BaseServer = _UnixServer(str(socket_path), handler)
+    else:
+        server = _TCPServer((host, port), handler)
+    server.verbose = verbose  # type: ignore[attr-defined]
+    return server
+
+
+def add_subparser(sub) -> None:
+    p = sub.add_parser(
+        "serve",
+        help="Resident service: answer validate/preflight requests as JSON over HTTP.",
+        description=(
+            "Keep rulepacks compiled and reference-key indexes open between requests, and "
+            "answer POST /validate and POST /preflight with the CLI's JSON report "
+            "(see docs/cli.md)."
+        ),
+    )
+    p.add_argument("--socket", type=Path, metavar="PATH", help="Listen on this Unix socket")
+    p.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Listen address (default: 127.0.0.1); only loopback without --allow-remote",
+    )
+    p.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help=f"Listen port (default: {DEFAULT_PORT})"
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        metavar="N",
+        help="Requests run at the same time (default: 2)",
+    )
+    p.add_argument(
+        "--queue",
+        type=int,
+        default=8,
+        metavar="N",
+        help="Requests that may wait for a worker; more are refused with 503 (default: 8)",
+    )
+    p.add_argument(
+        "--allow-remote",
+        action="store_true",
+        help="Allow a non-loopback --host. The service has no authentication and reads "
+        "any path a request names, so only use this on a trusted network",
+    )
+    p.add_argument(
+        "--cache-dir",
+        type=Path,
+        metavar="DIR",
+        help="Keep a result cache in DIR (off by default; it has no size limit, so "
+        "give it a directory that is cleaned up)",
+    )
+    p.add_argument("--verbose", action="store_true", help="Log every request to stderr")
+    p.set_defaults(func=main)
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False  # a host name: it may resolve to anything
+
+
+def _interrupt(signum: int, frame: Any) -> None:
+    raise KeyboardInterrupt
+
+
+def main(args: argparse.Namespace) -> int:
+    if args.workers < 1 or args.queue < 0:
+        print("ERROR: --workers must be at least 1 and --queue 0 or more", file=sys.stderr)
+        return 2
+    if args.socket and _UnixServer is None:
+        print(
+            "ERROR: --socket needs Unix sockets, which this platform lacks; use --port",
+            file=sys.stderr,
+        )
+        return 2
+    if not args.socket and not args.allow_remote and not _is_loopback(args.host):
+        print(
+            f"ERROR: --host {args.host} is not a loopback address; the service has no "
+            "authentication, pass --allow-remote to listen on it anyway",
+            file=sys.stderr,
+        )
+        return 2
+    cache = _WarmCache(args.cache_dir) if args.cache_dir else None
+    service = Service(workers=args.workers, queue_size=args.queue, cache=cache)
+    try:
+        server = make_server(
+            service, socket_path=args.socket, host=args.host, port=args.port, verbose=args.verbose
+        )
+    except OSError as e:
+        service.close()
+        print(f"ERROR: cannot listen: {e}", file=sys.stderr)
+        return 2
+    where = args.socket if args.socket else f"http://{args.host}:{server.server_address[1]}"
+    print(f"fairy serve: listening on {where}", file=sys.stderr)
+    signal.signal(signal.SIGTERM, _interrupt)  # stop as on Ctrl-C, removing the socket
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if args.socket:
+            args.socket.unlink(missing_ok=True)
+    return 0
@@ -2,18 +2,30 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import sys
+import threading
 from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 try:
     import yaml  # pip install pyyaml
 except Exception:
     yaml = None
 
-from fairy.validation.rulepack_runner import run_rulepack, write_markdown
+# pandas, numpy and the rule engine are imported where they are used, so
+# `fairy validate --help` and argument errors stay fast
+from fairy.validation.hooks import write_text
+from fairy.validation.result_cache import DEFAULT_CACHE_DIR, ResultCache
+from fairy.validation.timing import dumps_timed
+
+from .watch import add_watch_args
+
+if TYPE_CHECKING:
+    from fairy.validation.rulepack_runner import ExecutionPlan
 
 
 # Resolve paths that tests pass relative to the repo root (pytest runs from a tmp dir)
@@ -52,41 +64,289 @@ def _parse_inputs(pairs: list[str]) -> dict[str, Path]:
     return inputs
 
 
-def main(argv=None) -> int:
-    p = argparse.ArgumentParser("fairy validate")
-    # Legacy positional input retained (file OR folder)
-    p.add_argument("input", nargs="?", help="CSV file or folder containing CSVs (legacy)")
-    # New: repeatable named inputs
+def _add_execution_args(p: argparse.ArgumentParser) -> None:
     p.add_argument(
-        "--inputs",
-        action="append",
-        default=[],
-        metavar="name=path",
-        help="Repeatable name=path pairs for multi-input "
-        "(e.g., --inputs default=artworks.csv --inputs artists=artists.csv)",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Validate up to N inputs in parallel worker processes (default: 1)",
     )
-    p.add_argument("--rulepack", required=True, help="Path to YAML/JSON rulepack")
-    p.add_argument("--report-json", help="Write JSON report to this path")
-    p.add_argument("--report-md", help="Write Markdown report to this path")
-    args = p.parse_args(argv)
+    p.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read inputs in chunks instead of loading them whole "
+        "(for inputs larger than memory; default chunk: 100000 rows)",
+    )
+    p.add_argument(
+        "--chunksize",
+        type=int,
+        metavar="N",
+        help="Rows per chunk in streaming mode (implies --stream)",
+    )
+    p.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse rule results for unchanged inputs from {DEFAULT_CACHE_DIR}/ "
+        "next to the JSON report (or in the working directory)",
+    )
+    p.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        help="Result cache directory (implies --cache)",
+    )
+    p.add_argument(
+        "--timings",
+        action="store_true",
+        help="Add per-rule wall time, rows scanned and peak memory, plus a run-level "
+        "phase breakdown, to the JSON report (slower: traces allocations)",
+    )
+    p.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first FAIL-level rule; rules and inputs not reached are "
+        "reported as SKIPPED (streams the inputs)",
+    )
+    p.add_argument(
+        "--max-violations",
+        type=int,
+        metavar="N",
+        help="Stop scanning a rule once it has found N offending rows and report "
+        "its count as a lower bound (streams the inputs)",
+    )
+    p.add_argument(
+        "--sample",
+        metavar="N|FRACTION",
+        help="Preview: run row-local rules on N rows (or a FRACTION such as 0.01) of each "
+        "input, read at random offsets, and report estimated violation rates",
+    )
+    p.add_argument(
+        "--seed",
+        type=int,
+        metavar="S",
+        help="Random seed for --sample (default: random, recorded in the report)",
+    )
+
+
+def _add_evidence_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--max-evidence-rows",
+        type=int,
+        metavar="N",
+        help="List at most N offending rows per evidence list (exact totals and "
+        "row ranges are kept); also caps the Markdown report",
+    )
+    p.add_argument(
+        "--evidence-sidecar",
+        metavar="PATH",
+        help="Write the full row lists cut by --max-evidence-rows to this JSON Lines file",
+    )
+
+
+def _add_batch_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--batch",
+        metavar="JOBS.jsonl",
+        help="Run many validations in one process: one JSON job per line, each with its "
+        "own inputs and report paths (see docs/cli.md). Each distinct rulepack is compiled "
+        "once and --jobs runs N jobs at a time",
+    )
+    p.add_argument(
+        "--batch-summary",
+        metavar="PATH",
+        help="Where --batch writes its summary of every job's status "
+        "(default: <jobs file stem>.summary.json next to the jobs file)",
+    )
+
+
+def _result_cache(args: argparse.Namespace) -> ResultCache | None:
+    if args.cache_dir:
+        return ResultCache(Path(args.cache_dir))
+    if not args.cache:
+        return None
+    base = Path(args.report_json).parent if args.report_json else Path.cwd()
+    return ResultCache(base / DEFAULT_CACHE_DIR)
+
+
+def _load_rulepack(rp_path: Path, text: str | None = None) -> dict:
+    """Parse a YAML (.yml/.yaml) or JSON rulepack file (or its already-read text)."""
+    if text is None:
+        text = rp_path.read_text(encoding="utf-8")
+    if rp_path.suffix.lower() in (".yml", ".yaml"):
+        return yaml.safe_load(text)
+    return json.loads(text)
+
+
+def _legacy_inputs(inp: Path) -> dict[str, Path]:
+    """Inputs for the legacy positional INPUT: a CSV file, or every CSV in a folder."""
+    if inp.is_dir():
+        csvs = sorted([p for p in inp.glob("*.csv") if p.is_file()], key=lambda x: x.name)
+        if not csvs:
+            raise ValueError(f"no CSV files found in folder: {inp}")
+        # name tables by stem: artist.csv -> 'artists'
+        return OrderedDict((p.stem, p) for p in csvs)
+    if inp.is_file():
+        return {"default": inp}
+    raise ValueError(f"input not found: {inp}")
+
+
+class PlanCache:
+    """Compiled rulepacks by path, recompiled when the file's sha256 changes."""
+
+    def __init__(self) -> None:
+        self._plans: dict[Path, tuple[str, ExecutionPlan]] = {}
+        self._lock = threading.Lock()
+        self.compiles = 0
+
+    def get(self, path: Path) -> ExecutionPlan:
+        data = path.read_bytes()
+        sha = hashlib.sha256(data).hexdigest()
+        key = path.resolve()
+        with self._lock:
+            held = self._plans.get(key)
+        if held is not None and held[0] == sha:
+            return held[1]
+        from fairy.validation.rulepack_runner import compile_rulepack
+
+        plan = compile_rulepack(_load_rulepack(path, data.decode("utf-8")))
+        with self._lock:
+            self._plans[key] = (sha, plan)
+            self.compiles += 1
+        return plan
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+
+def _run_options(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    run_rulepack keyword arguments from the execution and evidence flags (all but
+    jobs and cache). Raises ValueError on a bad value or combination.
+    """
+    from fairy.validation.evidence import EvidencePolicy
+    from fairy.validation.sampling import SampleSpec
+    from fairy.validation.streaming import DEFAULT_CHUNKSIZE
+
+    chunksize = args.chunksize
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("--chunksize must be a positive number of rows")
+    if chunksize is None and args.stream:
+        chunksize = DEFAULT_CHUNKSIZE
+    if args.jobs < 1:
+        raise ValueError("--jobs must be at least 1")
+    if args.max_violations is not None and args.max_violations < 1:
+        raise ValueError("--max-violations must be at least 1")
+    sample = None
+    if args.sample is not None:
+        try:
+            sample = SampleSpec.parse(args.sample, seed=args.seed)
+        except ValueError as e:
+            raise ValueError(f"--sample: {e}") from None
+        if args.cache or args.cache_dir or args.fail_fast or args.max_violations is not None:
+            raise ValueError(
+                "--sample cannot be combined with --cache, --fail-fast or --max-violations"
+            )
+    elif args.seed is not None:
+        raise ValueError("--seed requires --sample")
+    max_rows = args.max_evidence_rows
+    if max_rows is not None and max_rows < 0:
+        raise ValueError("--max-evidence-rows must be 0 or more")
+    if args.evidence_sidecar and max_rows is None:
+        raise ValueError("--evidence-sidecar requires --max-evidence-rows")
+    evidence = None
+    if max_rows is not None:
+        sidecar = Path(args.evidence_sidecar) if args.evidence_sidecar else None
+        evidence = EvidencePolicy(max_rows=max_rows, sidecar=sidecar)
+    return {
+        "chunksize": chunksize,
+        "evidence": evidence,
+        "timings": args.timings,
+        "fail_fast": args.fail_fast,
+        "max_violations": args.max_violations,
+        "sample": sample,
+    }
+
+
+def _write_reports(
+    report: dict[str, Any],
+    report_json: Path | None,
+    report_md: Path | None,
+    max_rows: int | None = None,
+) -> None:
+    from fairy.validation.rulepack_runner import write_markdown
+
+    if report_json:
+        report_json.parent.mkdir(parents=True, exist_ok=True)
+        write_text(
+            report_json, dumps_timed(report, lambda r: json.dumps(r, indent=2, sort_keys=True))
+        )
+    if report_md:
+        report_md.parent.mkdir(parents=True, exist_ok=True)
+        write_text(report_md, write_markdown(report, max_rows=max_rows))
+
+
+def _exit_code(report: dict[str, Any]) -> int:
+    return 1 if report.get("summary", {}).get("fail", 0) > 0 else 0
+
+
+def main(argv=None) -> int:
+    if isinstance(argv, argparse.Namespace):
+        # Already parsed by the `fairy validate` subparser
+        args = argv
+    else:
+        p = argparse.ArgumentParser("fairy validate")
+        # Legacy positional input retained (file OR folder)
+        p.add_argument("input", nargs="?", help="CSV file or folder containing CSVs (legacy)")
+        # New: repeatable named inputs
+        p.add_argument(
+            "--inputs",
+            action="append",
+            default=[],
+            metavar="name=path",
+            help="Repeatable name=path pairs for multi-input "
+            "(e.g., --inputs default=artworks.csv --inputs artists=artists.csv)",
+        )
+        p.add_argument(
+            "--rulepack",
+            help="Path to YAML/JSON rulepack (with --batch: the default for jobs that name none)",
+        )
+        p.add_argument("--report-json", help="Write JSON report to this path")
+        p.add_argument("--report-md", help="Write Markdown report to this path")
+        _add_execution_args(p)
+        _add_evidence_args(p)
+        _add_batch_args(p)
+        add_watch_args(p)
+        args = p.parse_args(argv)
 
     if yaml is None:
         print("ERROR: PyYAML is required (pip install pyyaml)", file=sys.stderr)
         return 2
 
+    if args.batch:
+        if args.watch:
+            print("ERROR: --watch cannot be combined with --batch", file=sys.stderr)
+            return 2
+        from .validate_batch import run_batch
+
+        return run_batch(args)
+    if args.batch_summary:
+        print("ERROR: --batch-summary requires --batch", file=sys.stderr)
+        return 2
+    if not args.rulepack:
+        print("ERROR: --rulepack is required", file=sys.stderr)
+        return 2
+
     rp_path = _resolve_path_like(Path(args.rulepack))
     if not rp_path.exists():
         print(f"ERROR: rulepack not found: {rp_path}", file=sys.stderr)
         return 2
 
-    text = rp_path.read_text(encoding="utf-8")
-    rulepack = (
-        yaml.safe_load(text) if rp_path.suffix.lower() in (".yml", ".yaml") else json.loads(text)
-    )
+    rulepack = _load_rulepack(rp_path)
 
     # Build inputs mapping
     named_inputs = _parse_inputs(args.inputs)
     inputs_map: dict[str, Path]
+    legacy_input = None
 
     if named_inputs:
         # Multi-input mode (explicit)
@@ -96,36 +356,57 @@ def main(argv=None) -> int:
         if not args.input:
             print("ERROR: provide INPUT or at least one --inputs name=path", file=sys.stderr)
             return 2
-        inp = _resolve_path_like(Path(args.input))
-        if inp.is_dir():
-            csvs = sorted([p for p in inp.glob("*.csv") if p.is_file()], key=lambda x: x.name)
-            if not csvs:
-                print(f"ERROR: no CSV files found in folder: {inp}", file=sys.stderr)
-                return 2
-            # name tables by stem: artist.csv -> 'artists'
-            inputs_map = OrderedDict((p.stem, p) for p in csvs)
-        elif inp.is_file():
-            inputs_map = {"default": inp}
-        else:
-            print(f"ERROR: input not found: {inp}", file=sys.stderr)
+        legacy_input = _resolve_path_like(Path(args.input))
+        try:
+            inputs_map = _legacy_inputs(legacy_input)
+        except ValueError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
             return 2
 
-    now = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    try:
+        options = _run_options(args)
+        if args.watch and args.watch_interval <= 0:
+            raise ValueError("--watch-interval must be a positive number of seconds")
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
 
-    # NOTE: run_rulepack now expects a dict[str, Path] (name -> path)
-    report = run_rulepack(inputs_map, rulepack, rp_path, now)
+    if args.watch:
+        from .watch import watch_validate
 
-    if args.report_json:
-        out = Path(args.report_json)
-        out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+        if legacy_input is None:
+            return watch_validate(args, rp_path, inputs_map, options)
+        return watch_validate(
+            args,
+            rp_path,
+            inputs_map,
+            options,
+            resolve_inputs=lambda: _legacy_inputs(legacy_input),
+            folder=legacy_input if legacy_input.is_dir() else None,
+        )
 
-    if args.report_md:
-        outm = Path(args.report_md)
-        outm.parent.mkdir(parents=True, exist_ok=True)
-        outm.write_text(write_markdown(report), encoding="utf-8")
+    now = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
-    return 1 if report.get("summary", {}).get("fail", 0) > 0 else 0
+    from fairy.validation.rulepack_runner import run_rulepack
+
+    # NOTE: run_rulepack now expects a dict[str, Path] (name -> path)
+    report = run_rulepack(
+        inputs_map,
+        rulepack,
+        rp_path,
+        now,
+        jobs=args.jobs,
+        cache=_result_cache(args),
+        **options,
+    )
+
+    _write_reports(
+        report,
+        Path(args.report_json) if args.report_json else None,
+        Path(args.report_md) if args.report_md else None,
+        max_rows=args.max_evidence_rows,
+    )
+    return _exit_code(report)
 
 
 def add_subparser(subparsers: argparse._SubParsersAction) -> None:
@@ -147,10 +428,17 @@ def add_subparser(subparsers: argparse._SubParsersAction) -> None:
             "--inputs artists=artists.csv)"
         ),
     )
-    p.add_argument("--rulepack", required=True, help="Path to YAML/JSON rulepack")
+    p.add_argument(
+        "--rulepack",
+        help="Path to YAML/JSON rulepack (with --batch: the default for jobs that name none)",
+    )
     p.add_argument("--report-json", help="Write JSON report to this path")
     p.add_argument("--report-md", help="Write Markdown report to this path")
-    p.set_defaults(func=lambda _ns: main(None))
+    _add_execution_args(p)
+    _add_evidence_args(p)
+    _add_batch_args(p)
+    add_watch_args(p)
+    p.set_defaults(func=main)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,285 @@
+# src/fairy/cli/validate_batch.py
+"""
+fairy validate --batch JOBS.jsonl: many validations in one process.
+
+Each non-blank line of the jobs file is one JSON job:
+
+    {"id": "june", "inputs": {"artworks": "june/artworks.csv", "artists": "artists.csv"},
+     "report_json": "out/june.json", "report_md": "out/june.md"}
+
+- inputs: name -> path, as with --inputs; or "input": a CSV file or folder, as
+  with the legacy positional INPUT.
+- rulepack: optional; defaults to --rulepack.
+- id: optional; defaults to the line number.
+Relative paths are resolved against the jobs file's folder.
+
+Each distinct rulepack (by content) is parsed and compiled once, and --jobs N
+runs N jobs at a time in worker processes that receive the compiled plans when
+they start. A job that cannot run (missing input, unreadable rulepack) is
+recorded with exit code 2 and the batch carries on. The summary file lists
+every job's exit code and PASS/WARN/FAIL counts; the batch exits 2 if any job
+errored, else 1 if any failed, else 0.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from fairy.validation.hooks import write_text
+from fairy.validation.result_cache import DEFAULT_CACHE_DIR, ResultCache
+from fairy.validation.rulepack_runner import ExecutionPlan, compile_rulepack, run_rulepack
+
+from .validate import (
+    _exit_code,
+    _legacy_inputs,
+    _load_rulepack,
+    _resolve_path_like,
+    _run_options,
+    _write_reports,
+)
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    id: str
+    line: int
+    inputs: dict[str, Path] | None  # None: legacy `input` (file or folder)
+    input: Path | None
+    rulepack: Path
+    report_json: Path | None
+    report_md: Path | None
+
+
+def _path(base: Path, raw: Any, what: str) -> Path:
+    if not isinstance(raw, str) or not raw:
+        raise ValueError(f"{what} must be a non-empty path string")
+    p = Path(raw).expanduser()
+    return p if p.is_absolute() else base / p
+
+
+def load_jobs(path: Path, default_rulepack: Path | None = None) -> list[BatchJob]:
+    """Parse a jobs file. Raises ValueError (naming the line) on a malformed job."""
+    base = path.parent
+    jobs: list[BatchJob] = []
+    seen: set[str] = set()
+    for n, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            spec = json.loads(line)
+            if not isinstance(spec, dict):
+                raise ValueError("a job must be a JSON object")
+            job_id = str(spec.get("id", n))
+            if job_id in seen:
+                raise ValueError(f"duplicate job id: {job_id}")
+            seen.add(job_id)
+
+            inputs = inp = None
+            if "inputs" in spec:
+                if not isinstance(spec["inputs"], dict) or not spec["inputs"]:
+                    raise ValueError("inputs must be a non-empty object of name: path")
+                inputs = {
+                    str(name): _path(base, p, f"inputs.{name}")
+                    for name, p in spec["inputs"].items()
+                }
+            elif "input" in spec:
+                inp = _path(base, spec["input"], "input")
+            else:
+                raise ValueError("a job needs inputs or input")
+
+            rulepack = (
+                _path(base, spec["rulepack"], "rulepack")
+                if "rulepack" in spec
+                else default_rulepack
+            )
+            if rulepack is None:
+                raise ValueError("no rulepack (give one in the job or pass --rulepack)")
+            reports = {
+                key: _path(base, spec[key], key) if spec.get(key) is not None else None
+                for key in ("report_json", "report_md")
+            }
+        except ValueError as e:
+            raise ValueError(f"{path}:{n}: {e}") from None
+        jobs.append(BatchJob(job_id, n, inputs, inp, rulepack, **reports))
+    return jobs
+
+
+def _compile(
+    paths: list[Path],
+) -> tuple[dict[Path, str], dict[str, ExecutionPlan], dict[Path, str]]:
+    """
+    Compile each distinct rulepack once. Returns path -> sha256, sha256 -> plan,
+    and path -> error for the rulepacks that could not be loaded.
+    """
+    shas: dict[Path, str] = {}
+    plans: dict[str, ExecutionPlan] = {}
+    errors: dict[Path, str] = {}
+    for rp_path in paths:
+        try:
+            sha = hashlib.sha256(rp_path.read_bytes()).hexdigest()
+            if sha not in plans:
+                plans[sha] = compile_rulepack(_load_rulepack(rp_path))
+            shas[rp_path] = sha
+        except Exception as e:
+            errors[rp_path] = f"rulepack {rp_path}: {type(e).__name__}: {e}"
+    return shas, plans, errors
+
+
+# Compiled plans by rulepack sha256, handed to each worker once (see _init_worker)
+_PLANS: dict[str, ExecutionPlan] = {}
+
+
+def _init_worker(plans: dict[str, ExecutionPlan]) -> None:
+    _PLANS.update(plans)
+
+
+def _run_job(
+    job: BatchJob,
+    sha: str,
+    options: dict[str, Any],
+    cache: ResultCache | bool | None,
+    max_rows: int | None,
+) -> dict[str, Any]:
+    start = time.perf_counter()
+    entry: dict[str, Any] = {"id": job.id, "line": job.line}
+    try:
+        inputs = job.inputs if job.inputs is not None else _legacy_inputs(job.input)
+        missing = [str(p) for p in inputs.values() if not p.exists()]
+        if missing:
+            raise FileNotFoundError(f"input not found: {', '.join(missing)}")
+        if cache is True:
+            # --cache: next to the job's JSON report, as for a single run
+            base = job.report_json.parent if job.report_json else Path.cwd()
+            cache = ResultCache(base / DEFAULT_CACHE_DIR)
+        now = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+        report = run_rulepack(
+            inputs, _PLANS[sha], job.rulepack, now, cache=cache or None, **options
+        )
+        _write_reports(report, job.report_json, job.report_md, max_rows=max_rows)
+        entry["exit_code"] = _exit_code(report)
+        entry["summary"] = report["summary"]
+    except Exception as e:
+        entry["exit_code"] = 2
+        entry["error"] = f"{type(e).__name__}: {e}"
+    entry["seconds"] = round(time.perf_counter() - start, 6)
+    return entry
+
+
+def _default_summary_path(jobs_file: Path) -> Path:
+    return jobs_file.with_name(f"{jobs_file.stem}.summary.json")
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """Entry point for `fairy validate --batch`."""
+    if args.input or args.inputs or args.report_json or args.report_md:
+        print(
+            "ERROR: --batch takes inputs and report paths from the jobs file "
+            "(drop INPUT, --inputs, --report-json and --report-md)",
+            file=sys.stderr,
+        )
+        return 2
+    if args.evidence_sidecar:
+        print("ERROR: --evidence-sidecar cannot be combined with --batch", file=sys.stderr)
+        return 2
+    try:
+        options = _run_options(args)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    jobs_file = Path(args.batch)
+    if not jobs_file.is_file():
+        print(f"ERROR: jobs file not found: {jobs_file}", file=sys.stderr)
+        return 2
+    default_rp = _resolve_path_like(Path(args.rulepack)) if args.rulepack else None
+    try:
+        jobs = load_jobs(jobs_file, default_rp)
+    except (ValueError, UnicodeDecodeError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    rulepacks = list(dict.fromkeys(job.rulepack for job in jobs))
+    shas, plans, rp_errors = _compile(rulepacks)
+    cache: ResultCache | bool | None = (
+        ResultCache(Path(args.cache_dir)) if args.cache_dir else bool(args.cache)
+    )
+    max_rows = args.max_evidence_rows
+
+    entries: dict[int, dict[str, Any]] = {}
+    runnable = []
+    for i, job in enumerate(jobs):
+        if job.rulepack in rp_errors:
+            entries[i] = {
+                "id": job.id,
+                "line": job.line,
+                "exit_code": 2,
+                "error": rp_errors[job.rulepack],
+                "seconds": 0.0,
+            }
+        else:
+            runnable.append(i)
+    task_args = {i: (jobs[i], shas[jobs[i].rulepack], options, cache, max_rows) for i in runnable}
+    if args.jobs > 1 and len(runnable) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(args.jobs, len(runnable)),
+            initializer=_init_worker,
+            initargs=(plans,),
+        ) as pool:
+            futures = {i: pool.submit(_run_job, *a) for i, a in task_args.items()}
+            entries.update((i, f.result()) for i, f in futures.items())
+    else:
+        _init_worker(plans)
+        entries.update((i, _run_job(*a)) for i, a in task_args.items())
+
+    results = []
+    for i, job in enumerate(jobs):
+        entry = entries[i]
+        if "error" in entry:
+            print(f"ERROR: job {job.id} (line {job.line}): {entry['error']}", file=sys.stderr)
+        results.append(
+            {
+                **entry,
+                "rulepack": str(job.rulepack),
+                "report_json": str(job.report_json) if job.report_json else None,
+                "report_md": str(job.report_md) if job.report_md else None,
+            }
+        )
+    codes = [r["exit_code"] for r in results]
+    summary = {
+        "jobs_file": str(jobs_file),
+        "generated_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "seconds": round(time.perf_counter() - start, 6),
+        "totals": {
+            "jobs": len(results),
+            "pass": codes.count(0),
+            "fail": codes.count(1),
+            "error": codes.count(2),
+        },
+        "rulepacks": [
+            {
+                "path": str(rp),
+                "sha256": shas.get(rp),
+                "jobs": sum(job.rulepack == rp for job in jobs),
+                **({"error": rp_errors[rp]} if rp in rp_errors else {}),
+            }
+            for rp in rulepacks
+        ],
+        "jobs": results,
+    }
+    out = Path(args.batch_summary) if args.batch_summary else _default_summary_path(jobs_file)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    write_text(out, json.dumps(summary, indent=2, sort_keys=True))
+
+    if 2 in codes:
+        return 2
+    return 1 if 1 in codes else 0
@@ -0,0 +1,200 @@
+# src/fairy/cli/watch.py
+"""
+--watch for fairy validate and fairy preflight: keep the process alive, poll
+the inputs and the rulepack, and re-run whenever one of them is saved.
+
+Polling (mtime and size, every --watch-interval seconds) needs no extra
+dependency and sees saves made through a temp file and rename, as spreadsheet
+programs do. A change is acted on once it has held still for one poll, so a
+save written in several steps runs once. Between runs the process keeps
+fairy-core imported; validate also keeps the compiled rulepack (recompiled
+only when its sha256 changes) and a result cache, so only the rules reading
+an edited input run again. Reports are replaced atomically.
+"""
+
+from __future__ import annotations
+
+import argparse
+import signal
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+DEFAULT_INTERVAL = 0.5
+
+Stamp = tuple[int, int] | None
+
+
+def add_watch_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running: re-run whenever an input or the rulepack is saved (Ctrl-C stops)",
+    )
+    p.add_argument(
+        "--watch-interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        metavar="SECONDS",
+        help=f"How often --watch checks for changes (default: {DEFAULT_INTERVAL})",
+    )
+
+
+def _stamp(path: Path) -> Stamp:
+    """(mtime_ns, size) of path, or None while it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class FileWatcher:
+    """Polls a set of paths and reports which of them changed."""
+
+    def __init__(self, paths: Iterable[Path] = (), interval: float = DEFAULT_INTERVAL):
+        self.interval = interval
+        self._stamps: dict[Path, Stamp] = {}
+        self.reset(paths)
+
+    def reset(self, paths: Iterable[Path], stamps: dict[Path, Stamp] | None = None) -> None:
+        """
+        Watch paths from now on. stamps (e.g. taken before a run) are kept as
+        the baseline for the paths they cover, so a save made during the run is
+        still seen; other paths are stamped now.
+        """
+        stamps = stamps or {}
+        self._stamps = {p: stamps[p] if p in stamps else _stamp(p) for p in paths}
+
+    def stamps(self) -> dict[Path, Stamp]:
+        return dict(self._stamps)
+
+    def poll(self) -> dict[Path, Stamp]:
+        return {p: _stamp(p) for p in self._stamps}
+
+    def wait(self, stop: threading.Event | None = None) -> list[Path] | None:
+        """
+        Block until a change has held still for one poll and return the changed
+        paths (the new stamps become the baseline); None once stop is set.
+        """
+        pending = None
+        while True:
+            if stop is None:
+                time.sleep(self.interval)
+            elif stop.wait(self.interval):
+                return None
+            current = self.poll()
+            if current == self._stamps:
+                pending = None
+            elif current == pending:
+                changed = [p for p in current if current[p] != self._stamps[p]]
+                self._stamps = current
+                return changed
+            else:
+                pending = current
+
+
+def _interrupt(signum: int, frame: Any) -> None:
+    raise KeyboardInterrupt
+
+
+def watch(
+    run: Callable[[], tuple[int, list[Path]]],
+    paths: Iterable[Path],
+    *,
+    interval: float = DEFAULT_INTERVAL,
+    stop: threading.Event | None = None,
+) -> int:
+    """
+    Call run() now and again after every change to the watched paths: paths at
+    first, then the ones each run returns with its exit code. A save made while
+    a run is going triggers another. Returns the last exit code once interrupted
+    (Ctrl-C) or once stop is set.
+    """
+    watcher = FileWatcher(paths, interval)
+    code = 2
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, _interrupt)  # stop as on Ctrl-C, cleaning up
+    try:
+        while True:
+            before = watcher.stamps()
+            code, paths = run()
+            watcher.reset(paths, before)
+            print(f"watching {len(paths)} file(s) for changes (Ctrl-C to stop)", file=sys.stderr)
+            changed = watcher.wait(stop)
+            if changed is None:
+                return code
+            print(f"changed: {', '.join(str(p) for p in changed)}", file=sys.stderr)
+    except KeyboardInterrupt:
+        return code
+
+
+def watch_validate(
+    args: argparse.Namespace,
+    rp_path: Path,
+    inputs: dict[str, Path],
+    options: dict[str, Any],
+    *,
+    resolve_inputs: Callable[[], dict[str, Path]] | None = None,
+    folder: Path | None = None,
+) -> int:
+    """
+    fairy validate --watch, first on inputs. With resolve_inputs, later runs
+    list their inputs afresh (a legacy input folder, also watched, may gain or
+    lose CSVs). An error in any run is reported and the watch waits for the
+    next change.
+    """
+    from fairy.validation.result_cache import ResultCache
+    from fairy.validation.rulepack_runner import run_rulepack
+
+    from .validate import PlanCache, _exit_code, _result_cache, _write_reports
+
+    plans = PlanCache()
+    cache = _result_cache(args)
+    scratch = None
+    if cache is None and options["sample"] is None:
+        # Results only need to outlive the process's own runs
+        scratch = tempfile.TemporaryDirectory(prefix="fairy-watch-")
+        cache = ResultCache(scratch.name)
+    report_json = Path(args.report_json) if args.report_json else None
+    report_md = Path(args.report_md) if args.report_md else None
+    resolve = resolve_inputs or (lambda: inputs)
+    first = [inputs]
+
+    def watched(inputs: dict[str, Path]) -> list[Path]:
+        paths = [rp_path] + ([folder] if folder else [])
+        return paths + [p for p in inputs.values() if p not in paths]
+
+    def run() -> tuple[int, list[Path]]:
+        current: dict[str, Path] = {}
+        try:
+            current = first.pop() if first else resolve()
+            plan = plans.get(rp_path)
+            t0 = time.perf_counter()
+            now = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+            report = run_rulepack(
+                current, plan, rp_path, now, jobs=args.jobs, cache=cache, **options
+            )
+            _write_reports(report, report_json, report_md, max_rows=args.max_evidence_rows)
+        except Exception as e:  # keep watching: the next save may fix it
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 2, watched(current)
+        code = _exit_code(report)
+        summary = report.get("summary", {})
+        print(
+            f"{'FAIL' if code else 'PASS'}: {summary.get('fail', 0)} fail, "
+            f"{summary.get('warn', 0)} warn in {time.perf_counter() - t0:.2f}s",
+            file=sys.stderr,
+        )
+        return code, watched(current)
+
+    try:
+        return watch(run, watched(inputs), interval=args.watch_interval)
+    finally:
+        if scratch is not None:
+            scratch.cleanup()
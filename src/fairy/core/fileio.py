@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+"""
+Atomic file writes for reports and other artifacts that others may be reading.
+
+The text is written to a temporary file beside the target and renamed over
+it, so a reader (a CI step, a web server, `--watch`) sees either the old file
+or the new one, never half of it. The file gets the permissions a plain
+`Path.write_text` would give it: the existing file's mode, or 0666 minus the
+umask for a new file. The temporary file is created with mode 0666 and the
+kernel applies the umask, so the process umask is never read or changed.
+"""
+
+from __future__ import annotations
+
+import os
+import secrets
+import stat
+from pathlib import Path
+
+_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _create_temp(path: Path) -> tuple[int, Path]:
+    """An open, new, exclusively created temporary file beside path."""
+    while True:
+        tmp = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp, _FLAGS, 0o666), tmp
+        except FileExistsError:
+            continue
+
+
+def write_text_atomic(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """Replace path with text, atomically."""
+    path = Path(path)
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except OSError:
+        mode = None  # a new file: keep the umask-derived mode of the temporary file
+    fd, tmp = _create_temp(path)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            f.write(text)
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
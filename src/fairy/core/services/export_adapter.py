@@ -15,7 +15,7 @@ from typing import Any
 from ...cli.output_md import emit_preflight_markdown
 from ...cli.run import FAIRY_VERSION
 from ..services.manifest import build_manifest_v1
-from ..services.provenance import sha256_file
+from ..services.provenance import sha256_files
 from ..services.validator import run_rulepack
 
 
@@ -90,27 +90,20 @@ def _shim_build_bundle(
     """
 
     manifest_path = export_dir / "manifest.json"
-    files_list: list[dict[str, object]] = []
 
-    def _add(rel_name: str, abs_path: Path) -> None:
-        files_list.append(
-            {
-                "path": rel_name,
-                "sha256": sha256_file(abs_path, newline_stable=True),
-                "bytes": abs_path.stat().st_size,
-                # role inferred
-            }
-        )
-
-    # Canonical artifacts in the bundle
-    if samples.exists():
-        _add(samples.name, samples)
-    if files.exists():
-        _add(files.name, files)
-    if report_json.exists():
-        _add(report_json.name, report_json)
-    if report_md.exists():
-        _add(report_md.name, report_md)
+    # Canonical artifacts in the bundle; each file is hashed once, all in parallel
+    artifacts = [p for p in (samples, files, report_json, report_md) if p.exists()]
+    to_hash = list(dict.fromkeys([*artifacts, samples, files]))
+    digests = dict(zip(to_hash, sha256_files(to_hash, newline_stable=True).digests, strict=True))
+    files_list: list[dict[str, object]] = [
+        {
+            "path": p.name,
+            "sha256": digests[p],
+            "bytes": p.stat().st_size,
+            # role inferred
+        }
+        for p in artifacts
+    ]
 
     # Rulepack info from report V1
     rulepack_meta = (report.get("metadata") or {}).get("rulepack") or {}
@@ -152,13 +145,13 @@ def _shim_build_bundle(
             {
                 "name": "samples",
                 "path": samples.name,
-                "sha256": sha256_file(samples, newline_stable=True),
+                "sha256": digests[samples],
                 "bytes": samples.stat().st_size,
             },
             {
                 "name": "files",
                 "path": files.name,
-                "sha256": sha256_file(files, newline_stable=True),
+                "sha256": digests[files],
                 "bytes": files.stat().st_size,
             },
         ],
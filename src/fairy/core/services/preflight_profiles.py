@@ -5,8 +5,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from fairy.core.services import validator
-
 # --- Profile interface -------------------------------------------------------
 
 RunnerFn = Callable[..., dict[str, Any]]
@@ -60,7 +58,11 @@ def _run_geo(
     inputs: dict[str, Any],
     fairy_version: str,
     params: dict[str, Any],
+    timings: bool = False,
 ) -> dict[str, Any]:
+    # Imported here so listing profiles (e.g. for CLI help) stays light
+    from fairy.core.services import validator
+
     # geo expects samples + files
     samples = inputs.get("samples")
     files = inputs.get("files")
@@ -73,6 +75,7 @@ def _run_geo(
         files_path=files,
         fairy_version=fairy_version,
         params=params or {},
+        timings=timings,
     )
 
 
@@ -82,6 +85,7 @@ def _run_generic(
     inputs: dict[str, Path],
     fairy_version: str,
     params: dict[str, Any] | None,
+    timings: bool = False,
 ) -> dict[str, Any]:
     """
     Spellbook/generic = 2-input preflight.
@@ -90,6 +94,8 @@ def _run_generic(
     Returns preflight report v1 (same shape as geo), so CLI can write
     manifest/report/md consistently.
     """
+    from fairy.core.services import validator
+
     a = inputs.get("input_01")
     b = inputs.get("input_02")
     if not a or not b:
@@ -101,6 +107,7 @@ def _run_generic(
         files_path=b,
         fairy_version=fairy_version,
         params=params,
+        timings=timings,
     )
 
 
@@ -151,12 +158,16 @@ def run_profile(
     inputs: dict[str, Any],
     fairy_version: str,
     params: dict[str, Any] | None = None,
+    timings: bool = False,
 ) -> dict[str, Any]:
     reg = get_registry()
     profile = reg.get(profile_id)
+    # Only pass timings when asked for, so runners without the option keep working
+    extra: dict[str, Any] = {"timings": True} if timings else {}
     return profile.runner(
         rulepack=rulepack,
         inputs=inputs,
         fairy_version=fairy_version,
         params=params or {},
+        **extra,
     )
@@ -11,7 +11,14 @@ tabular file metadata (path, sha256, dimensions, headers).
 from __future__ import annotations
 
 import json
-from collections.abc import Mapping
+import mmap
+import os
+import stat
+import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from hashlib import sha256
 from pathlib import Path
 from typing import Any, TypedDict
@@ -36,41 +43,109 @@ def compute_params_sha256(params: dict | None) -> str:
     return sha256(canon.encode("utf-8")).hexdigest()
 
 
+_BLOCK_BYTES = 1 << 16
+
+
+def _update_newline_stable(h: Any, mm: mmap.mmap, data: memoryview) -> None:
+    """Feed mm to h with CRLF / lone CR normalized to LF, copying only blocks with a CR."""
+    size = len(data)
+    pos = 0
+    while pos < size:
+        end = min(pos + _BLOCK_BYTES, size)
+        # Never split a CRLF pair across blocks
+        if end < size and data[end - 1] == 0x0D and data[end] == 0x0A:
+            end += 1
+        if mm.find(b"\r", pos, end) < 0:
+            h.update(data[pos:end])
+        else:
+            block = mm[pos:end].replace(b"\r\n", b"\n")
+            if b"\r" in block:
+                block = block.replace(b"\r", b"\n")
+            h.update(block)
+        pos = end
+
+
+def _update_buffered(h: Any, f: Any, newline_stable: bool) -> None:
+    """Feed the open binary file f to h block by block, with newline_stable as above."""
+    pending_cr = False
+    for chunk in iter(lambda: f.read(_BLOCK_BYTES), b""):
+        if not newline_stable:
+            h.update(chunk)
+            continue
+        if pending_cr:
+            chunk = b"\r" + chunk
+            pending_cr = False
+        if chunk.endswith(b"\r"):
+            chunk = chunk[:-1]
+            pending_cr = True
+        h.update(chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n"))
+    if pending_cr:
+        h.update(b"\n")
+
+
 def sha256_file(p: Path, *, newline_stable: bool = False) -> str:
     """
     Return sha256 hex digest of file at path p.
-    If newline_stable=True, normalize CRLF/CR to LF before hashing..
+    If newline_stable=True, normalize CRLF/CR to LF before hashing.
+
+    A regular file is memory-mapped and hashed without copying; with
+    newline_stable, only blocks that contain a CR are copied to be normalized.
+    Anything else (a pipe, /dev/stdin, process substitution) or a file that
+    cannot be mapped is read in blocks instead.
     """
     h = sha256()
+    with Path(p).open("rb") as f:
+        st = os.fstat(f.fileno())
+        mm = None
+        if stat.S_ISREG(st.st_mode) and st.st_size:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):  # e.g. a filesystem without mmap support
+                mm = None
+        if mm is None:
+            _update_buffered(h, f, newline_stable)
+            return h.hexdigest()
+        with mm, memoryview(mm) as data:
+            if newline_stable:
+                _update_newline_stable(h, mm, data)
+            else:
+                h.update(data)
+    return h.hexdigest()
 
-    if not newline_stable:
-        with p.open("rb") as f:
-            for chunk in iter(lambda: f.read(65536), b""):
-                h.update(chunk)
-        return h.hexdigest()
 
-    pending_cr = False
-    with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            if pending_cr:
-                chunk = b"\r" + chunk
-                pending_cr = False
-
-            if chunk.endswith(b"\r"):
-                chunk = chunk[:-1]
-                pending_cr = True
-
-            chunk = chunk.replace(b"\r\n", b"\n")
-            chunk = chunk.replace(b"\r", b"\n")
-            h.update(chunk)
+@dataclass(frozen=True)
+class FileHashes:
+    """Digests of several files (in the order given) and how fast they were computed."""
 
-    if pending_cr:
-        h.update(b"\n")
+    digests: list[str]
+    bytes: int
+    seconds: float
 
-    return h.hexdigest()
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes / 1e6 / self.seconds if self.seconds > 0 else 0.0
 
 
-def summarize_tabular(p: Path) -> dict[str, Any]:
+def sha256_files(
+    paths: Sequence[Path], *, newline_stable: bool = False, max_workers: int | None = None
+) -> FileHashes:
+    """
+    sha256_file for each path, in parallel threads (hashlib releases the GIL
+    while hashing, so files are hashed concurrently).
+    """
+    paths = [Path(p) for p in paths]
+    start = time.perf_counter()
+    if len(paths) > 1 and max_workers != 1:
+        workers = min(len(paths), max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            digests = list(pool.map(partial(sha256_file, newline_stable=newline_stable), paths))
+    else:
+        digests = [sha256_file(p, newline_stable=newline_stable) for p in paths]
+    seconds = time.perf_counter() - start
+    return FileHashes(digests, sum(p.stat().st_size for p in paths), seconds)
+
+
+def summarize_tabular(p: Path, *, file_sha256: str | None = None) -> dict[str, Any]:
     """
     Collect provenance for a TSV/CSV-like metadata file:
     -path (as string)
@@ -81,9 +156,10 @@ def summarize_tabular(p: Path) -> dict[str, Any]:
 
     Will *try* to use Frictionless if available for more robust parsing.
     If that fails or isn't installed, we fall back to simple TSV splitter.
+    file_sha256 skips hashing when the (newline-stable) digest is already known.
     """
     path_str = str(p)
-    file_hash = sha256_file(p, newline_stable=True)
+    file_hash = file_sha256 or sha256_file(p, newline_stable=True)
 
     header: list[str] = []
     n_cols = 0
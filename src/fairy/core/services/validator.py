@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import os
+import time
 import warnings
 from dataclasses import asdict
 from pathlib import Path
@@ -27,6 +28,9 @@ import pandas as pd
 
 from fairy import __version__ as FAIRY_CORE_VERSION
 from fairy.rulepack.loader import load_rulepack
+from fairy.validation import hooks, timing
+from fairy.validation.hooks import HOOKS
+from fairy.validation.timing import RuleTiming, Stopwatch
 
 # pull shared types/utilities
 from ..models.preflight_report_v1 import (
@@ -41,6 +45,7 @@ from .provenance import (
     compute_dataset_id,
     compute_params_sha256,
     sha256_file,
+    sha256_files,
     summarize_tabular,
 )
 from .transform import transform_findings_to_results
@@ -60,6 +65,17 @@ def validate_csv(path: str, kind: str = "rna"):
     return _core_validate_csv(path, kind=kind)
 
 
+# Tables each check type reads (rows scanned in its timing, input in hook events)
+_CHECK_TABLES: dict[str, tuple[str, ...]] = {
+    "require_columns": ("samples",),
+    "at_least_one_nonempty_per_row": ("samples",),
+    "id_crosscheck": ("samples", "files"),
+    "paired_end_complete": ("files",),
+    "dates_are_iso8601": ("samples",),
+    "processed_data_present": ("files",),
+}
+
+
 def _map_severity(internal: str) -> str:
     # "error" -> "FAIL", "warning" -> "WARN"
     return "FAIL" if internal.lower() == "error" else "WARN"
@@ -82,13 +98,42 @@ def run_rulepack(
     files_path: Path,
     fairy_version: str,
     params: dict,
+    *,
+    timings: bool = False,
+) -> dict:
+    """
+    With timings, each results[] entry gets a `timing` block (seconds, rows,
+    peak_bytes) and the report a run-level one (seconds per phase); see
+    fairy.validation.timing.
+    """
+    if not timings:
+        return _run_rulepack(rulepack_path, samples_path, files_path, fairy_version, params)
+
+    with Stopwatch() as watch:
+        report = _run_rulepack(rulepack_path, samples_path, files_path, fairy_version, params)
+    for result in report["results"]:
+        result["timing"] = (watch.get(None, result["rule"]) or RuleTiming()).as_dict()
+    # Whatever is not load / hash / rules went into building the report
+    phases = watch.phases
+    phases["report"] = max(phases["total"] - phases["load"] - phases["hash"] - phases["rules"], 0)
+    report["timing"] = watch.run_block()
+    return report
+
+
+def _run_rulepack(
+    rulepack_path: str | Path,
+    samples_path: Path,
+    files_path: Path,
+    fairy_version: str,
+    params: dict,
 ) -> dict:
 
     # ---NEW: context injected for rule functions
     ctx: dict[str, Any] = {"params": params or {}}
 
     # 1. load rulepack (YAML/JSON) -> Pydantic model
-    rp = load_rulepack(rulepack_path)
+    with timing.phase("load"):
+        rp = load_rulepack(rulepack_path)
     # convert to plain dict for existing logic (pack["rules"], pack.get)
     pack = rp.model_dump()
 
@@ -99,11 +144,19 @@ def run_rulepack(
     rp_id = meta.get("id") or pack.get("rulepack_id") or rp_name
     rp_version = meta.get("version") or pack.get("rulepack_version") or "0.0.0"
     rp_source_path = str(rulepack_path)
-    rp_sha256 = sha256_file(rulepack_path)
+    with timing.phase("hash"):
+        rp_sha256 = sha256_file(rulepack_path)
 
     # 2. load dataframes
-    samples_df = pd.read_csv(samples_path, sep="\t", dtype=str).fillna("")
-    files_df = pd.read_csv(files_path, sep="\t", dtype=str).fillna("")
+    tables: dict[str, pd.DataFrame] = {}
+    with timing.phase("load"):
+        for name, path in (("samples", samples_path), ("files", files_path)):
+            t0 = time.perf_counter()
+            tables[name] = pd.read_csv(path, sep="\t", dtype=str).fillna("")
+            HOOKS.emit(
+                "on_load", input=name, rows=len(tables[name]), seconds=time.perf_counter() - t0
+            )
+    samples_df, files_df = tables["samples"], tables["files"]
 
     all_findings: list[dict] = []
     all_rules: list[dict] = []  # Track all rules for transformation
@@ -113,58 +166,62 @@ def run_rulepack(
         spec = rule["check"]
         ctype = spec["type"]
 
-        # dispatch to the right helper in rna.py
-        if ctype == "require_columns":
-            required_cols = spec.get("required_columns", [])
-            warning_items = rna.check_required_columns(samples_df, required_cols, ctx=ctx)
-
-        elif ctype == "at_least_one_nonempty_per_row":
-            # spec["column_groups"] is like [["tissue","cell_line","cell_type"]]
-            column_groups = spec.get("column_groups", [])
-            group0 = column_groups[0] if column_groups else []
-            warning_items = rna.check_bio_context(samples_df, group0, ctx=ctx)
-
-        elif ctype == "id_crosscheck":
-            # left_key is the sample ID key in samples.tsv
-            left_key = spec.get("left_key", "sample_id")
-            warning_items = rna.check_id_crossmatch(
-                samples_df,
-                files_df,
-                samples_key=left_key,
-                ctx=ctx,
-            )
-
-        elif ctype == "paired_end_complete":
-            # be defensive and default sanely
-            warning_items = rna.check_paired_end_complete(
-                files_df,
-                samples_key=spec.get("samples_key", "sample_id"),
-                layout_col=spec.get("layout_column", "layout"),
-                paired_value=spec.get("layout_value_for_paired", "PAIRED"),
-                file_col=spec.get("file_column", "filename"),
-                r1_pattern=spec.get("r1_pattern", r"_R1"),
-                r2_pattern=spec.get("r2_pattern", r"_R2"),
-                ctx=ctx,
-            )
-
-        elif ctype == "dates_are_iso8601":
-            date_cols = spec.get("columns", [])
-            warning_items = rna.check_dates_iso8601(samples_df, date_cols)
-
-        elif ctype == "processed_data_present":
-            warning_items = rna.check_processed_data_present(
-                files_df,
-                samples_key=spec.get("samples_key", "sample_id"),
-                raw_file_glob=spec.get("raw_file_glob", ".fastq"),
-                processed_globs=spec.get(
-                    "processed_glob_candidates",
-                    [".counts", ".quant", ".gene_counts"],
-                ),
-                ctx=ctx,
-            )
-
-        else:
-            warning_items = []
+        code = rule["code"]
+        reads = _CHECK_TABLES.get(ctype, ())
+        rows = sum(len(tables[t]) for t in reads)
+        with timing.measure(code, rows), hooks.rule_span(code, rows, ",".join(reads) or None):
+            # dispatch to the right helper in rna.py
+            if ctype == "require_columns":
+                required_cols = spec.get("required_columns", [])
+                warning_items = rna.check_required_columns(samples_df, required_cols, ctx=ctx)
+
+            elif ctype == "at_least_one_nonempty_per_row":
+                # spec["column_groups"] is like [["tissue","cell_line","cell_type"]]
+                column_groups = spec.get("column_groups", [])
+                group0 = column_groups[0] if column_groups else []
+                warning_items = rna.check_bio_context(samples_df, group0, ctx=ctx)
+
+            elif ctype == "id_crosscheck":
+                # left_key is the sample ID key in samples.tsv
+                left_key = spec.get("left_key", "sample_id")
+                warning_items = rna.check_id_crossmatch(
+                    samples_df,
+                    files_df,
+                    samples_key=left_key,
+                    ctx=ctx,
+                )
+
+            elif ctype == "paired_end_complete":
+                # be defensive and default sanely
+                warning_items = rna.check_paired_end_complete(
+                    files_df,
+                    samples_key=spec.get("samples_key", "sample_id"),
+                    layout_col=spec.get("layout_column", "layout"),
+                    paired_value=spec.get("layout_value_for_paired", "PAIRED"),
+                    file_col=spec.get("file_column", "filename"),
+                    r1_pattern=spec.get("r1_pattern", r"_R1"),
+                    r2_pattern=spec.get("r2_pattern", r"_R2"),
+                    ctx=ctx,
+                )
+
+            elif ctype == "dates_are_iso8601":
+                date_cols = spec.get("columns", [])
+                warning_items = rna.check_dates_iso8601(samples_df, date_cols)
+
+            elif ctype == "processed_data_present":
+                warning_items = rna.check_processed_data_present(
+                    files_df,
+                    samples_key=spec.get("samples_key", "sample_id"),
+                    raw_file_glob=spec.get("raw_file_glob", ".fastq"),
+                    processed_globs=spec.get(
+                        "processed_glob_candidates",
+                        [".counts", ".quant", ".gene_counts"],
+                    ),
+                    ctx=ctx,
+                )
+
+            else:
+                warning_items = []
 
         # convert WarningItem -> final FAIRy "finding"
         for w in warning_items:
@@ -220,9 +277,12 @@ def run_rulepack(
         "files": files_path,
     }
 
-    # Build InputMetadata for each input
-    for input_name, input_path in sorted(input_paths.items()):  # Sort for deterministic ordering
-        meta_dict = summarize_tabular(Path(input_path))
+    # Build InputMetadata for each input (hashed in parallel up front)
+    names = sorted(input_paths)  # Sort for deterministic ordering
+    with timing.phase("hash"):
+        hashed = sha256_files([Path(input_paths[n]) for n in names], newline_stable=True)
+    for input_name, digest in zip(names, hashed.digests, strict=True):
+        meta_dict = summarize_tabular(Path(input_paths[input_name]), file_sha256=digest)
         inputs_metadata[input_name] = InputMetadata(
             path=meta_dict["path"],
             sha256=meta_dict["sha256"],
@@ -340,7 +400,7 @@ def run_rulepack(
         "The '_legacy' field in preflight reports is deprecated and will be removed in v1.2.0. "
         "Please migrate to the v1.0.0 structure (metadata, summary, results).",
         DeprecationWarning,
-        stacklevel=2,
+        stacklevel=3,
     )
 
     return report
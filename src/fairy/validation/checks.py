@@ -11,6 +11,7 @@ from urllib.parse import urlsplit
 
 import pandas as pd
 
+from .distinct import eval_distinct, map_distinct
 from .types import (
     Issue,
     Level,
@@ -168,16 +169,9 @@ def rr_row_unique(
     total_count = int(dup_mask.sum())
 
     # Sample policy: for each duplicate value, take the LAST TWO indices
-    groups: dict[Any, list[int]] = {}
-    for idx, val in s.items():
-        groups.setdefault(val, []).append(int(idx))
-
-    sample_idxs: list[int] = []
-    for _val, idxs in groups.items():
-        if len(idxs) >= 2:
-            sample_idxs.extend(idxs[-2:])  # last two of the run
-
-    sample_idxs = sorted(sample_idxs)[:10]
+    dups = s[dup_mask]
+    last_two = dups.groupby(dups, sort=False, dropna=False).tail(2)
+    sample_idxs = sorted(int(i) for i in last_two.index)[:10]
     sams = [Sample(row=i + 1, value=df.loc[i, column]) for i in sample_idxs]
 
     return _result(
@@ -305,7 +299,7 @@ def rr_column_url(
 
     allow = set(schemes or [])
     s = df[column]
-    bad = ~s.apply(lambda v: _url_ok(v, allow))
+    bad = pd.Series(~map_distinct(s, lambda v: _url_ok(v, allow)), index=s.index)
     if not bad.any():
         return None
 
@@ -326,8 +320,10 @@ def rr_column_non_empty_trimmed(
     if column not in df.columns:
         return rr_schema_required(df, required=[column], level=level)
 
-    s = df[column].astype("string")
-    bad = s.isna() | (s.str.strip().str.len() == 0)
+    s = df[column]
+    bad = pd.Series(
+        map_distinct(s, lambda v: bool(pd.isna(v)) or str(v).strip() == ""), index=s.index
+    )
     if not bad.any():
         return None
     vals = df[column][bad].sort_index(kind="mergesort")
@@ -354,7 +350,10 @@ def rr_column_enum(
 
     if case_insensitive:
         allowed_set = {str(a).lower() for a in allowed}
-        mask = df[column].notna() & (~df[column].astype(str).str.lower().isin(allowed_set))
+        lowered_ok = eval_distinct(
+            df[column], lambda u: u.astype(str).str.lower().isin(allowed_set)
+        )
+        mask = df[column].notna() & ~pd.Series(lowered_ok, index=df.index, dtype=bool)
     else:
         allowed_set = set(allowed)
         mask = df[column].notna() & (~df[column].isin(allowed_set))
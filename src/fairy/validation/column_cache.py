@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/column_cache.py
+"""
+Per-DataFrame cache of derived column views shared across rules.
+
+A rulepack often has several rules on the same column (required + regex +
+non_empty_trimmed on eventDate, say), and each used to redo the same work:
+factorize, str.strip, casefold, to_numeric. A ColumnCache computes each view
+lazily on first use and memoizes it, evicting least-recently-used views once
+their (approximate) size passes a memory budget.
+
+Text views are computed over the column's distinct values (see
+fairy.validation.distinct) and line up with `distinct(column)`; numeric and
+blank views are per row.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .distinct import factorize_distinct
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+# Rough per-value overhead of Python string objects, which nbytes doesn't see
+_OBJECT_VALUE_BYTES = 56
+
+
+def _approx_nbytes(value: Any) -> int:
+    if isinstance(value, tuple):
+        return sum(_approx_nbytes(v) for v in value)
+    if isinstance(value, pd.Series):
+        n = int(value.memory_usage(index=False, deep=False))
+        if value.dtype == object or pd.api.types.is_string_dtype(value.dtype):
+            n += _OBJECT_VALUE_BYTES * len(value)
+        return n
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    return 0
+
+
+class ColumnCache:
+    """Lazily computed, memoized views of a DataFrame's columns (LRU, memory-bounded)."""
+
+    def __init__(self, df: pd.DataFrame, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.df = df
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._views: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+
+    def _get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        hit = self._views.get(key)
+        if hit is not None:
+            self._views.move_to_end(key)
+            return hit[0]
+
+        value = compute()
+        size = _approx_nbytes(value)
+        if size > self.max_bytes:
+            return value  # never fits; don't flush everything else for it
+        while self._views and self.nbytes + size > self.max_bytes:
+            _, (_, evicted) = self._views.popitem(last=False)
+            self.nbytes -= evicted
+        self._views[key] = (value, size)
+        self.nbytes += size
+        return value
+
+    def distinct(self, column: str) -> tuple[np.ndarray, pd.Series]:
+        """(codes, distinct values) of a column, as factorize_distinct()."""
+        return self._get(("distinct", column), lambda: factorize_distinct(self.df[column]))
+
+    def map_distinct(
+        self, column: str, predicate: Callable[[Any], Any], dtype: Any = bool
+    ) -> np.ndarray:
+        """Call predicate once per distinct value; per-row results (not cached)."""
+        codes, distinct = self.distinct(column)
+        per_value = np.fromiter((predicate(v) for v in distinct), dtype=dtype, count=len(distinct))
+        return per_value[codes]
+
+    def normalized(self, column: str, *, trim: bool = False, casefold: bool = False) -> pd.Series:
+        """Distinct values as strings, optionally stripped and/or casefolded."""
+        key = ("text", column, trim, casefold)
+        if casefold:
+            return self._get(key, lambda: self.normalized(column, trim=trim).str.casefold())
+        if trim:
+            return self._get(key, lambda: self.normalized(column).str.strip())
+
+        def _as_text() -> pd.Series:
+            _, distinct = self.distinct(column)
+            if pd.api.types.is_string_dtype(distinct.dtype) and distinct.dtype != object:
+                return distinct
+            return distinct.astype(str)
+
+        return self._get(key, _as_text)
+
+    def stripped(self, column: str) -> pd.Series:
+        return self.normalized(column, trim=True)
+
+    def casefolded(self, column: str) -> pd.Series:
+        return self.normalized(column, casefold=True)
+
+    def numeric(self, column: str) -> np.ndarray:
+        """Per-row float64 values (NaN where not numeric), as pd.to_numeric(errors="coerce")."""
+
+        def _coerce() -> np.ndarray:
+            codes, distinct = self.distinct(column)
+            values = pd.to_numeric(distinct, errors="coerce")
+            return values.to_numpy(dtype="float64", na_value=np.nan)[codes]
+
+        return self._get(("numeric", column), _coerce)
+
+    def blank(self, column: str) -> np.ndarray:
+        """Per-row mask of NA or whitespace-only values."""
+
+        def _blank() -> np.ndarray:
+            codes, distinct = self.distinct(column)
+            per_value = distinct.isna().to_numpy() | self.stripped(column).eq("").to_numpy(
+                dtype=bool, na_value=False
+            )
+            return per_value[codes]
+
+        return self._get(("blank", column), _blank)
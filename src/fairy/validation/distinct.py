@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/distinct.py
+"""
+Distinct-value evaluation for string-predicate checks.
+
+Metadata columns repeat heavily (basisOfRecord, country, license, ...), so
+checks evaluate their predicate once per distinct value and broadcast the
+result back to rows instead of calling it on every cell.
+
+Only string columns are factorized: for mixed object columns, values such as
+1, 1.0 and True hash equal but stringify differently, so those fall back to
+a per-row evaluation to keep results exact.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+def _is_string_column(s: pd.Series) -> bool:
+    if s.dtype != object:
+        return pd.api.types.is_string_dtype(s.dtype)
+    return pd.api.types.infer_dtype(s, skipna=True) in ("string", "empty")
+
+
+def factorize_distinct(s: pd.Series) -> tuple[np.ndarray, pd.Series]:
+    """
+    Return (codes, distinct) such that distinct.iloc[codes[i]] stands for s.iloc[i].
+
+    NA cells share a single slot holding the first NA value of the column, so
+    predicates see the same NA object they would per row.
+    """
+    if not _is_string_column(s):
+        return np.arange(len(s)), s.reset_index(drop=True)
+
+    codes, uniques = pd.factorize(s, use_na_sentinel=True)
+    distinct = pd.Series(uniques, dtype=s.dtype)
+    na_pos = np.flatnonzero(codes < 0)
+    if len(na_pos):
+        codes[na_pos] = len(distinct)
+        na_value = s.iloc[[int(na_pos[0])]].reset_index(drop=True)
+        distinct = pd.concat([distinct, na_value], ignore_index=True)
+    return codes, distinct
+
+
+def eval_distinct(s: pd.Series, fn: Callable[[pd.Series], Any]) -> np.ndarray:
+    """
+    Evaluate a vectorized fn on the distinct values of s and map results back to rows.
+
+    fn receives a Series of distinct values and returns an array-like of the same length.
+    """
+    codes, distinct = factorize_distinct(s)
+    return np.asarray(fn(distinct))[codes]
+
+
+def map_distinct(s: pd.Series, predicate: Callable[[Any], Any], dtype: Any = bool) -> np.ndarray:
+    """Call predicate once per distinct value of s; return per-row results as an array."""
+    return eval_distinct(
+        s, lambda u: np.fromiter((predicate(v) for v in u), dtype=dtype, count=len(u))
+    )
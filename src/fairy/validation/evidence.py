@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/evidence.py
+"""
+Bounded evidence for rules that flag a large share of rows.
+
+By default every offending row is listed in a rule's evidence. With an
+EvidencePolicy(max_rows=N), each row list longer than N (`rows`,
+`invalid_url_rows`, `empty_or_whitespace_rows`, `duplicates[].rows`,
+`nullish.rows_by_column[col]`, remediation `links`) is cut to its first N
+entries and gets two siblings:
+
+- `<key>_total`: the exact number of entries;
+- `<key>_ranges`: the rows as run-length [[start, end], ...] ranges
+  (inclusive, at most N of them), so a mostly-wrong column stays small.
+
+Counts elsewhere in the evidence (`count`, ...) are left exact. The full lists
+can be written to a JSON Lines sidecar, one record per capped list.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# Evidence keys holding 1-based row numbers (remediation links are capped, not ranged)
+ROW_KEYS = frozenset({"rows", "invalid_url_rows", "empty_or_whitespace_rows"})
+
+
+@dataclass(frozen=True)
+class EvidencePolicy:
+    """How much of each offending-row list a report keeps (None: everything)."""
+
+    max_rows: int | None = None
+    ranges: bool = True
+    sidecar: Path | None = None
+
+
+def row_ranges(rows: list[int]) -> list[list[int]]:
+    """Sorted row numbers as inclusive [start, end] runs."""
+    if not rows:
+        return []
+    a = np.asarray(rows, dtype=np.int64)
+    breaks = np.flatnonzero(np.diff(a) != 1)
+    starts = np.concatenate(([a[0]], a[breaks + 1]))
+    ends = np.concatenate((a[breaks], [a[-1]]))
+    return np.column_stack((starts, ends)).tolist()
+
+
+def _cap(
+    rows: list, policy: EvidencePolicy, spill: list[tuple[str, list]], where: str, ranged: bool
+) -> tuple[list, dict[str, Any]]:
+    """(kept rows, {"total": ..., "ranges": ...} if the list was cut, else {})."""
+    n = policy.max_rows
+    if n is None or len(rows) <= n:
+        return rows, {}
+    extra: dict[str, Any] = {"total": len(rows)}
+    if ranged and policy.ranges:
+        extra["ranges"] = row_ranges(rows)[:n]
+    spill.append((where, rows))
+    return rows[:n], extra
+
+
+def _bound(
+    ev: dict[str, Any], policy: EvidencePolicy, spill: list[tuple[str, list]], where: str
+) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for k, v in ev.items():
+        path = f"{where}{k}"
+        if k in ROW_KEYS | {"links"} and isinstance(v, list):
+            out[k], extra = _cap(v, policy, spill, path, ranged=k != "links")
+            out.update({f"{k}_{s}": x for s, x in extra.items()})
+        elif k == "rows_by_column" and isinstance(v, dict):
+            out[k] = {}
+            for col, rows in v.items():
+                out[k][col], extra = _cap(rows, policy, spill, f"{path}.{col}", ranged=True)
+                for s, x in extra.items():
+                    out.setdefault(f"{k}_{s}", {})[col] = x
+        elif isinstance(v, dict):
+            out[k] = _bound(v, policy, spill, f"{path}.")
+        elif isinstance(v, list) and v and all(isinstance(d, dict) for d in v):
+            out[k] = [_bound(d, policy, spill, f"{path}[{i}].") for i, d in enumerate(v)]
+        else:
+            out[k] = v
+    return out
+
+
+def bound_evidence(
+    ev: dict[str, Any], policy: EvidencePolicy
+) -> tuple[dict[str, Any], list[tuple[str, list]]]:
+    """
+    Evidence with every row list capped per policy, plus the full lists that were
+    cut as (dotted evidence path, rows) pairs for a sidecar.
+    """
+    if policy.max_rows is None:
+        return ev, []
+    spill: list[tuple[str, list]] = []
+    return _bound(ev, policy, spill, ""), spill
+
+
+def write_sidecar(path: Path, records: list[dict[str, Any]]) -> None:
+    """Write full row lists as JSON Lines: {"resource", "rule", "path", "rows"} per line."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        for rec in records:
+            f.write(json.dumps(rec, sort_keys=True))
+            f.write("\n")
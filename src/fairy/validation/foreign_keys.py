@@ -0,0 +1,162 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/foreign_keys.py
+"""
+Foreign-key engine for the validate runner.
+
+The referenced side of a foreign key, a (table, fields) pair, is indexed once
+per run (ReferenceIndexes) and shared by every rule that targets it. Each key
+field is dictionary-encoded; a composite key packs its per-field codes into one
+uint64 (as in fairy.validation.keys), so membership is a single hash lookup per
+row rather than a Python set of tuples. Source rows with a null in any key
+field are not checked.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+import pandas as pd
+
+from .ingest import ChunkedInput, read_input
+from .keys import row_keys
+
+MAX_MISSING_VALUES = 50
+MAX_FK_ROWS = 1000
+
+
+def fk_fields(spec: dict[str, Any]) -> tuple[str, ...]:
+    """Key fields of a from/to spec: `fields: [...]`, or the single `field`."""
+    fields = spec.get("fields")
+    if fields is None:
+        fields = [spec.get("field")]
+    elif isinstance(fields, str):
+        fields = [fields]
+    return tuple(f for f in fields if isinstance(f, str) and f)
+
+
+def _nonnull(frame: pd.DataFrame, fields: tuple[str, ...]) -> np.ndarray:
+    mask = np.ones(len(frame), dtype=bool)
+    for f in fields:
+        mask &= frame[f].notna().to_numpy()
+    return mask
+
+
+class ReferenceIndex:
+    """The distinct non-null keys of one (table, fields), ready for membership tests."""
+
+    def __init__(self, frame: pd.DataFrame, fields: tuple[str, ...]):
+        keys = frame.loc[_nonnull(frame, fields), list(fields)]
+        self.fields = fields
+        self._uniques: list[pd.Index] = []
+        codes: list[np.ndarray] = []
+        for f in fields:
+            col_codes, uniques = pd.factorize(keys[f])
+            self._uniques.append(pd.Index(uniques))
+            codes.append(col_codes.astype(np.uint64))
+        self._sizes = [max(len(u), 1) for u in self._uniques]
+        self._packed: pd.Index | None = None
+        if len(fields) > 1:
+            packed, exact = row_keys(codes, self._sizes, len(keys))
+            if exact:
+                self._packed = pd.Index(pd.unique(packed))
+            else:
+                self._multi = pd.MultiIndex.from_frame(keys.drop_duplicates())
+
+    def missing(self, frame: pd.DataFrame, fields: tuple[str, ...]) -> np.ndarray:
+        """Per row of frame: its non-null key (in `fields`) is absent from the index."""
+        nonnull = _nonnull(frame, fields)
+        if len(fields) == 1:
+            return nonnull & ~frame[fields[0]].isin(self._uniques[0]).to_numpy()
+        locs = [u.get_indexer(frame[f]) for u, f in zip(self._uniques, fields, strict=True)]
+        found = np.ones(len(frame), dtype=bool)
+        for loc in locs:
+            found &= loc >= 0
+        if self._packed is not None:
+            codes = [np.where(found, loc, 0).astype(np.uint64) for loc in locs]
+            packed, _ = row_keys(codes, self._sizes, len(frame))
+            found &= pd.Index(packed).isin(self._packed)
+        else:
+            found &= pd.MultiIndex.from_frame(frame[list(fields)]).isin(self._multi)
+        return nonnull & ~found
+
+
+class KeyLookup(Protocol):
+    """Anything that answers which rows' keys are absent (ReferenceIndex, KeyIndex)."""
+
+    def missing(self, frame: pd.DataFrame, fields: tuple[str, ...]) -> np.ndarray: ...
+
+
+class ReferenceIndexes:
+    """
+    ReferenceIndex per (table, fields) over a set of frames, built on first use.
+    `stored` supplies indexes loaded from disk instead (fairy.validation.key_index).
+    """
+
+    def __init__(
+        self,
+        frames: dict[str, pd.DataFrame],
+        stored: dict[tuple[str, tuple[str, ...]], KeyLookup] | None = None,
+    ):
+        self.frames = frames
+        self._indexes: dict[tuple[str, tuple[str, ...]], KeyLookup] = dict(stored or {})
+
+    def get(self, table: str, fields: tuple[str, ...]) -> KeyLookup:
+        key = (table, fields)
+        if key not in self._indexes:
+            self._indexes[key] = ReferenceIndex(self.frames[table], fields)
+        return self._indexes[key]
+
+
+def missing_evidence(frame: pd.DataFrame, fields: tuple[str, ...], mask: np.ndarray) -> dict:
+    """
+    Evidence for the rows of frame flagged in mask: distinct missing keys (sorted,
+    first MAX_MISSING_VALUES), the exact offending row count and the first
+    MAX_FK_ROWS 1-based rows.
+    """
+    bad = frame.loc[mask, list(fields)].drop_duplicates()
+    first = bad.sort_values(list(fields)).head(MAX_MISSING_VALUES)
+    if len(fields) == 1:
+        missing = first[fields[0]].tolist()
+    else:
+        missing = [list(t) for t in first.itertuples(index=False, name=None)]
+    rows = np.flatnonzero(mask) + 1
+    return {
+        "missing_values": missing,
+        "missing_count_estimate": len(bad),
+        "count": len(rows),
+        "rows": rows[:MAX_FK_ROWS].tolist(),
+    }
+
+
+def locate_missing_rows(
+    path: Path,
+    fields: tuple[str, ...],
+    index: KeyLookup,
+    chunksize: int | None = None,
+    limit: int | None = None,
+) -> tuple[int, list[int]]:
+    """
+    (count, first MAX_FK_ROWS 1-based rows) of the input at path whose key is
+    missing from index; reads only the key fields, in chunks when chunksize is set.
+    With limit, reading stops after the chunk in which count reaches it.
+    """
+    chunks: Iterable[pd.DataFrame]
+    if chunksize:
+        chunks = ChunkedInput(path, fields, chunksize, hash_rest=False)
+    else:
+        chunks = [read_input(path, usecols=fields)[0]]
+    count, rows, offset = 0, [], 0
+    for chunk in chunks:
+        hit = np.flatnonzero(index.missing(chunk, fields))
+        count += len(hit)
+        if len(rows) < MAX_FK_ROWS:
+            rows.extend((hit[: MAX_FK_ROWS - len(rows)] + offset + 1).tolist())
+        offset += len(chunk)
+        if limit is not None and count >= limit:
+            break
+    return count, rows
@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/hooks.py
+"""
+Execution hooks for tracers and profilers.
+
+Both run_rulepack entry points (fairy.validation.rulepack_runner for validate,
+fairy.core.services.validator for preflight) and the CLIs that write their
+reports call the registered hooks at stage boundaries:
+
+- on_load:       an input was read (input, rows, seconds)
+- on_rule_start: a rule is about to be evaluated (rule, input, rows)
+- on_rule_end:   that evaluation finished (rule, input, rows, seconds)
+- on_write:      an output file was written (path, seconds)
+
+A hook is any object with one or more of these methods; each receives a
+StageEvent. With --stream a rule is evaluated (and reported) once per chunk;
+with --jobs, load and own-rule events fire in the worker processes, so hooks
+there must be registered at import time of a module the workers load (or
+inherited through fork). Exceptions raised by a hook propagate.
+
+    class Tracer:
+        def on_rule_end(self, event):
+            spans.append((event.rule, event.input, event.rows, event.seconds))
+
+    with HOOKS.registered(Tracer()):
+        run_rulepack(...)
+
+With nothing registered, a stage boundary costs a flag or list check.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..core.fileio import write_text_atomic
+
+STAGES = ("on_load", "on_rule_start", "on_rule_end", "on_write")
+
+
+@dataclass(frozen=True)
+class StageEvent:
+    stage: str
+    input: str | None = None
+    rule: str | None = None
+    rows: int = 0
+    seconds: float = 0.0
+    path: str | None = None
+
+
+HookFn = Callable[[StageEvent], Any]
+
+
+class HookRegistry:
+    def __init__(self) -> None:
+        self._hooks: dict[str, list[HookFn]] = {stage: [] for stage in STAGES}
+        self._registered: list[object] = []
+        # Fast-path flag read at every rule evaluation
+        self.rules = False
+
+    def register(self, hook: object) -> None:
+        fns = {stage: getattr(hook, stage, None) for stage in STAGES}
+        if not any(callable(fn) for fn in fns.values()):
+            raise ValueError(f"Hook {hook!r} has none of: {', '.join(STAGES)}")
+        self._registered.append(hook)
+        self._rebuild()
+
+    def unregister(self, hook: object) -> None:
+        self._registered = [h for h in self._registered if h is not hook]
+        self._rebuild()
+
+    @contextmanager
+    def registered(self, hook: object) -> Iterator[object]:
+        """Register hook for the duration of the block."""
+        self.register(hook)
+        try:
+            yield hook
+        finally:
+            self.unregister(hook)
+
+    def _rebuild(self) -> None:
+        for stage in STAGES:
+            fns = (getattr(h, stage, None) for h in self._registered)
+            self._hooks[stage] = [fn for fn in fns if callable(fn)]
+        self.rules = bool(self._hooks["on_rule_start"] or self._hooks["on_rule_end"])
+
+    def emit(self, stage: str, **fields: Any) -> None:
+        fns = self._hooks[stage]
+        if not fns:
+            return
+        fields.setdefault("input", _INPUT.get())
+        event = StageEvent(stage, **fields)
+        for fn in fns:
+            fn(event)
+
+
+HOOKS = HookRegistry()
+
+# Name of the input whose rules are being evaluated (None outside a run)
+_INPUT: ContextVar[str | None] = ContextVar("fairy_input", default=None)
+
+
+def current_input() -> str | None:
+    return _INPUT.get()
+
+
+@contextmanager
+def input_scope(name: str | None) -> Iterator[None]:
+    """Attribute the rule evaluations inside the block to input name."""
+    token = _INPUT.set(name)
+    try:
+        yield
+    finally:
+        _INPUT.reset(token)
+
+
+@contextmanager
+def _rule_span(rule: str, rows: int, input_name: str | None) -> Iterator[None]:
+    HOOKS.emit("on_rule_start", rule=rule, rows=rows, input=input_name)
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - t0
+        HOOKS.emit("on_rule_end", rule=rule, rows=rows, seconds=seconds, input=input_name)
+
+
+def rule_span(rule: str, rows: int, input_name: str | None = None) -> AbstractContextManager[None]:
+    """on_rule_start / on_rule_end around one rule evaluation; does nothing without hooks."""
+    if not HOOKS.rules:
+        return nullcontext()
+    return _rule_span(rule, rows, input_name if input_name is not None else _INPUT.get())
+
+
+def write_text(path: Path, text: str) -> None:
+    """Replace path with text (UTF-8) atomically, reported to on_write hooks."""
+    t0 = time.perf_counter()
+    write_text_atomic(path, text)
+    HOOKS.emit("on_write", path=str(path), seconds=time.perf_counter() - t0)
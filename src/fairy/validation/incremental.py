@@ -0,0 +1,183 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/incremental.py
+"""
+Row-level incremental revalidation of an input that changed since the last run.
+
+With a result cache, evaluating an input also leaves a row index behind: a
+64-bit hash of every row (over the columns its row-local rules read) and, per
+rule, the rows that contributed to its evidence. When the input changes, a
+row-local rule (required, enum, range, regex, url, non_empty_trimmed) is then
+evaluated only on rows whose content is new plus the rows it flagged last time;
+every other row is known to contribute nothing. Row numbers in that partial
+evidence are mapped back to file positions, so the report is the same as a
+full run.
+
+Rows are matched by content rather than position, so inserted or deleted rows
+do not invalidate the rows after them. unique / dup rules still run over their
+whole key columns: the composite-key engine needs one hash pass over the keys,
+which is what looking them up in a stored key -> count map would cost too.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .column_cache import ColumnCache
+from .rulepack_runner import (
+    CompiledRule,
+    LocalResults,
+    _execute_rule,
+    _regex_kernel,
+    check_dup,
+    check_unique,
+)
+from .streaming import _ROW_LISTS, _map_rows
+
+_FLAGS = "flags:"
+
+
+def _row_local(rule: CompiledRule) -> bool:
+    """Whether each row's contribution to the rule's evidence depends on that row alone."""
+    return not rule.cross_table and getattr(rule.kernel, "func", None) not in (
+        check_dup,
+        check_unique,
+    )
+
+
+def _rule_digest(rule: CompiledRule) -> str:
+    return sha256(rule.spec.encode("utf-8")).hexdigest()
+
+
+def row_hashes(df: pd.DataFrame, columns: list[str]) -> np.ndarray:
+    """uint64 hash of each row's values in columns."""
+    if not columns:
+        return np.zeros(len(df), dtype=np.uint64)
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+
+@dataclass
+class RowIndex:
+    """Row hashes of an input's last evaluation and, per rule, the 0-based rows it flagged."""
+
+    columns: list[str]
+    hashes: np.ndarray
+    flags: dict[str, np.ndarray]
+
+    @classmethod
+    def load(cls, path: Path) -> RowIndex | None:
+        try:
+            with np.load(path, allow_pickle=False) as z:
+                columns = json.loads(str(z["columns"]))
+                hashes = z["hashes"]
+                flags = {k[len(_FLAGS) :]: z[k] for k in z.files if k.startswith(_FLAGS)}
+        except (OSError, ValueError, KeyError):
+            return None
+        return cls(columns, hashes, flags)
+
+    def save(self, path: Path) -> None:
+        arrays = {f"{_FLAGS}{k}": v for k, v in self.flags.items()}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f, columns=np.array(json.dumps(self.columns)), hashes=self.hashes, **arrays
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def match(self, hashes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """(known, prev_row): whether each row's content was seen last time, and where."""
+        prev = pd.Index(self.hashes)
+        first = np.flatnonzero(~prev.duplicated())
+        loc = prev[first].get_indexer(hashes)
+        known = loc >= 0
+        return known, np.where(known, first[loc], 0) if len(first) else np.zeros_like(loc)
+
+
+def _evidence_rows(ev: dict[str, Any], out: list[int]) -> None:
+    for k, v in ev.items():
+        if k in _ROW_LISTS and isinstance(v, list):
+            out.extend(v)
+        elif k == "rows_by_column":
+            for rows in v.values():
+                out.extend(rows)
+        elif isinstance(v, dict):
+            _evidence_rows(v, out)
+
+
+def _flagged(rule: CompiledRule, ev: dict[str, Any], cache: ColumnCache) -> np.ndarray:
+    """0-based rows of cache.df that a later run has to see again to rebuild ev."""
+    listed: list[int] = []
+    _evidence_rows(ev, listed)
+    flagged = np.zeros(len(cache.df), dtype=bool)
+    flagged[np.asarray(listed, dtype=np.intp) - 1] = True
+    kernel = rule.kernel
+    if getattr(kernel, "func", None) is _regex_kernel and "error" not in ev:
+        # Skipped empties (NA / whitespace-only) only show up as ignored_empty_count
+        kw = kernel.keywords
+        if kw.get("ignore_empty") and kw.get("rx") is not None:
+            flagged |= cache.blank(kw["column"])
+    return flagged
+
+
+def incremental_results(
+    df: pd.DataFrame, rules: tuple[CompiledRule, ...], index_path: Path
+) -> LocalResults:
+    """
+    Run one input's own rules, reusing the row index at index_path for row-local
+    rules and replacing it with this run's. Same results as evaluating df whole.
+    """
+    local = [r for r in rules if _row_local(r)]
+    cols = sorted({c for r in local for c in r.columns if c in df.columns})
+    hashes = row_hashes(df, cols)
+    prev = RowIndex.load(index_path) if local else None
+    if prev is not None and prev.columns != cols:
+        prev = None
+    if prev is not None:
+        known, prev_row = prev.match(hashes)
+
+    cache = ColumnCache(df)
+    flags: dict[str, np.ndarray] = {}
+    results: LocalResults = []
+    for rule in rules:
+        if rule.cross_table:
+            results.append(None)
+            continue
+        if not _row_local(rule):
+            results.append(_execute_rule(rule, df, {}, cache))
+            continue
+
+        digest = _rule_digest(rule)
+        if prev is not None and digest in prev.flags:
+            was_flagged = np.zeros(max(len(prev.hashes), 1), dtype=bool)
+            was_flagged[prev.flags[digest]] = True
+            pos = np.flatnonzero(~known | was_flagged[prev_row])
+            sub = df.iloc[pos]
+            sub_cache = ColumnCache(sub)
+            status, ev = _execute_rule(rule, sub, {}, sub_cache)
+            if ev.get("error") != "runtime_error":
+                flags[digest] = pos[_flagged(rule, ev, sub_cache)]
+            ev = _map_rows(ev, lambda r, pos=pos: pos[r - 1] + 1)
+        else:
+            status, ev = _execute_rule(rule, df, {}, cache)
+            if ev.get("error") != "runtime_error":
+                flags[digest] = np.flatnonzero(_flagged(rule, ev, cache))
+        results.append((status, ev))
+
+    if local:
+        RowIndex(cols, hashes, flags).save(index_path)
+    return results
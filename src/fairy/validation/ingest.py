@@ -0,0 +1,211 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/ingest.py
+"""
+Single-pass ingestion of validate inputs.
+
+The byte stream of each input is teed into a SHA-256 hasher while pandas
+parses it, so the attestation block (sha256, bytes, rows) costs no second
+read of the file. The header used for column projection is parsed from the
+same buffered stream (a peek, not a separate open).
+"""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+
+import pandas as pd
+
+# Projected frames keep the full source header here, so column_not_found
+# evidence still lists every column of the file, not just the loaded ones
+HEADER_ATTR = "source_columns"
+
+_BUFFER_BYTES = 1 << 20
+
+# pandas only infers compression from paths; the tee hands it a stream
+_COMPRESSION = {".gz": "gzip", ".bz2": "bz2", ".zip": "zip", ".xz": "xz", ".zst": "zstd"}
+
+
+@dataclass(frozen=True)
+class InputStats:
+    """What the attestation records about an input, gathered while parsing it."""
+
+    sha256: str | None  # None: not computed (a sampled input)
+    bytes: int
+    rows: int
+    # False when reading stopped early (see ChunkedInput): rows is then a lower bound
+    complete: bool = True
+
+
+def infer_sep(path: Path) -> str:
+    suf = path.suffix.lower()
+    if suf in {".tsv", ".tab"}:
+        return "\t"
+    return ","
+
+
+def read_header(path: Path, delimiter: str | None = None) -> list[str]:
+    sep = delimiter if delimiter is not None else infer_sep(path)
+    return pd.read_csv(path, sep=sep, dtype=str, nrows=0).columns.tolist()
+
+
+class _HashingReader(io.RawIOBase):
+    """Raw reader that hashes and counts every byte read from the underlying file."""
+
+    def __init__(self, f: io.BufferedIOBase):
+        self._f = f
+        self._sha = sha256()
+        self.nbytes = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        n = self._f.readinto(b)
+        if n:
+            self._sha.update(memoryview(b)[:n])
+            self.nbytes += n
+        return n
+
+    def drain(self) -> None:
+        """Read (and hash) whatever the parser left unread."""
+        buf = bytearray(_BUFFER_BYTES)
+        while self.readinto(buf):
+            pass
+
+    def hexdigest(self) -> str:
+        return self._sha.hexdigest()
+
+
+@contextmanager
+def _tee(path: Path) -> Iterator[tuple[_HashingReader, io.BufferedReader]]:
+    with path.open("rb") as f:
+        raw = _HashingReader(f)
+        yield raw, io.BufferedReader(raw, buffer_size=_BUFFER_BYTES)
+
+
+def _compression(path: Path) -> str | None:
+    return _COMPRESSION.get(path.suffix.lower())
+
+
+def _peek_header(
+    stream: io.BufferedReader, path: Path, sep: str, delimiter: str | None
+) -> list[str]:
+    head = stream.peek(_BUFFER_BYTES)
+    # Parse the header from the buffered head when it holds at least one full line
+    if _compression(path) is None and (b"\n" in head or len(head) < _BUFFER_BYTES):
+        try:
+            return pd.read_csv(io.BytesIO(head), sep=sep, dtype=str, nrows=0).columns.tolist()
+        except pd.errors.ParserError:
+            pass
+    return read_header(path, delimiter)
+
+
+def _projection(header: list[str], usecols: Iterable[str]) -> tuple[list[str], list[str]]:
+    """(columns to keep, columns to parse); an empty projection parses one column for row counts."""
+    wanted = set(usecols)
+    cols = [c for c in header if c in wanted]
+    return cols, cols or header[:1]
+
+
+def read_input(
+    path: Path, usecols: Iterable[str] | None = None, delimiter: str | None = None
+) -> tuple[pd.DataFrame, InputStats]:
+    """
+    Read a table as strings in one pass over the file, hashing it along the way.
+
+    With usecols, only those columns (that exist in the header) are parsed; the
+    full header is kept in df.attrs[HEADER_ATTR].
+    """
+    sep = delimiter if delimiter is not None else infer_sep(path)
+    with _tee(path) as (raw, stream):
+        header: list[str] | None = None
+        cols: list[str] = []
+        parse = None
+        if usecols is not None:
+            header = _peek_header(stream, path, sep, delimiter)
+            cols, parse = _projection(header, usecols)
+        df = pd.read_csv(
+            stream,
+            sep=sep,
+            dtype=str,
+            keep_default_na=False,  # keep empty strings as ""
+            usecols=parse,
+            compression=_compression(path),
+        )
+        raw.drain()
+
+    if header is not None:
+        if not cols:
+            df = df.iloc[:, :0]
+        df.attrs[HEADER_ATTR] = header
+    return df, InputStats(raw.hexdigest(), raw.nbytes, len(df))
+
+
+class ChunkedInput:
+    """
+    Chunks of an input projected onto usecols, read in one hashed pass.
+
+    Iterate it once; `stats` is set when iteration completes. A consumer that
+    stops early should close() the iterator: the rest of the file is then only
+    hashed, not parsed, and stats.complete is False (with hash_rest=False it is
+    left unread and stats stays None).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        usecols: Iterable[str],
+        chunksize: int,
+        delimiter: str | None = None,
+        hash_rest: bool = True,
+    ):
+        self.path = path
+        self.usecols = set(usecols)
+        self.chunksize = chunksize
+        self.delimiter = delimiter
+        self.hash_rest = hash_rest
+        self.stats: InputStats | None = None
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        path = self.path
+        sep = self.delimiter if self.delimiter is not None else infer_sep(path)
+        rows = 0
+        with _tee(path) as (raw, stream):
+            header = _peek_header(stream, path, sep, self.delimiter)
+            cols, parse = _projection(header, self.usecols)
+            reader = pd.read_csv(
+                stream,
+                sep=sep,
+                dtype=str,
+                keep_default_na=False,
+                usecols=parse,
+                chunksize=self.chunksize,
+                compression=_compression(path),
+            )
+            fed = stopped = False
+            try:
+                with reader:
+                    for chunk in reader:
+                        if not cols:
+                            chunk = chunk.iloc[:, :0]
+                        chunk.attrs[HEADER_ATTR] = header
+                        rows += len(chunk)
+                        fed = True
+                        yield chunk
+            except GeneratorExit:
+                if not self.hash_rest:
+                    return
+                stopped = True
+            if not fed and not stopped:
+                empty = pd.DataFrame({c: pd.Series(dtype=str) for c in cols})
+                empty.attrs[HEADER_ATTR] = header
+                yield empty
+            raw.drain()
+        self.stats = InputStats(raw.hexdigest(), raw.nbytes, rows, complete=not stopped)
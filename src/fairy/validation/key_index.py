@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/key_index.py
+"""
+Persistent, memory-mapped index of a reference table's foreign keys.
+
+Large lookup tables (taxonomic backbones, sample registries) rarely change,
+but every foreign_key check used to parse and hash them again. A KeyIndex
+stores the distinct non-null keys of one (table, fields) once, in a directory
+keyed on the table's sha256 (see ResultCache.key_index_path):
+
+- hashes.npy: uint64 hash of each key, sorted (memory-mapped, binary-searched);
+- offsets.npy / keys.bin: the UTF-8 keys in the same order, used to confirm
+  every hash hit, so a collision can never make a missing key look present.
+
+Composite keys are stored length-prefixed ("3:abc2:xy") so that no two field
+combinations encode to the same string.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .foreign_keys import _nonnull
+
+_SCHEMA = 1
+
+
+def encode_keys(frame: pd.DataFrame, fields: tuple[str, ...]) -> pd.Series:
+    """One string per row of frame for its key; rows must have no null key field."""
+    if len(fields) == 1:
+        return frame[fields[0]].astype(str)
+    out = None
+    for f in fields:
+        s = frame[f].astype(str)
+        part = s.str.len().astype(str) + ":" + s
+        out = part if out is None else out + part
+    return out
+
+
+def _hash(keys: np.ndarray) -> np.ndarray:
+    return pd.util.hash_array(keys.astype(object), categorize=False)
+
+
+class KeyIndex:
+    """Membership tests against a stored key index, reading it through np.memmap."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        meta = json.loads((root / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("schema") != _SCHEMA:
+            raise ValueError(f"unsupported key index schema: {meta.get('schema')}")
+        self.fields = tuple(meta["fields"])
+        self.hashes = np.load(root / "hashes.npy", mmap_mode="r")
+        self.offsets = np.load(root / "offsets.npy", mmap_mode="r")
+        self._bytes = np.zeros(0, dtype=np.uint8)
+        if int(self.offsets[-1]):
+            self._bytes = np.memmap(root / "keys.bin", dtype=np.uint8, mode="r")
+
+    @classmethod
+    def open(cls, root: Path) -> KeyIndex | None:
+        """The index at root, or None if it is missing or unreadable."""
+        try:
+            return cls(root)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def build(frame: pd.DataFrame, fields: tuple[str, ...], root: Path) -> None:
+        """Write the distinct non-null keys of frame over fields to root (atomically)."""
+        keys = encode_keys(frame.loc[_nonnull(frame, fields)], fields).drop_duplicates()
+        values = keys.to_numpy(dtype=object)
+        hashes = _hash(values)
+        order = np.argsort(hashes)
+        ordered = values[order].tolist()
+        text = "".join(ordered)
+        if text.isascii():
+            blob = text.encode("ascii")  # character counts are byte counts
+        else:
+            ordered = [k.encode("utf-8") for k in ordered]
+            blob = b"".join(ordered)
+        offsets = np.zeros(len(ordered) + 1, dtype=np.int64)
+        np.cumsum(
+            np.fromiter(map(len, ordered), dtype=np.int64, count=len(ordered)), out=offsets[1:]
+        )
+
+        root.parent.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(dir=root.parent, suffix=".tmp"))
+        try:
+            np.save(tmp / "hashes.npy", hashes[order])
+            np.save(tmp / "offsets.npy", offsets)
+            (tmp / "keys.bin").write_bytes(blob)
+            meta = {"schema": _SCHEMA, "fields": list(fields), "keys": len(ordered)}
+            (tmp / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+            os.replace(tmp, root)
+        except OSError:
+            # Another run got there first (or the cache is read-only): the index is optional
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def _equal(self, pos: np.ndarray, keys: np.ndarray) -> np.ndarray:
+        """Per i, whether stored key pos[i] is keys[i] (compared byte by byte, vectorized)."""
+        want = [k.encode("utf-8") for k in keys]
+        lens = np.fromiter(map(len, want), dtype=np.int64, count=len(want))
+        start = self.offsets[pos]
+        equal = lens == self.offsets[pos + 1] - start
+        idx = np.flatnonzero(equal & (lens > 0))
+        if len(idx):
+            n = lens[idx]
+            bounds = np.concatenate(([0], np.cumsum(n)[:-1]))
+            ramp = np.arange(n.sum()) - np.repeat(bounds, n)
+            stored = self._bytes[np.repeat(start[idx], n) + ramp]
+            given = np.frombuffer(b"".join(want[i] for i in idx), dtype=np.uint8)
+            equal[idx] = np.logical_and.reduceat(stored == given, bounds)
+        return equal
+
+    def contains(self, keys: np.ndarray) -> np.ndarray:
+        """Per encoded key, whether it is in the index."""
+        hashes = _hash(keys)
+        n = len(self.hashes)
+        pos = np.searchsorted(self.hashes, hashes)
+        found = np.zeros(len(keys), dtype=bool)
+        cand = np.flatnonzero(pos < n)
+        while len(cand):
+            cand = cand[self.hashes[pos[cand]] == hashes[cand]]
+            same = self._equal(pos[cand], keys[cand])
+            found[cand[same]] = True
+            # Colliding hashes sit next to each other: try the next one
+            cand = cand[~same]
+            pos[cand] += 1
+            cand = cand[pos[cand] < n]
+        return found
+
+    def missing(self, frame: pd.DataFrame, fields: tuple[str, ...]) -> np.ndarray:
+        """Per row of frame: its non-null key (in `fields`) is absent from the index."""
+        nonnull = _nonnull(frame, fields)
+        codes, distinct = pd.factorize(encode_keys(frame.loc[nonnull], fields))
+        out = np.zeros(len(frame), dtype=bool)
+        out[nonnull] = ~self.contains(np.asarray(distinct, dtype=object))[codes]
+        return out
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/keys.py
+"""
+Composite-key engine for uniqueness / duplicate checks.
+
+Each key column is dictionary-encoded once (a hash-table factorize), and the
+per-column codes are folded into a single uint64 key per row. When the code
+space fits in 64 bits the codes are packed exactly; otherwise they are hashed,
+and rows that share a hash are compared code-by-code so that a collision can
+never merge two different keys. Duplicates are then found on the uint64 key
+alone, without building a Python tuple per row.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+Keep = Literal["first", "last", False]
+
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def column_codes(df: pd.DataFrame, columns: Sequence[str]) -> tuple[list[np.ndarray], list[int]]:
+    """Dictionary-encode each key column; return (codes per column, distinct count per column)."""
+    codes, sizes = [], []
+    for c in columns:
+        col_codes, uniques = pd.factorize(df[c], use_na_sentinel=False)
+        codes.append(col_codes.astype(np.uint64, copy=False))
+        sizes.append(max(len(uniques), 1))
+    return codes, sizes
+
+
+def row_keys(codes: list[np.ndarray], sizes: list[int], n: int) -> tuple[np.ndarray, bool]:
+    """
+    Fold per-column codes into one uint64 key per row.
+
+    Returns (keys, exact): exact is True when the codes were packed without loss,
+    False when they had to be hashed and equal keys still need verifying.
+    """
+    if not codes:
+        return np.zeros(n, dtype=np.uint64), True
+
+    space = 1
+    for size in sizes:
+        space *= size
+    if space <= 2**64:
+        key = np.zeros(n, dtype=np.uint64)
+        for col_codes, size in zip(codes, sizes, strict=True):
+            key = key * np.uint64(size) + col_codes
+        return key, True
+
+    key = np.zeros(n, dtype=np.uint64)
+    for col_codes in codes:
+        key = (key * _MIX) ^ pd.util.hash_array(col_codes)
+    return key, False
+
+
+def duplicate_mask(df: pd.DataFrame, columns: Sequence[str], *, keep: Keep = "first") -> np.ndarray:
+    """
+    Boolean mask of duplicate rows over the composite key `columns`.
+
+    keep follows DataFrame.duplicated: "first" marks every repeat after the first
+    occurrence, "last" every repeat before the last, False every member of a
+    duplicate group.
+    """
+    cols = list(columns)
+    if len(cols) == 1:
+        # A single column is already one key; pandas' hash-table duplicated covers it
+        return df[cols[0]].duplicated(keep=keep).to_numpy(copy=True)
+
+    n = len(df)
+    codes, sizes = column_codes(df, cols)
+    key, exact = row_keys(codes, sizes, n)
+
+    # Group rows by key; groups are numbered in order of first appearance
+    group, uniques = pd.factorize(key)
+    n_groups = len(uniques)
+    counts = np.bincount(group, minlength=n_groups)
+    shared = counts[group] > 1
+    if not shared.any():
+        return np.zeros(n, dtype=bool)
+
+    rows = np.arange(n)
+    first = np.empty(n_groups, dtype=np.intp)
+    first[group[::-1]] = rows[::-1]  # last write wins -> earliest row per group
+    rep = first[group]
+
+    if keep == "first":
+        out = rows != rep
+    elif keep == "last":
+        last = np.empty(n_groups, dtype=np.intp)
+        last[group] = rows
+        out = rows != last[group]
+    else:
+        out = shared.copy()
+
+    if not exact:
+        # Hashed keys: every row sharing a key must match its group's first row
+        # code-for-code; groups that don't are settled exactly over their rows only
+        pos = np.flatnonzero(shared)
+        same = np.ones(len(pos), dtype=bool)
+        for col_codes in codes:
+            same &= col_codes[pos] == col_codes[rep[pos]]
+        if not same.all():
+            colliding = np.zeros(n_groups, dtype=bool)
+            colliding[group[pos[~same]]] = True
+            xpos = np.flatnonzero(colliding[group])
+            sub = pd.DataFrame({i: c[xpos] for i, c in enumerate(codes)})
+            out[xpos] = sub.duplicated(keep=keep).to_numpy()
+
+    return out
@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/limits.py
+"""
+Early-exit execution modes for gatekeeping runs (validate --fail-fast /
+--max-violations).
+
+- max_violations: a rule stops scanning once it has found that many offending
+  rows; its evidence then carries `count_is_lower_bound: true`.
+- fail_fast: the run stops at the first chunk in which a FAIL-level rule has
+  failed. Rules that had not settled by then are reported as SKIPPED, as are
+  the inputs (and cross-table rules) not reached.
+
+Both work at chunk granularity: inputs are streamed (see
+fairy.validation.streaming), and a rule that reaches its cap part-way through
+a chunk still reports every offender of that chunk.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+SKIPPED = "SKIPPED"
+LOWER_BOUND = "count_is_lower_bound"
+
+
+@dataclass(frozen=True)
+class ScanLimits:
+    fail_fast: bool = False
+    max_violations: int | None = None
+
+    def __bool__(self) -> bool:
+        return self.fail_fast or self.max_violations is not None
+
+    def metadata(self) -> dict[str, Any]:
+        """The report's metadata.limits block."""
+        return {"fail_fast": self.fail_fast, "max_violations": self.max_violations}
+
+
+def skipped(reason: str = "fail_fast") -> tuple[str, dict[str, Any]]:
+    """Result of a rule that was not (fully) evaluated because the run stopped."""
+    return SKIPPED, {"skipped": reason}
+
+
+def violations(ev: dict[str, Any]) -> int:
+    """Offending rows in evidence: its count, or the count of its nested block (enum, range)."""
+    if "count" in ev:
+        return int(ev["count"])
+    for v in ev.values():
+        if isinstance(v, dict) and "count" in v:
+            return int(v["count"])
+    return 0
+
+
+def lower_bound(ev: dict[str, Any]) -> dict[str, Any]:
+    """Copy of evidence whose counts cover only the rows scanned before a stop."""
+    return {**ev, LOWER_BOUND: True}
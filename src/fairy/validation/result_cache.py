@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/result_cache.py
+"""
+Opt-in, content-addressed cache of rule results for repeat validate runs.
+
+Each entry is keyed on the sha256 of the input(s) a rule reads, the rule's
+canonical JSON and the fairy-core version, so an unchanged (input, rule) pair
+is served from disk instead of being evaluated again, while editing either the
+data or the rule (or upgrading fairy-core) misses naturally. An input's sha256
+is itself remembered under its path and stat stamp, so an unchanged input is
+not read at all. Entries are small
+JSON files under the cache directory, written atomically; deleting the
+directory is always safe.
+"""
+
+from __future__ import annotations
+
+import importlib.metadata as md
+import json
+import os
+import tempfile
+from hashlib import sha256
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .key_index import KeyIndex
+
+DEFAULT_CACHE_DIR = ".fairy_cache"
+
+_SCHEMA = 1
+
+
+def _digest(obj: Any) -> str:
+    blob = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+    return sha256(blob.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Rule results and input facts (row counts) stored under root, one JSON file per key."""
+
+    def __init__(self, root: Path | str, core_version: str | None = None):
+        self.root = Path(root)
+        if core_version is None:
+            try:
+                core_version = md.version("fairy-core")
+            except md.PackageNotFoundError:
+                core_version = "unknown"
+        self.core_version = core_version
+        self.hits = 0
+        self.misses = 0
+
+    def rule_key(self, rule_spec: str, inputs: dict[str, str], sep: str | None) -> str:
+        """
+        Key for one rule's result. inputs maps the input names the rule reads to
+        their sha256; sep is the delimiter the input is parsed with.
+        """
+        return _digest(
+            {
+                "schema": _SCHEMA,
+                "core": self.core_version,
+                "rule": rule_spec,
+                "inputs": inputs,
+                "sep": sep,
+            }
+        )
+
+    def input_key(self, input_sha256: str, sep: str) -> str:
+        return _digest(
+            {"schema": _SCHEMA, "core": self.core_version, "input": input_sha256, "sep": sep}
+        )
+
+    def stat_key(self, input_path: Path) -> str | None:
+        """
+        Key for the sha256 of the file at input_path as it is now (path, size,
+        mtime, ctime, inode), so an unchanged input need not be read to be
+        hashed; None if the file cannot be stat'ed.
+        """
+        path = Path(input_path).resolve()
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        stamp = [st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino]
+        return _digest({"schema": _SCHEMA, "stat": str(path), "stamp": stamp})
+
+    def row_index_path(self, input_path: Path, sep: str) -> Path:
+        """Row index file of the input at input_path (see fairy.validation.incremental)."""
+        key = _digest(
+            {
+                "schema": _SCHEMA,
+                "core": self.core_version,
+                "rows": str(Path(input_path).resolve()),
+                "sep": sep,
+            }
+        )
+        return self.root / "rows" / f"{key}.npz"
+
+    def key_index_path(self, input_sha256: str, fields: tuple[str, ...], sep: str) -> Path:
+        """Key index directory of a table's content and key fields (fairy.validation.key_index)."""
+        key = _digest(
+            {
+                "schema": _SCHEMA,
+                "core": self.core_version,
+                "input": input_sha256,
+                "fields": list(fields),
+                "sep": sep,
+            }
+        )
+        return self.root / "keys" / key
+
+    def open_key_index(self, path: Path) -> KeyIndex | None:
+        """The key index stored at path (from key_index_path), or None if there is none yet."""
+        from .key_index import KeyIndex
+
+        return KeyIndex.open(path)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        try:
+            value = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        try:
+            blob = json.dumps(value, sort_keys=True)
+        except (TypeError, ValueError):
+            return  # not JSON-safe; just don't cache it
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(blob)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
@@ -2,15 +2,38 @@
 from __future__ import annotations
 
 import importlib.metadata as md
+import json
+import os
 import re
-from fnmatch import fnmatch
-from hashlib import sha256
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from fnmatch import translate
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlsplit
 
+import numpy as np
 import pandas as pd
 
+from ..core.services.provenance import sha256_files
+from . import hooks, timing
+from .column_cache import ColumnCache
+from .evidence import EvidencePolicy, bound_evidence, write_sidecar
+from .foreign_keys import ReferenceIndexes, fk_fields, locate_missing_rows, missing_evidence
+from .hooks import HOOKS
+from .ingest import HEADER_ATTR, InputStats, infer_sep, read_input
+from .key_index import KeyIndex
+from .keys import duplicate_mask
+from .limits import LOWER_BOUND, SKIPPED, ScanLimits, lower_bound, skipped
+from .result_cache import ResultCache
+from .timing import RuleTiming, Stopwatch
+
+if TYPE_CHECKING:
+    from .sampling import SampleSpec
+
 # Accept both names for the row-duplicates rule (+ foreign_key for multi-input)
 CHECK_TYPES = {
     "dup",
@@ -57,57 +80,771 @@ def _normalize_old_rule(rule: dict) -> dict:
     return out
 
 
-def _old_schema_applicable_rules(rules: list[dict], path: Path) -> list[dict]:
-    name = path.name
-    acc: list[dict] = []
-    for r in rules or []:
-        rr = _normalize_old_rule(r)
-        pat = rr.get("_pattern", "")
-        if not pat:
-            continue
-        if ("*" in pat and fnmatch(name, pat)) or (name == pat):
-            acc.append(rr)
-    return acc
+def _source_columns(df: pd.DataFrame) -> list[str]:
+    return list(df.attrs.get(HEADER_ATTR, df.columns))
+
+
+# ---------------- Execution plan (compiled once per rulepack) ----------------
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """A rule resolved to its kernel, with config parsed and precompiled once."""
+
+    id: str
+    type: str
+    severity: str
+    kernel: Callable[..., tuple[str, dict[str, Any]]]
+    # Columns of the matched resource this rule reads (FK fields live on other tables)
+    columns: tuple[str, ...] = ()
+    # Cross-table kernels take every loaded frame instead of the resource frame
+    cross_table: bool = False
+    # (input name, column) pairs a cross-table kernel reads from other inputs
+    table_columns: tuple[tuple[str, str], ...] = ()
+    # Kernel reads derived column views from a shared ColumnCache (cross-table
+    # kernels: reference-key indexes from the run's ReferenceIndexes)
+    uses_cache: bool = False
+    # Canonical JSON of the rule config (result-cache identity)
+    spec: str = ""
+
+    def run(
+        self,
+        df: pd.DataFrame,
+        frames: dict[str, pd.DataFrame],
+        cache: ColumnCache | ReferenceIndexes | None = None,
+    ) -> tuple[str, dict[str, Any]]:
+        if self.cross_table:
+            if self.uses_cache and cache is not None:
+                return self.kernel(frames, cache=cache)
+            return self.kernel(frames)
+        if self.uses_cache and cache is not None:
+            return self.kernel(df, cache=cache)
+        return self.kernel(df)
+
+
+@dataclass(frozen=True)
+class _ResourceGroup:
+    pattern: str
+    match: Callable[[str], bool]
+    rules: tuple[CompiledRule, ...]
+
+
+@dataclass
+class ExecutionPlan:
+    """
+    A rulepack compiled for repeated execution.
+
+    Holds the resource patterns as precompiled matchers and every rule bound to its
+    kernel. Rule lookups are memoized per filename, so running the same plan over
+    many inputs pays the setup cost once.
+    """
+
+    rulepack_id: str
+    rulepack_version: str
+    groups: tuple[_ResourceGroup, ...]
+    _by_name: dict[str, tuple[CompiledRule, ...]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
+    def rules_for(self, path: Path) -> tuple[CompiledRule, ...]:
+        """Rules applicable to path, in report order (sorted by rule id)."""
+        name = path.name
+        hit = self._by_name.get(name)
+        if hit is None:
+            acc = [r for g in self.groups if g.match(name) for r in g.rules]
+            hit = tuple(sorted(acc, key=lambda r: r.id))
+            self._by_name[name] = hit
+        return hit
+
+    def columns_for(self, path: Path) -> dict[str, tuple[str, ...]]:
+        """Group the applicable rules by the resource columns they touch (column -> rule ids)."""
+        by_col: dict[str, list[str]] = {}
+        for r in self.rules_for(path):
+            for c in r.columns:
+                by_col.setdefault(c, []).append(r.id)
+        return {c: tuple(ids) for c, ids in sorted(by_col.items())}
+
+    def projection(self, inputs_map: dict[str, Path]) -> dict[str, set[str]]:
+        """
+        Columns to load per input: those its own rules reference, plus any
+        fields that cross-table rules (on any input) read from it.
+        """
+        need: dict[str, set[str]] = {name: set() for name in inputs_map}
+        for name, path in inputs_map.items():
+            for r in self.rules_for(path):
+                need[name].update(r.columns)
+                for table, col in r.table_columns:
+                    if table in need:
+                        need[table].add(col)
+        return need
+
+
+class _GlobMatcher:
+    # Same semantics as fnmatch.fnmatch, with the translation done once
+    # (a class rather than a closure so plans can be sent to worker processes)
+    def __init__(self, pattern: str):
+        self.rx = re.compile(translate(os.path.normcase(pattern)))
+
+    def __call__(self, name: str) -> bool:
+        return self.rx.match(os.path.normcase(name)) is not None
+
+
+class _OldSchemaMatcher:
+    # Old schema: exact filename, or glob only when the pattern has a '*'
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.glob = _GlobMatcher(pattern) if "*" in pattern else None
+
+    def __call__(self, name: str) -> bool:
+        return name == self.pattern or (self.glob is not None and self.glob(name))
+
+
+def _unknown_rule_type(rtype: str) -> tuple[str, dict[str, Any]]:
+    return "FAIL", {
+        "error": "unknown_rule_type",
+        "type": rtype,
+        "message": (
+            f"Unknown rule type '{rtype}'. "
+            "This rulepack may require a newer version of fairy-core. "
+            "Please upgrade fairy-core and re-run."
+        ),
+        "supported_types": sorted(CHECK_TYPES),
+    }
 
-def _sha256(path: Path) -> str:
-    h = sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
 
+def _unknown_rule_kernel(_df: pd.DataFrame, rtype: str) -> tuple[str, dict[str, Any]]:
+    return _unknown_rule_type(rtype)
+
+
+def _compile_rule(r: dict) -> CompiledRule:
+    rule_id = r.get("id", "")
+    rtype = (r.get("type", "") or "").strip()
+    severity = (r.get("severity", "fail") or "fail").lower()
+    rem_col = r.get("remediation_link_column")
+    rem_label = r.get("remediation_link_label")
+    rem = {"severity": severity, "rem_col": rem_col, "rem_label": rem_label}
+    rem_cols = (rem_col,) if rem_col else ()
+    rule_spec = json.dumps(r, sort_keys=True, default=str)
+
+    def _rule(kernel, columns=(), cross_table=False, table_columns=(), uses_cache=True):
+        cols = tuple(dict.fromkeys(c for c in (*columns, *rem_cols) if isinstance(c, str) and c))
+        return CompiledRule(
+            rule_id,
+            rtype,
+            severity,
+            kernel,
+            cols,
+            cross_table,
+            table_columns,
+            uses_cache,
+            spec=rule_spec,
+        )
 
-def _resource_matches(pattern: str, path: Path) -> bool:
-    if not pattern:
-        return False
-    return fnmatch(path.name, pattern)
+    if rtype in ("dup", "no_duplicate_rows"):
+        keys = r.get("keys", [])
+        return _rule(partial(check_dup, keys=keys, **rem), keys or (), uses_cache=False)
+
+    if rtype == "unique":
+        cols = r.get("columns", [])
+        return _rule(partial(check_unique, columns=cols, **rem), cols or (), uses_cache=False)
+
+    if rtype == "enum":
+        col = r.get("column")
+        allow = r.get("allow", [])
+        normalize = r.get("normalize", {}) or {}
+        kernel = partial(
+            _enum_kernel,
+            column=col,
+            allow=allow,
+            allowed=_prepare_allow(allow, normalize),
+            normalize=normalize,
+            **rem,
+        )
+        return _rule(kernel, (col,))
+
+    if rtype == "range":
+        col = r.get("column")
+        kernel = partial(
+            check_range,
+            column=col,
+            mn=r.get("min", None),
+            mx=r.get("max", None),
+            inclusive=r.get("inclusive", True),
+            **rem,
+        )
+        return _rule(kernel, (col,))
+
+    if rtype == "foreign_key":
+        frm = r.get("from", {}) or {}
+        to = r.get("to", {}) or {}
+        from_fields, to_fields = fk_fields(frm), fk_fields(to)
+        kernel = partial(
+            _check_foreign_key,
+            from_table=frm.get("table", ""),
+            from_fields=from_fields,
+            to_table=to.get("table", ""),
+            to_fields=to_fields,
+            severity=severity,
+            composite="fields" in frm or "fields" in to,
+        )
+        table_cols = tuple(
+            (spec["table"], f)
+            for spec, fields in ((frm, from_fields), (to, to_fields))
+            if isinstance(spec.get("table"), str)
+            for f in fields
+        )
+        return _rule(kernel, cross_table=True, table_columns=table_cols)
+
+    if rtype == "required":
+        cols = r.get("columns", []) or r.get("cols", [])
+        return _rule(partial(check_required, columns=cols, **rem), cols or ())
+
+    if rtype == "url":
+        col = r.get("column")
+        schemes = r.get("schemes") or r.get("scheme")
+        allow = set(schemes or ["http", "https"])
+        kernel = partial(
+            _url_kernel,
+            column=col,
+            allow=allow,
+            allow_lower=frozenset(x.lower() for x in allow),
+            **rem,
+        )
+        return _rule(kernel, (col,))
+
+    if rtype == "non_empty_trimmed":
+        col = r.get("column")
+        return _rule(partial(check_non_empty_trimmed, column=col, **rem), (col,))
+
+    if rtype == "regex":
+        col = r.get("column")
+        regex_pattern = r.get("regex")
+        mode = (r.get("mode") or "not_matches").strip()
+        rx, config_error = _prepare_regex(regex_pattern, mode)
+        kernel = partial(
+            _regex_kernel,
+            column=col,
+            regex=regex_pattern,
+            rx=rx,
+            config_error=config_error,
+            mode=mode,
+            ignore_empty=bool(r.get("ignore_empty", True)),
+            **rem,
+        )
+        return _rule(kernel, (col,))
 
+    return _rule(partial(_unknown_rule_kernel, rtype=rtype), uses_cache=False)
 
-def _infer_sep(path: Path) -> str:
-    suf = path.suffix.lower()
-    if suf in {".tsv", ".tab"}:
-        return "\t"
-    return ","
 
+def compile_rulepack(rulepack: dict) -> ExecutionPlan:
+    """
+    Compile a rulepack (new or old schema) into an ExecutionPlan.
 
-def _read_table(path: Path, delimiter: str | None = None) -> pd.DataFrame:
-    sep = delimiter if delimiter is not None else _infer_sep(path)
-    return pd.read_csv(
-        path,
-        sep=sep,
-        dtype=str,
-        keep_default_na=False,  # keep empty strings as ""
-    )
+    Each rule is resolved to its kernel once; regexes, normalized enum allow-lists,
+    URL scheme sets and resource glob patterns are all prepared here rather than
+    on every run.
+    """
+    rp_id, rp_ver = _extract_meta(rulepack)
+
+    # Schema branches (new vs old)
+    new_resources = (rulepack.get("resources") or []) if isinstance(rulepack, dict) else []
+    old_rules = (rulepack.get("rules") or []) if isinstance(rulepack, dict) else []
+
+    groups: list[_ResourceGroup] = []
+    if new_resources:
+        for res in new_resources:
+            pat = res.get("pattern")
+            if not pat:
+                continue
+            rules = tuple(_compile_rule(r) for r in (res.get("rules", []) or []))
+            groups.append(_ResourceGroup(pat, _GlobMatcher(pat), rules))
+    elif old_rules:
+        for r in old_rules:
+            rr = _normalize_old_rule(r)
+            pat = rr.get("_pattern", "")
+            if not pat:
+                continue
+            groups.append(_ResourceGroup(pat, _OldSchemaMatcher(pat), (_compile_rule(rr),)))
+
+    return ExecutionPlan(rulepack_id=rp_id, rulepack_version=rp_ver, groups=tuple(groups))
+
+
+def _execute_rule(
+    rule: CompiledRule,
+    df: pd.DataFrame,
+    frames: dict[str, pd.DataFrame],
+    cache: ColumnCache | ReferenceIndexes | None = None,
+) -> tuple[str, dict[str, Any]]:
+    with timing.measure(id(rule), len(df)), hooks.rule_span(rule.id, len(df)):
+        try:
+            return rule.run(df, frames, cache)
+        except Exception as e:
+            return "FAIL", {"error": "runtime_error", "message": str(e)}
+
+
+RuleResult = tuple[CompiledRule, str, dict[str, Any]]
+# Per-input results before cross-table rules run (None marks a cross-table rule)
+LocalResults = list[tuple[str, dict[str, Any]] | None]
+# Per-rule timings of one input task (None for cross-table rules) and its other seconds
+InputTimings = tuple[list[RuleTiming | None], float]
+
+
+def _in_memory_results(
+    plan: ExecutionPlan, inputs_map: dict[str, Path]
+) -> tuple[dict[str, InputStats], dict[str, list[RuleResult]]]:
+    # Load all inputs once (enables cross-table checks), projected onto the
+    # columns the applicable rules reference and hashed in the same pass
+    projection = plan.projection(inputs_map)
+    frames: dict[str, pd.DataFrame] = {}
+    stats: dict[str, InputStats] = {}
+    with timing.phase("load"):
+        for name, path in inputs_map.items():
+            t0 = time.perf_counter()
+            # delimiter override later via CLI threading
+            frames[name], stats[name] = read_input(path, usecols=projection[name])
+            seconds = time.perf_counter() - t0
+            HOOKS.emit("on_load", input=name, rows=stats[name].rows, seconds=seconds)
+
+    indexes = ReferenceIndexes(frames)
+    results: dict[str, list[RuleResult]] = {}
+    for name, path in inputs_map.items():
+        df = frames[name]
+        cache = ColumnCache(df)
+        with hooks.input_scope(name):
+            results[name] = [
+                (rule, *_execute_rule(rule, df, frames, indexes if rule.cross_table else cache))
+                for rule in plan.rules_for(path)
+            ]
+    return stats, results
+
+
+def _cross_table_fields(plan: ExecutionPlan, inputs_map: dict[str, Path]) -> dict[str, set[str]]:
+    """Per input, the fields that cross-table rules (on any input) read from it."""
+    fields: dict[str, set[str]] = {name: set() for name in inputs_map}
+    for path in inputs_map.values():
+        for rule in plan.rules_for(path):
+            for table, col in rule.table_columns:
+                if table in fields:
+                    fields[table].add(col)
+    return fields
+
+
+def _key_frame(df: pd.DataFrame, fields: Iterable[str]) -> pd.DataFrame:
+    """Distinct rows of df over the cross-table key fields it has."""
+    cols = sorted(c for c in set(fields) if c in df.columns)
+    if not cols:
+        return pd.DataFrame()
+    return df[cols].drop_duplicates(ignore_index=True)
+
+
+def _input_results(
+    path: Path,
+    rules: tuple[CompiledRule, ...],
+    usecols: set[str],
+    key_fields: set[str],
+    chunksize: int | None = None,
+    index_path: Path | None = None,
+    timings: bool = False,
+    name: str | None = None,
+    limits: ScanLimits | None = None,
+) -> tuple[InputStats, LocalResults, pd.DataFrame, InputTimings | None]:
+    """
+    Run one input's own rules, independently of every other input.
+
+    Returns (input stats, per-rule results with None for cross-table rules, distinct
+    rows over key_fields, timings or None). Module-level so it can run in a worker
+    process. With index_path, row-local rules re-evaluate only changed rows (see
+    fairy.validation.incremental). With timings, the per-rule timings (None for
+    cross-table rules) and the rest of the task's wall time ("load") are returned.
+    name is the input's name in hook events. limits apply to streamed inputs only.
+    """
+    args = (path, rules, usecols, key_fields, chunksize, index_path, limits)
+    with hooks.input_scope(name):
+        if not timings:
+            return (*_local_results(*args), None)
+        with Stopwatch() as watch:
+            out = _local_results(*args)
+    load = watch.phases["total"] - watch.phases["rules"]
+    return (*out, ([watch.get(name, id(r)) for r in rules], load))
+
+
+def _local_results(
+    path: Path,
+    rules: tuple[CompiledRule, ...],
+    usecols: set[str],
+    key_fields: set[str],
+    chunksize: int | None,
+    index_path: Path | None,
+    limits: ScanLimits | None = None,
+) -> tuple[InputStats, LocalResults, pd.DataFrame]:
+    if chunksize:
+        from .streaming import stream_input
+
+        return stream_input(path, rules, usecols, key_fields, chunksize, limits)
+
+    t0 = time.perf_counter()
+    df, stats = read_input(path, usecols=usecols)
+    HOOKS.emit("on_load", rows=stats.rows, seconds=time.perf_counter() - t0)
+    if index_path is not None:
+        from .incremental import incremental_results
+
+        return stats, incremental_results(df, rules, index_path), _key_frame(df, key_fields)
+
+    cache = ColumnCache(df)
+    local: LocalResults = [
+        None if r.cross_table else _execute_rule(r, df, {}, cache) for r in rules
+    ]
+    return stats, local, _key_frame(df, key_fields)
+
+
+def _locate_fk_rows(
+    rule: CompiledRule,
+    status: str,
+    ev: dict[str, Any],
+    inputs_map: dict[str, Path],
+    indexes: ReferenceIndexes,
+    chunksize: int | None,
+    stats: dict[str, InputStats],
+    limit: int | None = None,
+) -> tuple[str, dict[str, Any]]:
+    """
+    Replace foreign_key counts found on distinct key rows with per-row ones
+    (a lower bound once limit offending rows are found).
+    """
+    if "rows" not in ev or "error" in ev:
+        return status, ev
+    kw = rule.kernel.keywords
+    source = stats.get(kw["from_table"])
+    try:
+        rows = source.rows if source is not None else 0
+        with timing.measure(id(rule), rows), hooks.rule_span(rule.id, rows):
+            index = indexes.get(kw["to_table"], kw["to_fields"])
+            path = inputs_map[kw["from_table"]]
+            count, rows = locate_missing_rows(path, kw["from_fields"], index, chunksize, limit)
+    except Exception as e:
+        return "FAIL", {"error": "runtime_error", "message": str(e)}
+    ev = {**ev, "count": count, "rows": rows}
+    return status, lower_bound(ev) if limit is not None and count >= limit else ev
+
+
+def _rule_key(
+    cache: ResultCache, rule: CompiledRule, name: str, path: Path, shas: dict[str, str | None]
+) -> str | None:
+    """Cache key of one rule's result on input name; None while a sha256 it needs is unknown."""
+    if rule.cross_table:
+        # depends on every table it reads, and on which tables exist at all
+        tables = {t: shas.get(t) for t, _ in rule.table_columns}
+        if any(tables[t] is None for t in tables if t in shas):
+            return None
+        return cache.rule_key(rule.spec, {"tables": tables, "names": sorted(shas)}, None)
+    if shas.get(name) is None:
+        return None
+    return cache.rule_key(rule.spec, {name: shas[name]}, infer_sep(path))
+
+
+def _cached_results(plan: ExecutionPlan, inputs_map: dict[str, Path], cache: ResultCache) -> tuple[
+    dict[str, str | None],
+    dict[str, InputStats],
+    dict[str, dict[int, Any]],
+    dict[str, str],
+    dict[str, str | None],
+]:
+    """
+    Look every rule up in the result cache.
+
+    An input's sha256 is taken from the cache's record of its stat stamp; an
+    input without one (new, or edited since) is not hashed here, as parsing it
+    hashes it anyway: its rules, and the cross-table rules reading it, all run.
+
+    Returns (sha256 per input or None, stats of inputs that need no parsing,
+    cached results per input keyed by rule position, cache key per uncached
+    rule id that has one yet, stat key per input).
+    """
+    stamps = {name: cache.stat_key(path) for name, path in inputs_map.items()}
+    shas: dict[str, str | None] = {}
+    for name in inputs_map:
+        seen = cache.get(stamps[name]) if stamps[name] else None
+        shas[name] = seen.get("sha256") if isinstance(seen, dict) else None
+    stats: dict[str, InputStats] = {}
+    known: dict[str, dict[int, Any]] = {name: {} for name in inputs_map}
+    keys: dict[str, str] = {}
+    for name, path in inputs_map.items():
+        sha = shas[name]
+        if sha is None:
+            continue
+        facts = cache.get(cache.input_key(sha, infer_sep(path)))
+        if isinstance(facts, dict) and "rows" in facts:
+            stats[name] = InputStats(sha, path.stat().st_size, int(facts["rows"]))
+        for i, rule in enumerate(plan.rules_for(path)):
+            key = _rule_key(cache, rule, name, path, shas)
+            if key is None:
+                continue
+            hit = cache.get(key)
+            if isinstance(hit, list) and len(hit) == 2:
+                known[name][i] = tuple(hit)
+            else:
+                keys[f"{name}\0{i}"] = key
+    return shas, stats, known, keys, stamps
+
+
+def _key_index_paths(
+    rules: dict[str, tuple[CompiledRule, ...]],
+    known: dict[str, dict[int, Any]],
+    inputs_map: dict[str, Path],
+    shas: dict[str, str | None],
+    cache: ResultCache,
+) -> dict[tuple[str, tuple[str, ...]], Path]:
+    """Stored key index location per (table, fields) that a pending foreign_key targets."""
+    paths = {}
+    for name in inputs_map:
+        for i, rule in enumerate(rules[name]):
+            if not rule.cross_table or i in known[name]:
+                continue
+            kw = rule.kernel.keywords
+            table, fields = kw.get("to_table"), kw.get("to_fields")
+            if table in inputs_map and fields and shas.get(table):
+                sep = infer_sep(inputs_map[table])
+                paths[(table, fields)] = cache.key_index_path(shas[table], fields, sep)
+    return paths
+
+
+def _key_columns(
+    rule: CompiledRule, stored: dict[tuple[str, tuple[str, ...]], Any]
+) -> set[tuple[str, str]]:
+    """(table, column) pairs a cross-table rule needs loaded, minus a stored reference side."""
+    cols = set(rule.table_columns)
+    kw = rule.kernel.keywords
+    if (kw.get("to_table"), kw.get("to_fields")) in stored:
+        cols -= {(kw["to_table"], f) for f in kw["to_fields"]}
+        cols |= {(kw["from_table"], f) for f in kw["from_fields"]}
+    return cols
+
+
+def _resource_results(
+    plan: ExecutionPlan,
+    inputs_map: dict[str, Path],
+    *,
+    chunksize: int | None = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    limits: ScanLimits | None = None,
+) -> tuple[dict[str, InputStats], dict[str, list[RuleResult]]]:
+    """
+    Run each input's rules as an independent task (optionally in a process pool),
+    then the cross-table rules once every input's key sets are gathered.
+
+    Cross-table rules see each input as its distinct rows over the key fields they
+    read; a foreign_key rule that finds missing keys then rescans the key fields of
+    its source input for the offending row positions. Results are merged in
+    inputs_map order, so the report does not depend on jobs.
+
+    With a result cache, rules whose (input sha256, rule, version) entry exists are
+    not evaluated, and an input is only parsed if one of its rules (or a pending
+    cross-table rule reading it) missed; row-local rules of a changed input then
+    re-evaluate only its new rows (fairy.validation.incremental), and the
+    referenced keys of a foreign_key are read from a stored key index of the
+    unchanged reference table instead of parsing it (fairy.validation.key_index).
+
+    With limits (fairy.validation.limits), streamed inputs stop early; under
+    fail_fast the inputs after the first one with a FAIL (in inputs_map order,
+    whatever jobs is) are not run and, like pending cross-table rules, are
+    reported as SKIPPED. Results cut short are not cached.
+    """
+    limits = limits or ScanLimits()
+    rules = {name: plan.rules_for(path) for name, path in inputs_map.items()}
+    stats: dict[str, InputStats] = {}
+    known: dict[str, dict[int, Any]] = {name: {} for name in inputs_map}
+    keys: dict[str, str] = {}
+    index_paths: dict[tuple[str, tuple[str, ...]], Path] = {}
+    stored: dict[tuple[str, tuple[str, ...]], KeyIndex] = {}
+    shas: dict[str, str | None] = {}
+    stamps: dict[str, str | None] = {}
+    if cache is not None:
+        with timing.phase("hash"):
+            shas, stats, known, keys, stamps = _cached_results(plan, inputs_map, cache)
+        index_paths = _key_index_paths(rules, known, inputs_map, shas, cache)
+        for spec, index_path in index_paths.items():
+            index = cache.open_key_index(index_path)
+            if index is not None:
+                stored[spec] = index
+
+    # Fields that pending cross-table rules need from each input
+    key_fields: dict[str, set[str]] = {name: set() for name in inputs_map}
+    for name in inputs_map:
+        for i, rule in enumerate(rules[name]):
+            if rule.cross_table and i not in known[name]:
+                for table, col in _key_columns(rule, stored):
+                    if table in key_fields:
+                        key_fields[table].add(col)
+
+    watch = timing.active()
+    timed = watch is not None
+    tasks = {}
+    for name, path in inputs_map.items():
+        pending = tuple(
+            r for i, r in enumerate(rules[name]) if i not in known[name] and not r.cross_table
+        )
+        if pending or key_fields[name] or name not in stats:
+            usecols = {c for r in pending for c in r.columns} | key_fields[name]
+            # Row-level reuse needs the whole frame; streamed inputs are re-evaluated in full
+            index_path = None
+            if cache is not None and not chunksize:
+                index_path = cache.row_index_path(path, infer_sep(path))
+            task = (
+                path,
+                pending,
+                usecols,
+                key_fields[name],
+                chunksize,
+                index_path,
+                timed,
+                name,
+                limits or None,
+            )
+            tasks[name] = task
+
+    # fail_fast: a cached FAIL already settles the run
+    stop = limits.fail_fast and any(r[0] == "FAIL" for k in known.values() for r in k.values())
+    done: dict[str, Any] = {}
+    if not stop and jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            futures = {name: pool.submit(_input_results, *task) for name, task in tasks.items()}
+            for name, f in futures.items():
+                if stop:
+                    f.cancel()
+                    continue
+                done[name] = f.result()
+                stop = limits.fail_fast and _has_fail(done[name][1])
+    else:
+        for name, task in tasks.items():
+            if stop:
+                break
+            done[name] = _input_results(*task)
+            stop = limits.fail_fast and _has_fail(done[name][1])
+    if stop:
+        unread = [name for name in inputs_map if name not in done and name not in stats]
+        stats.update(_unread_stats({name: inputs_map[name] for name in unread}, shas))
+
+    key_frames = {name: done[name][2] if name in done else pd.DataFrame() for name in inputs_map}
+    for table, fields in stored:
+        # The fields exist (the index was built from them); the rows live on disk
+        frame = key_frames[table]
+        absent = [f for f in fields if f not in frame.columns]
+        if absent:
+            key_frames[table] = frame.reindex(columns=[*frame.columns, *absent])
+    indexes = ReferenceIndexes(key_frames, stored)
+    for name, (st, _local, _keys, task_timings) in done.items():
+        stats[name] = st
+        if watch is not None and task_timings is not None:
+            rule_timings, load = task_timings
+            watch.phases["load"] += load
+            with hooks.input_scope(name):
+                for rule, t in zip(tasks[name][1], rule_timings, strict=True):
+                    if t is not None:
+                        watch.record(id(rule), t)
+
+    # Every input's sha256, now that the ones parsed this run were hashed doing so
+    hashed = {name: stats[name].sha256 for name in inputs_map}
+    results: dict[str, list[RuleResult]] = {}
+    for name in inputs_map:
+        computed = iter(done[name][1] if name in done else ())
+        out: list[RuleResult] = []
+        for i, rule in enumerate(rules[name]):
+            if i in known[name]:
+                status, ev = known[name][i]
+                if watch is not None:
+                    with hooks.input_scope(name):
+                        watch.record(id(rule), RuleTiming(cached=True))
+            else:
+                if rule.cross_table and stop:
+                    status, ev = skipped()
+                elif rule.cross_table:
+                    with hooks.input_scope(name):
+                        status, ev = _execute_rule(rule, key_frames[name], key_frames, indexes)
+                        status, ev = _locate_fk_rows(
+                            rule,
+                            status,
+                            ev,
+                            inputs_map,
+                            indexes,
+                            chunksize,
+                            stats,
+                            limits.max_violations,
+                        )
+                    stop = limits.fail_fast and status == "FAIL"
+                elif name in done:
+                    status, ev = next(computed)
+                else:
+                    status, ev = skipped()
+                # Runtime errors may be environmental; only cache real, complete outcomes
+                final = status != SKIPPED and not ev.get(LOWER_BOUND)
+                if cache is not None and final and ev.get("error") != "runtime_error":
+                    key = keys.get(f"{name}\0{i}") or _rule_key(
+                        cache, rule, name, inputs_map[name], hashed
+                    )
+                    if key is not None:
+                        cache.put(key, [status, ev])
+            out.append((rule, status, ev))
+        results[name] = out
+
+    if cache is not None:
+        for (table, fields), index_path in _key_index_paths(
+            rules, known, inputs_map, hashed, cache
+        ).items():
+            if (table, fields) in stored or not stats[table].complete:
+                continue
+            if set(fields) <= set(key_frames[table].columns):
+                KeyIndex.build(key_frames[table], fields, index_path)
+        for name, path in inputs_map.items():
+            if name in done and stats[name].complete:
+                st = stats[name]
+                cache.put(cache.input_key(st.sha256, infer_sep(path)), {"rows": st.rows})
+            # Remember the digest under the stamp read before the run, unless the file moved since
+            if shas.get(name) is None and stamps[name] and cache.stat_key(path) == stamps[name]:
+                cache.put(stamps[name], {"sha256": hashed[name]})
+    return stats, results
+
+
+def _sample_estimate(ev: dict[str, Any], info: Any) -> dict[str, Any]:
+    from .sampling import estimate
+
+    return estimate(ev, info)
+
+
+def _has_fail(local: LocalResults) -> bool:
+    return any(r is not None and r[0] == "FAIL" for r in local)
+
+
+def _unread_stats(
+    inputs_map: dict[str, Path], shas: dict[str, str | None] | None = None
+) -> dict[str, InputStats]:
+    """Attestation stats of inputs a stopped run never parsed: hashed, rows unknown."""
+    shas = shas or {}
+    unhashed = [name for name in inputs_map if shas.get(name) is None]
+    if unhashed:
+        digests = sha256_files([inputs_map[name] for name in unhashed]).digests
+        shas = {**shas, **dict(zip(unhashed, digests, strict=True))}
+    return {
+        name: InputStats(shas[name], path.stat().st_size, 0, complete=False)
+        for name, path in inputs_map.items()
+    }
 
 
 def run_rulepack(
     inputs_map: dict[str, Path],
-    rulepack: dict,
+    rulepack: dict | ExecutionPlan,
     rp_path: Path,
     now_iso: str,
     *,
     params: dict[str, Any] | None = None,
+    chunksize: int | None = None,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    evidence: EvidencePolicy | None = None,
+    timings: bool = False,
+    fail_fast: bool = False,
+    max_violations: int | None = None,
+    sample: SampleSpec | None = None,
 ) -> dict[str, Any]:
     """
     Validate one or more inputs using a rulepack.
@@ -115,34 +852,88 @@ def run_rulepack(
     inputs_map: name -> CSV Path
       - legacy single-file mode: {"default": <file>}
       - folder/explicit multi:   {"artworks": <path>, "artists": <path>, ...}
+    rulepack: the parsed rulepack dict, or an ExecutionPlan from compile_rulepack()
+      when the same rulepack is run many times.
+    chunksize: stream each input in chunks of this many rows instead of loading it
+      whole (see fairy.validation.streaming); the report is the same.
+    jobs: run each input's rules in a pool of this many worker processes; foreign
+      key rules run afterwards on the gathered key sets. The report is the same.
+    cache: serve unchanged (input, rule) results from this ResultCache and store
+      the newly evaluated ones (see fairy.validation.result_cache).
+    evidence: cap offending-row lists in the evidence (see fairy.validation.evidence);
+      by default every row is listed.
+    timings: add a `timing` block (seconds, rows, peak_bytes) to every rule entry
+      and a run-level one (seconds per phase) to the report; see
+      fairy.validation.timing. Off by default: memory tracing slows the run down.
+    fail_fast: stop at the first rule that FAILs; rules and inputs not reached are
+      reported as SKIPPED (see fairy.validation.limits).
+    max_violations: each rule stops scanning once it has found this many offending
+      rows and marks its count `count_is_lower_bound`.
+      Either one streams the inputs (in chunks of chunksize, or the default).
+    sample: run the row-local rules on a random sample of each input's rows and
+      add an `estimate` block (violation rate with a 95% interval) to each; see
+      fairy.validation.sampling. chunksize and jobs do not apply; cache, fail_fast
+      and max_violations cannot be combined with it.
     """
-    # ---- Read meta from either schema
-    rp_id, rp_ver = _extract_meta(rulepack)
-
-    # Schema branches (new vs old)
-    new_resources = (rulepack.get("resources") or []) if isinstance(rulepack, dict) else []
-    old_rules = (rulepack.get("rules") or []) if isinstance(rulepack, dict) else []
-
-    # ---- Load all inputs once (enables cross-table checks)
-    frames: dict[str, pd.DataFrame] = {}
-    for name, path in inputs_map.items():
-        frames[name] = _read_table(path)  # delimiter override later via CLI threading
-
-    # ---- Attestation + metadata echo (non-breaking)
-    att_inputs = []
-    for name, p in inputs_map.items():
-        try:
-            att_inputs.append(
-                {
-                    "name": name,
-                    "path": str(p),
-                    "sha256": _sha256(p),
-                    "bytes": int(p.stat().st_size),
-                    "rows": int(len(frames[name])),
-                }
+    if timings:
+        # Same run under a Stopwatch; rule entries pick their timing up from it
+        with Stopwatch() as watch:
+            report = run_rulepack(
+                inputs_map,
+                rulepack,
+                rp_path,
+                now_iso,
+                params=params,
+                chunksize=chunksize,
+                jobs=jobs,
+                cache=cache,
+                evidence=evidence,
+                fail_fast=fail_fast,
+                max_violations=max_violations,
+                sample=sample,
             )
-        except Exception:
-            att_inputs.append({"name": name, "path": str(p), "sha256": "", "bytes": 0, "rows": 0})
+        report["timing"] = watch.run_block()
+        return report
+
+    watch = timing.active()
+    plan = rulepack if isinstance(rulepack, ExecutionPlan) else compile_rulepack(rulepack)
+    rp_id, rp_ver = plan.rulepack_id, plan.rulepack_version
+    limits = ScanLimits(fail_fast, max_violations)
+    if limits and not chunksize:
+        # Stopping early needs a chunked read
+        from .streaming import DEFAULT_CHUNKSIZE
+
+        chunksize = DEFAULT_CHUNKSIZE
+
+    infos = None  # sampled runs: how each input was sampled
+    if sample is not None:
+        if cache is not None or limits:
+            raise ValueError("sample cannot be combined with cache, fail_fast or max_violations")
+        from .sampling import sampled_results
+
+        sample = sample.seeded()
+        stats, results, infos = sampled_results(plan, inputs_map, sample)
+    elif chunksize or jobs > 1 or cache is not None:
+        stats, results = _resource_results(
+            plan, inputs_map, chunksize=chunksize, jobs=jobs, cache=cache, limits=limits
+        )
+    else:
+        stats, results = _in_memory_results(plan, inputs_map)
+    report_start = time.perf_counter()
+
+    # ---- Attestation + metadata echo (non-breaking); hashed while the inputs were read
+    att_inputs = [
+        {
+            "name": name,
+            "path": str(p),
+            "sha256": stats[name].sha256,
+            "bytes": int(stats[name].bytes),
+            "rows": int(stats[name].rows),
+            # Reading stopped early (limits): rows is a lower bound
+            **({} if stats[name].complete else {"rows_is_lower_bound": True}),
+        }
+        for name, p in inputs_map.items()
+    ]
 
     try:
         core_version = md.version("fairy-core")
@@ -170,128 +961,40 @@ def run_rulepack(
     }
 
     # ---- Per-resource rules (match by pattern against filename)
+    spilled: list[dict[str, Any]] = []
     for name, path in inputs_map.items():
-        applicable: list[dict[str, Any]] = []
-
-        if new_resources:
-            for res in new_resources:
-                pat = res.get("pattern")
-                if pat and _resource_matches(pat, path):
-                    applicable.extend(res.get("rules", []) or [])
-        elif old_rules:
-            applicable.extend(_old_schema_applicable_rules(old_rules, path))
-
-        df = frames[name]
         resource_rules: list[dict[str, Any]] = []
 
-        for r in sorted(applicable, key=lambda x: x.get("id", "")):
-            rule_id = r.get("id", "")
-            rtype = (r.get("type", "") or "").strip()
-            severity = (r.get("severity", "fail") or "fail").lower()
-            status = "PASS"
-            evidence: dict[str, Any] = {}
-            rem_col = r.get("remediation_link_column")
-            rem_label = r.get("remediation_link_label")
-
-            if rtype not in CHECK_TYPES:
-                status, evidence = "FAIL", {
-                    "error": "unknown_rule_type",
-                    "type": rtype,
-                    "message": (
-                        f"Unknown rule type '{rtype}'. "
-                        "This rulepack may require a newer version of fairy-core. "
-                        "Please upgrade fairy-core and re-run."
-                    ),
-                    "supported_types": sorted(CHECK_TYPES),
-                }
-            else:
-                try:
-                    if rtype in ("dup", "no_duplicate_rows"):
-                        keys = r.get("keys", [])
-                        status, evidence = check_dup(df, keys, severity, rem_col, rem_label)
-
-                    elif rtype == "unique":
-                        cols = r.get("columns", [])
-                        status, evidence = check_unique(df, cols, severity, rem_col, rem_label)
-
-                    elif rtype == "enum":
-                        col = r.get("column")
-                        allow = r.get("allow", [])
-                        normalize = r.get("normalize", {}) or {}
-                        status, evidence = check_enum(
-                            df, col, allow, normalize, severity, rem_col, rem_label
-                        )
-
-                    elif rtype == "range":
-                        col = r.get("column")
-                        mn = r.get("min", None)
-                        mx = r.get("max", None)
-                        inclusive = bool(r.get("inclusive", True))
-                        status, evidence = check_range(
-                            df, col, mn, mx, inclusive, severity, rem_col, rem_label
-                        )
-
-                    elif rtype == "foreign_key":
-                        frm = r.get("from", {}) or {}
-                        to = r.get("to", {}) or {}
-                        status, evidence = _check_foreign_key(
-                            frames,
-                            from_table=frm.get("table", ""),
-                            from_field=frm.get("field", ""),
-                            to_table=to.get("table", ""),
-                            to_field=to.get("field", ""),
-                            severity=severity,
-                        )
-
-                    elif rtype == "required":
-                        cols = r.get("columns", []) or r.get("cols", [])
-                        status, evidence = check_required(df, cols, severity, rem_col, rem_label)
-
-                    elif rtype == "url":
-                        col = r.get("column")
-                        schemes = r.get("schemes") or r.get("scheme")
-                        status, evidence = check_url(df, col, schemes, severity, rem_col, rem_label)
-
-                    elif rtype == "non_empty_trimmed":
-                        col = r.get("column")
-                        status, evidence = check_non_empty_trimmed(
-                            df, col, severity, rem_col, rem_label
-                        )
-                    elif rtype == "regex":
-                        col = r.get("column")
-                        regex_pattern = r.get("regex")
-                        mode = (r.get("mode") or "not_matches").strip()
-                        ignore_empty = bool(r.get("ignore_empty", True))
-
-                        status, evidence = check_regex(
-                            df,
-                            column=col,
-                            regex=regex_pattern,
-                            mode=mode,
-                            ignore_empty=ignore_empty,
-                            severity=severity,
-                            rem_col=rem_col,
-                            rem_label=rem_label,
-                        )
-
-                except Exception as e:
-                    status, evidence = "FAIL", {"error": "runtime_error", "message": str(e)}
-
-            resource_rules.append(
-                {
-                    "id": rule_id,
-                    "type": rtype,
-                    "severity": severity,
-                    "status": status,
-                    "evidence": evidence,
-                }
-            )
+        for rule, status, ev in results[name]:
+            estimate = None
+            if infos is not None and status != SKIPPED and "error" not in ev:
+                estimate = _sample_estimate(ev, infos[name])
+            if evidence is not None:
+                ev, cut = bound_evidence(ev, evidence)
+                spilled += [
+                    {"resource": name, "rule": rule.id, "path": where, "rows": rows}
+                    for where, rows in cut
+                ]
+            entry = {
+                "id": rule.id,
+                "type": rule.type,
+                "severity": rule.severity,
+                "status": status,
+                "evidence": ev,
+            }
+            if estimate is not None:
+                entry["estimate"] = estimate
+            if watch is not None:
+                entry["timing"] = (watch.get(name, id(rule)) or RuleTiming()).as_dict()
+            resource_rules.append(entry)
 
             # tally summary
             if status == "FAIL":
                 report["summary"]["fail"] += 1
             elif status == "WARN":
                 report["summary"]["warn"] += 1
+            elif status == SKIPPED:
+                report["summary"]["skipped"] = report["summary"].get("skipped", 0) + 1
             else:
                 report["summary"]["pass"] += 1
 
@@ -299,6 +1002,21 @@ def run_rulepack(
         res_block = {"name": name, "path": str(path), "rules": resource_rules}
         report["resources"].append(res_block)
 
+    if limits:
+        report["metadata"]["limits"] = limits.metadata()
+    if sample is not None and infos is not None:
+        inputs_meta = {name: info.as_dict() for name, info in infos.items()}
+        report["metadata"]["sample"] = {**sample.metadata(), "inputs": inputs_meta}
+    if evidence is not None and evidence.max_rows is not None:
+        sidecar = str(evidence.sidecar) if evidence.sidecar is not None else None
+        report["metadata"]["evidence"] = {"max_rows": evidence.max_rows, "sidecar": sidecar}
+        if evidence.sidecar is not None:
+            t0 = time.perf_counter()
+            write_sidecar(evidence.sidecar, spilled)
+            seconds = time.perf_counter() - t0
+            HOOKS.emit("on_write", path=str(evidence.sidecar), seconds=seconds)
+    if watch is not None:
+        watch.phases["report"] += time.perf_counter() - report_start
     return report
 
 
@@ -369,8 +1087,7 @@ def check_dup(
         if k not in df.columns:
             return _column_not_found_error(k, df)
 
-    dup_mask = df.duplicated(subset=keys, keep="first")
-    dup_pos = dup_mask.to_numpy().nonzero()[0].tolist()
+    dup_pos = np.flatnonzero(duplicate_mask(df, keys, keep="first")).tolist()
 
     if dup_pos:
         rows = _rows_sorted_1based(dup_pos)
@@ -398,11 +1115,8 @@ def check_unique(
         if c not in df.columns:
             return _column_not_found_error(c, df)
 
-    # composite unique via tuple
-    series = df[columns].astype(object).apply(tuple, axis=1)
-    dup_mask = series.duplicated(keep="first")
-
-    dup_pos = dup_mask.to_numpy().nonzero()[0].tolist()
+    # composite unique via hashed row keys
+    dup_pos = np.flatnonzero(duplicate_mask(df, columns, keep="first")).tolist()
 
     if dup_pos:
         rows = _rows_sorted_1based(dup_pos)
@@ -432,6 +1146,21 @@ def _normalize(v, norm: dict[str, Any]):
     return s
 
 
+def _prepare_allow(allow: Any, normalize: dict[str, Any]) -> frozenset[Any] | None:
+    """Normalized allow-list as a hash set (None when the allow config is unusable)."""
+    if not isinstance(allow, list) or not allow:
+        return None
+    # Values are compared as strings; non-hashable entries can never match one.
+    out = set()
+    for a in allow:
+        a = _normalize(a, normalize) if normalize else a
+        try:
+            out.add(a)
+        except TypeError:
+            continue
+    return frozenset(out)
+
+
 def check_enum(
     df: pd.DataFrame,
     column: str,
@@ -440,22 +1169,49 @@ def check_enum(
     severity: str,
     rem_col=None,
     rem_label=None,
+) -> tuple[str, dict[str, Any]]:
+    return _enum_kernel(
+        df,
+        column=column,
+        allow=allow,
+        allowed=_prepare_allow(allow, normalize),
+        normalize=normalize,
+        severity=severity,
+        rem_col=rem_col,
+        rem_label=rem_label,
+    )
+
+
+def _enum_kernel(
+    df: pd.DataFrame,
+    *,
+    column: str,
+    allow: Any,
+    allowed: frozenset[Any] | None,
+    normalize: dict[str, Any],
+    severity: str,
+    rem_col=None,
+    rem_label=None,
+    cache: ColumnCache | None = None,
 ) -> tuple[str, dict[str, Any]]:
     if not column:
         return "FAIL", {"error": "config_missing_column"}
     if column not in df.columns:
         return _column_not_found_error(column, df)
-    if not isinstance(allow, list) or not allow:
+    if allowed is None:
         return "FAIL", {"error": "config_missing_allow"}
 
-    # normalize allow list if requested
-    norm_allow = [_normalize(a, normalize) for a in allow] if normalize else allow
-
-    out: list[int] = []
-    for i, v in enumerate(df[column].tolist()):
-        vv = _normalize(v, normalize or {})
-        if pd.isna(vv) or vv not in norm_allow:
-            out.append(i)
+    # Vectorized _normalize() over the distinct values: str(), then trim/casefold
+    cache = cache if cache is not None else ColumnCache(df)
+    codes, distinct = cache.distinct(column)
+    normalize = normalize or {}
+    normalized = cache.normalized(
+        column,
+        trim=bool(normalize.get("trim", False)),
+        casefold=bool(normalize.get("casefold", False)),
+    )
+    out_of_set = distinct.isna().to_numpy() | ~normalized.isin(allowed).to_numpy(dtype=bool)
+    out = np.flatnonzero(out_of_set[codes]).tolist()
 
     if out:
         rows = _rows_1based(out)
@@ -471,44 +1227,69 @@ def check_enum(
     return "PASS", {"normalized": bool(normalize)}
 
 
+# inclusive: true/false applies to both bounds; strings pick each side (pandas.between style)
+_RANGE_INCLUSIVE = {
+    "both": (True, True),
+    "neither": (False, False),
+    "left": (True, False),
+    "right": (False, True),
+}
+
+
+def _range_inclusive(inclusive: Any) -> tuple[bool, bool] | None:
+    """(min_inclusive, max_inclusive), or None for an unrecognized string."""
+    if isinstance(inclusive, str):
+        return _RANGE_INCLUSIVE.get(inclusive.strip().lower())
+    return (True, True) if bool(inclusive) else (False, False)
+
+
 def check_range(
     df: pd.DataFrame,
     column: str,
     mn,
     mx,
-    inclusive: bool,
+    inclusive: bool | str,
     severity: str,
     rem_col=None,
     rem_label=None,
+    cache: ColumnCache | None = None,
 ) -> tuple[str, dict[str, Any]]:
     if not column:
         return "FAIL", {"error": "config_missing_column"}
     if column not in df.columns:
         return _column_not_found_error(column, df)
+    bounds = _range_inclusive(inclusive)
+    if bounds is None:
+        return "FAIL", {
+            "error": "config_invalid_inclusive",
+            "inclusive": inclusive,
+            "allowed": [True, False, *_RANGE_INCLUSIVE],
+        }
+    min_inclusive, max_inclusive = bounds
 
     # numeric-only MVP; datetime can be added later
-    series = pd.to_numeric(df[column], errors="coerce")
-
-    out: list[int] = []
-    for i, val in enumerate(series.tolist()):
-        if pd.isna(val):
-            out.append(i)
-            continue
-        if mn is not None:
-            if inclusive and val < mn:
-                out.append(i)
-            if not inclusive and val <= mn:
-                out.append(i)
-        if mx is not None:
-            if inclusive and val > mx:
-                out.append(i)
-            if not inclusive and val >= mx:
-                out.append(i)
-
+    cache = cache if cache is not None else ColumnCache(df)
+    values = cache.numeric(column)
+
+    # One pass of masks; a row is reported once even if it breaks both bounds
+    non_numeric = np.isnan(values)
+    bad = non_numeric.copy()
+    if mn is not None:
+        bad |= (values < mn) if min_inclusive else (values <= mn)
+    if mx is not None:
+        bad |= (values > mx) if max_inclusive else (values >= mx)
+
+    out = np.flatnonzero(bad).tolist()
     if out:
         rows = _rows_1based(out)
 
-        ev = {"out_of_bounds": {"count": len(out), "rows": rows}}
+        ev = {
+            "out_of_bounds": {
+                "count": len(out),
+                "rows": rows,
+                "non_numeric_count": int(non_numeric.sum()),
+            }
+        }
 
         rem = _collect_remediation_links(df, rows, rem_col, rem_label)
         if rem:
@@ -522,16 +1303,30 @@ def check_range(
 # ---------------- Foreign key (multi-input) ----------------
 
 
+def _fk_echo(table: str, fields: tuple[str, ...], composite: bool) -> dict[str, Any]:
+    if composite:
+        return {"table": table, "fields": list(fields)}
+    return {"table": table, "field": fields[0]}
+
+
 def _check_foreign_key(
     frames: dict[str, pd.DataFrame],
     from_table: str,
-    from_field: str,
+    from_fields: tuple[str, ...],
     to_table: str,
-    to_field: str,
+    to_fields: tuple[str, ...],
     severity: str,
+    composite: bool = False,
+    cache: ReferenceIndexes | None = None,
 ) -> tuple[str, dict[str, Any]]:
-    if not from_table or not to_table or not from_field or not to_field:
+    if not from_table or not to_table or not from_fields or not to_fields:
         return "FAIL", {"error": "config_missing_fk_fields"}
+    if len(from_fields) != len(to_fields):
+        return "FAIL", {
+            "error": "config_fk_fields_mismatch",
+            "from": list(from_fields),
+            "to": list(to_fields),
+        }
     if from_table not in frames or to_table not in frames:
         return (
             "FAIL",
@@ -540,30 +1335,20 @@ def _check_foreign_key(
                 "message": f"Have tables {sorted(frames.keys())}; need: {from_table}, {to_table}",
             },
         )
-
-    left = (
-        frames[from_table][from_field]
-        if from_field in frames[from_table].columns
-        else pd.Series(dtype="object")
-    )
-    right = (
-        frames[to_table][to_field]
-        if to_field in frames[to_table].columns
-        else pd.Series(dtype="object")
-    )
-
-    if left.empty and from_field not in frames[from_table].columns:
-        return "FAIL", {"error": "column_not_found", "column": f"{from_table}.{from_field}"}
-    if right.empty and to_field not in frames[to_table].columns:
-        return "FAIL", {"error": "column_not_found", "column": f"{to_table}.{to_field}"}
-
-    missing = sorted(set(left.dropna().unique()) - set(right.dropna().unique()))
-    if missing:
+    for table, fields in ((from_table, from_fields), (to_table, to_fields)):
+        for f in fields:
+            if f not in frames[table].columns:
+                return "FAIL", {"error": "column_not_found", "column": f"{table}.{f}"}
+
+    # The referenced keys are indexed once per run and shared by every rule targeting them
+    indexes = cache if cache is not None else ReferenceIndexes(frames)
+    src = frames[from_table]
+    mask = indexes.get(to_table, to_fields).missing(src, from_fields)
+    if mask.any():
         return _status_from_severity(severity), {
-            "missing_values": missing[:50],
-            "missing_count_estimate": len(missing),
-            "from": {"table": from_table, "field": from_field},
-            "to": {"table": to_table, "field": to_field},
+            **missing_evidence(src, from_fields, mask),
+            "from": _fk_echo(from_table, from_fields, composite),
+            "to": _fk_echo(to_table, to_fields, composite),
         }
     return "PASS", {"count": 0}
 
@@ -574,7 +1359,8 @@ def _rows_sorted_1based(idx_like) -> list[int]:
 
 def _column_not_found_error(column: str, df: pd.DataFrame) -> tuple[str, dict[str, Any]]:
     """Generate a helpful column_not_found error with available columns and YAML syntax hints."""
-    available = sorted(df.columns.tolist())
+    header = _source_columns(df)
+    available = sorted(header)
     hint = ""
     suggestion = ""
 
@@ -585,7 +1371,7 @@ def _column_not_found_error(column: str, df: pd.DataFrame) -> tuple[str, dict[st
         hint = f"YAML list items require a space: use '- {suggested_name}', not '{column}'."
 
         # Cheap win: if -id is missing but id exists, suggest it
-        if suggested_name in df.columns:
+        if suggested_name in header:
             suggestion = suggested_name
 
     return "FAIL", {
@@ -599,7 +1385,12 @@ def _column_not_found_error(column: str, df: pd.DataFrame) -> tuple[str, dict[st
 
 
 def check_required(
-    df: pd.DataFrame, columns: list[str], severity: str, rem_col=None, rem_label=None
+    df: pd.DataFrame,
+    columns: list[str],
+    severity: str,
+    rem_col=None,
+    rem_label=None,
+    cache: ColumnCache | None = None,
 ) -> tuple[str, dict[str, Any]]:
     if not columns:
         return "FAIL", {"error": "config_missing_columns"}
@@ -610,12 +1401,12 @@ def check_required(
 
     present = [c for c in columns if c in df.columns]
     nullish_rows: dict[str, list[int]] = {}
+    cache = cache if cache is not None else ColumnCache(df)
     for c in present:
         # empty after trim OR NaN
-        s = df[c]
-        mask = s.isna() | s.astype(str).str.strip().eq("")
+        mask = cache.blank(c)
         if mask.any():
-            bad_pos = mask.to_numpy().nonzero()[0].tolist()
+            bad_pos = mask.nonzero()[0].tolist()
             nullish_rows[c] = _rows_sorted_1based(bad_pos)
 
     if nullish_rows:
@@ -636,7 +1427,8 @@ def check_required(
     return "PASS", {"count": 0}
 
 
-def _url_syntax_ok(val: Any, schemes: set[str]) -> bool:
+def _url_syntax_ok(val: Any, schemes: frozenset[str]) -> bool:
+    # schemes: allowed schemes, already lowercased (empty = any scheme)
     if pd.isna(val):
         return True
 
@@ -654,7 +1446,7 @@ def _url_syntax_ok(val: Any, schemes: set[str]) -> bool:
     if not scheme or not _SCHEME_RE.match(scheme):
         return False
 
-    if schemes and scheme not in {x.lower() for x in schemes}:
+    if schemes and scheme not in schemes:
         return False
 
     return bool(parts.netloc or parts.path)
@@ -667,18 +1459,40 @@ def check_url(
     severity: str,
     rem_col=None,
     rem_label=None,
+) -> tuple[str, dict[str, Any]]:
+    allow = set(schemes or ["http", "https"])
+    return _url_kernel(
+        df,
+        column=column,
+        allow=allow,
+        allow_lower=frozenset(x.lower() for x in allow),
+        severity=severity,
+        rem_col=rem_col,
+        rem_label=rem_label,
+    )
+
+
+def _url_kernel(
+    df: pd.DataFrame,
+    *,
+    column: str,
+    allow: set[str],
+    allow_lower: frozenset[str],
+    severity: str,
+    rem_col=None,
+    rem_label=None,
+    cache: ColumnCache | None = None,
 ) -> tuple[str, dict[str, Any]]:
     if not column:
         return "FAIL", {"error": "config_missing_column"}
     if column not in df.columns:
         return _column_not_found_error(column, df)
 
-    allow = set(schemes or ["http", "https"])
-    s = df[column]
-    bad_mask = ~s.apply(lambda v: _url_syntax_ok(v, allow))
+    cache = cache if cache is not None else ColumnCache(df)
+    bad_mask = ~cache.map_distinct(column, lambda v: _url_syntax_ok(v, allow_lower))
 
     if bad_mask.any():
-        bad_pos = bad_mask.to_numpy().nonzero()[0].tolist()
+        bad_pos = np.flatnonzero(bad_mask).tolist()
         rows = _rows_sorted_1based(bad_pos)
 
         ev = {
@@ -697,18 +1511,23 @@ def check_url(
 
 
 def check_non_empty_trimmed(
-    df: pd.DataFrame, column: str, severity: str, rem_col=None, rem_label=None
+    df: pd.DataFrame,
+    column: str,
+    severity: str,
+    rem_col=None,
+    rem_label=None,
+    cache: ColumnCache | None = None,
 ) -> tuple[str, dict[str, Any]]:
     if not column:
         return "FAIL", {"error": "config_missing_column"}
     if column not in df.columns:
         return _column_not_found_error(column, df)
 
-    s = df[column].astype("string")
-    bad_mask = s.isna() | (s.str.strip().str.len() == 0)
+    cache = cache if cache is not None else ColumnCache(df)
+    bad_mask = cache.blank(column)
 
     if bad_mask.any():
-        bad_pos = bad_mask.to_numpy().nonzero()[0].tolist()
+        bad_pos = np.flatnonzero(bad_mask).tolist()
         rows = _rows_sorted_1based(bad_pos)
 
         ev = {
@@ -725,6 +1544,50 @@ def check_non_empty_trimmed(
     return "PASS", {"count": 0}
 
 
+def _prepare_regex(regex: Any, mode: str) -> tuple[re.Pattern[str] | None, dict | None]:
+    """Compile a regex rule's pattern once; returns (compiled, config_error)."""
+    if not regex:
+        return None, {"error": "config_missing_regex"}
+    if mode not in ("not_matches", "matches"):
+        return None, {"error": "config_invalid_mode", "mode": mode}
+    try:
+        return re.compile(regex), None
+    except (re.error, TypeError) as e:
+        return None, {"error": "invalid_regex", "message": str(e), "regex": regex}
+
+
+_RX_OK, _RX_IGNORED, _RX_VIOLATED = 0, 1, 2
+
+
+def _regex_outcome(v: Any, rx: re.Pattern[str], mode: str, ignore_empty: bool) -> int:
+    if pd.isna(v):
+        if ignore_empty:
+            return _RX_IGNORED
+        text = ""
+    else:
+        text = str(v)
+
+    if ignore_empty and text.strip() == "":
+        return _RX_IGNORED
+
+    if mode == "not_matches":
+        # "must match format" => full string match
+        violated = rx.fullmatch(text) is None
+    else:  # mode == "matches"
+        # "forbidden text present" => search anywhere
+        violated = rx.search(text) is not None
+    return _RX_VIOLATED if violated else _RX_OK
+
+
+def _regex_outcomes(
+    cache: ColumnCache, column: str, rx: re.Pattern[str], mode: str, ignore_empty: bool
+) -> np.ndarray:
+    """Per-row _RX_* outcome codes for a column."""
+    return cache.map_distinct(
+        column, lambda v: _regex_outcome(v, rx, mode, ignore_empty), dtype=np.int8
+    )
+
+
 def check_regex(
     df: pd.DataFrame,
     column: str,
@@ -743,54 +1606,52 @@ def check_regex(
     - True: skip NA/empty/whitespace-only values
     - False: evaluate empties too (so "" will fail "not_matches", and will not fail "matches)
     """
+    mode = (mode or "not_matches").strip()
+    rx, config_error = _prepare_regex(regex, mode)
+    return _regex_kernel(
+        df,
+        column=column,
+        regex=regex,
+        rx=rx,
+        config_error=config_error,
+        mode=mode,
+        ignore_empty=ignore_empty,
+        severity=severity,
+        rem_col=rem_col,
+        rem_label=rem_label,
+    )
+
+
+def _regex_kernel(
+    df: pd.DataFrame,
+    *,
+    column: str,
+    regex: str,
+    rx: re.Pattern[str] | None,
+    config_error: dict[str, Any] | None,
+    mode: str,
+    ignore_empty: bool,
+    severity: str,
+    rem_col=None,
+    rem_label=None,
+    cache: ColumnCache | None = None,
+) -> tuple[str, dict[str, Any]]:
     if not column:
         return "FAIL", {"error": "config_missing_column"}
     if column not in df.columns:
         return _column_not_found_error(column, df)
-    if not regex:
-        return "FAIL", {"error": "config_missing_regex"}
-
-    mode = (mode or "not_matches").strip()
-    if mode not in ("not_matches", "matches"):
-        return "FAIL", {"error": "config_invalid_mode", "mode": mode}
-
-    rx = None
-    try:
-        rx = re.compile(regex)
-    except (re.error, TypeError) as e:
-        return "FAIL", {"error": "invalid_regex", "message": str(e), "regex": regex}
+    if config_error is not None or rx is None:
+        return "FAIL", dict(config_error or {"error": "config_missing_regex"})
 
     s = df[column]
-    bad_pos: list[int] = []
-    ignored_empty_count = 0
+    cache = cache if cache is not None else ColumnCache(df)
+    outcome = _regex_outcomes(cache, column, rx, mode, ignore_empty)
+    bad_pos = np.flatnonzero(outcome == _RX_VIOLATED).tolist()
+    ignored_empty_count = int(np.count_nonzero(outcome == _RX_IGNORED))
     samples: list[dict[str, Any]] = []
-
-    for i, v in enumerate(s.tolist()):
-        if pd.isna(v):
-            if ignore_empty:
-                ignored_empty_count += 1
-                continue
-            text = ""
-        else:
-            text = str(v)
-
-        if text.strip() == "":
-            if ignore_empty:
-                ignored_empty_count += 1
-                continue
-
-        violated = False
-        if mode == "not_matches":
-            # "must match format" => full string match
-            violated = rx.fullmatch(text) is None
-        else:  # mode == "matches"
-            # "forbidden text present" => search anywhere
-            violated = rx.search(text) is not None
-
-        if violated:
-            bad_pos.append(i)
-            if len(samples) < 10:
-                samples.append({"row": int(i) + 1, "value": text})
+    for i in bad_pos[:10]:
+        v = s.iloc[i]
+        samples.append({"row": int(i) + 1, "value": "" if pd.isna(v) else str(v)})
 
     if bad_pos:
         rows = _rows_sorted_1based(bad_pos)
@@ -826,7 +1687,22 @@ def check_regex(
 # ---------------- Markdown writer (deterministic order) ----------------
 
 
-def write_markdown(report: dict[str, Any]) -> str:
+def _md_rows(container: dict[str, Any], key: str, max_rows: int | None) -> str:
+    """A row list for the Markdown report, capped like the JSON evidence."""
+    rows = container.get(key, [])
+    total = container.get(f"{key}_total", len(rows))
+    if max_rows is not None and len(rows) > max_rows:
+        rows = rows[:max_rows]
+    if total > len(rows):
+        return f"{rows} (+{total - len(rows)} more)"
+    return str(rows)
+
+
+def write_markdown(report: dict[str, Any], max_rows: int | None = None) -> str:
+    """
+    Render a validate report as Markdown. max_rows caps each row list shown (the
+    report's own cap, if it was built with an EvidencePolicy, always applies).
+    """
     eng = report.get("engine", {}) or {}
     att = report.get("attestation", {})
     rp = att.get("rulepack", {})
@@ -855,13 +1731,18 @@ def write_markdown(report: dict[str, Any]) -> str:
         f"- PASS: {report.get('summary', {}).get('pass', 0)}",
         f"- WARN: {report.get('summary', {}).get('warn', 0)}",
         f"- FAIL: {report.get('summary', {}).get('fail', 0)}",
+        *([f"- SKIPPED: {n}"] if (n := report.get("summary", {}).get("skipped")) else []),
         "",
         "## Inputs",
     ]
     for i in att.get("inputs", []):
         path = i.get("path", "")
         sh = i.get("sha256", "")
+        if sh is None:
+            sh = "(not computed: sampled)"
         rows = i.get("rows", "")
+        if i.get("rows_is_lower_bound"):
+            rows = f">={rows}"
         bytes_ = i.get("bytes", "")
         out.append(f"- `{path}` — sha256={sh}, rows={rows}, bytes={bytes_}")
 
@@ -871,36 +1752,52 @@ def write_markdown(report: dict[str, Any]) -> str:
         for rr in sorted(res.get("rules", []), key=lambda r: r.get("id", "")):
             out.append(f"### [{rr.get('status')}] {rr.get('id')} — {rr.get('type')}")
             ev = rr.get("evidence", {})
+            est = rr.get("estimate")
+            if est:
+                lo, hi = est["rate_ci95"]
+                out.append(
+                    f"Estimated violation rate: {est['rate']:.2%} (95% CI {lo:.2%}–{hi:.2%}), "
+                    f"~{est['estimated_count']:,} rows (sample of {est['sample_rows']:,})"
+                )
 
             rem = ev.get("remediation")
             if rem and rem.get("links"):
                 label = rem.get("label") or "Open record"
 
                 max_links = MAX_REMEDIATION_LINKS
+                if max_rows is not None:
+                    max_links = min(max_links, max_rows)
                 shown = rem["links"][:max_links]
+                total = rem.get("links_total", len(rem["links"]))
 
                 out.append("Remediation:")
                 for link in shown:
                     out.append(f"- Row {link['row']}: [{label}]({_href(link['url'])})")
 
-                if len(rem["links"]) > max_links:
-                    out.append(
-                        f"_Showing first {max_links} remediation links (of {len(rem['links'])})._"
-                    )
+                if total > len(shown):
+                    out.append(f"_Showing first {len(shown)} remediation links (of {total})._")
 
                 out.append("")
 
             if "duplicates" in ev:
                 for d in ev["duplicates"]:
-                    out.append(f"Duplicates at rows {d.get('rows', [])}")
+                    out.append(f"Duplicates at rows {_md_rows(d, 'rows', max_rows)}")
             if "out_of_set" in ev:
                 o = ev["out_of_set"]
-                out.append(f"Out of set rows {o.get('rows', [])} (count={o.get('count', 0)})")
+                rows = _md_rows(o, "rows", max_rows)
+                out.append(f"Out of set rows {rows} (count={o.get('count', 0)})")
             if "out_of_bounds" in ev:
                 o = ev["out_of_bounds"]
-                out.append(f"Out of bounds rows {o.get('rows', [])} (count={o.get('count', 0)})")
+                counts = f"count={o.get('count', 0)}"
+                if o.get("non_numeric_count"):
+                    counts += f", non_numeric={o['non_numeric_count']}"
+                out.append(f"Out of bounds rows {_md_rows(o, 'rows', max_rows)} ({counts})")
             if ev.get("normalized") is True:
                 out.append("Normalized comparison applied.")
+            if ev.get(LOWER_BOUND):
+                out.append("Scan stopped early; counts are lower bounds.")
+            if "skipped" in ev:
+                out.append(f"Not evaluated ({ev['skipped']}).")
             if "error" in ev:
                 error_msg = f"Error: {ev['error']}"
                 if ev.get("column"):
@@ -926,9 +1823,8 @@ def write_markdown(report: dict[str, Any]) -> str:
                     # Put hint on its own line so it doesn't get lost
                     out.append(f"Tip: {ev['hint']}")
             if ev.get("regex") and ev.get("rows"):
-                out.append(
-                    f"Regex {ev.get('mode')} rows {ev.get('rows', [])} (count={ev.get('count', 0)})"
-                )
+                rows = _md_rows(ev, "rows", max_rows)
+                out.append(f"Regex {ev.get('mode')} rows {rows} (count={ev.get('count', 0)})")
                 if ev.get("samples"):
                     for s in ev["samples"][:5]:
                         out.append(f"- Row {s.get('row')}: {s.get('value')}")
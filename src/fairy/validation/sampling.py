@@ -0,0 +1,427 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/sampling.py
+"""
+Sampled preview runs (validate --sample N|FRACTION [--seed S]).
+
+A random subset of each input's rows is read without parsing the whole file:
+
+- uncompressed inputs: random byte offsets are drawn and the row containing
+  each one is read from a small window around it. The first row boundary in
+  the window is a newline outside quotes after which two rows in a row have
+  as many fields as the header (a quoted field holding newlines rarely passes
+  that check); rows are then followed from there to the offset. A row is hit
+  with probability proportional to its length in bytes, so every estimate
+  weights each sampled row by 1 / its length;
+- compressed inputs cannot be seeked and are streamed once; each row gets a
+  random key and the N smallest keys are kept (a FRACTION keeps each row with
+  that probability);
+- an input that fits in the first MiB, or has no more rows than requested,
+  is read whole (the estimates are then exact).
+
+Row-local rules run on the sample. Rules whose outcome depends on rows outside
+it (unique, dup, foreign_key) are reported as SKIPPED. Each other rule gets an
+`estimate` block: the violation rate in the sample with a 95% Wilson score
+interval (on the effective sample size when rows are weighted), scaled to the
+estimated row count of the input. Row numbers in the evidence count rows of
+the sample, not of the file. An input that was only sampled is not hashed
+(reading it all would defeat the preview): its attestation sha256 is null.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import math
+import secrets
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from . import hooks
+from .column_cache import ColumnCache
+from .hooks import HOOKS
+from .ingest import (
+    HEADER_ATTR,
+    ChunkedInput,
+    InputStats,
+    _compression,
+    _projection,
+    infer_sep,
+    read_input,
+)
+from .limits import skipped, violations
+from .rulepack_runner import (
+    CompiledRule,
+    ExecutionPlan,
+    RuleResult,
+    _execute_rule,
+    check_dup,
+    check_unique,
+)
+
+# Bytes read around each sampled offset (the window doubles up to _MAX_WINDOW for long rows)
+_WINDOW = 2 << 10
+_MAX_WINDOW = 1 << 20
+# Head read to parse the header and size FRACTION samples
+_HEAD = 1 << 20
+_HEAD_ROWS = 1000
+# Newlines tried for the first row boundary in a window
+_CANDIDATES = 16
+# Evidence keys holding 1-based sample row numbers
+_ROW_LISTS = frozenset({"rows", "invalid_url_rows", "empty_or_whitespace_rows"})
+_Z95 = 1.959963984540054
+_CHUNKSIZE = 100_000
+
+
+@dataclass(frozen=True)
+class SampleSpec:
+    """Rows to sample per input: a count (size) or a share of the rows (fraction)."""
+
+    size: int | None = None
+    fraction: float | None = None
+    seed: int | None = None
+
+    @classmethod
+    def parse(cls, text: str, seed: int | None = None) -> SampleSpec:
+        """'1000' -> 1000 rows, '0.01' -> 1% of the rows."""
+        try:
+            value = float(text)
+        except ValueError:
+            raise ValueError(f"sample must be a row count or a fraction, got {text!r}") from None
+        if value.is_integer() and "." not in text and value >= 1:
+            return cls(size=int(value), seed=seed)
+        if 0 < value < 1:
+            return cls(fraction=value, seed=seed)
+        raise ValueError(f"sample must be a row count >= 1 or a fraction in (0, 1), got {text!r}")
+
+    def seeded(self) -> SampleSpec:
+        """This spec with a seed, drawn at random if none was given (so the run can be repeated)."""
+        if self.seed is not None:
+            return self
+        return SampleSpec(self.size, self.fraction, secrets.randbelow(2**32))
+
+    def rows_for(self, estimated_rows: float) -> int:
+        if self.size is not None:
+            return self.size
+        assert self.fraction is not None
+        return max(1, math.ceil(self.fraction * estimated_rows))
+
+    def metadata(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"seed": self.seed}
+        if self.size is not None:
+            out["size"] = self.size
+        else:
+            out["fraction"] = self.fraction
+        return out
+
+
+@dataclass(frozen=True)
+class SampleInfo:
+    """How one input was sampled (byte_offset, reservoir or full) and its estimated row count."""
+
+    method: str
+    rows: int
+    estimated_rows: int
+    # Per sampled row, 1 / its probability weight (byte_offset), or None for equal weights
+    weights: tuple[float, ...] | None = field(default=None, repr=False)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"method": self.method, "rows": self.rows, "estimated_rows": self.estimated_rows}
+
+
+def _record_end(buf: bytes, start: int) -> int:
+    """Index just past the first newline at or after start that is outside quotes; -1 if none."""
+    i, quoted = start, False
+    while True:
+        nl = buf.find(b"\n", i)
+        if nl < 0:
+            return -1
+        # Each quote flips the state ("" inside a quoted field flips it twice)
+        if buf.count(b'"', i, nl) % 2:
+            quoted = not quoted
+        if not quoted:
+            return nl + 1
+        i = nl + 1
+
+
+def _field_count(record: bytes, sep: str) -> int:
+    text = record.decode("utf-8", errors="replace").rstrip("\r\n")
+    try:
+        return len(next(csv.reader(io.StringIO(text), delimiter=sep), []))
+    except csv.Error:
+        return -1
+
+
+def _aligned_record(buf: bytes, start: int, ncols: int, sep: str, at_eof: bool) -> int:
+    """End of the record at start if start looks like a row boundary, else -1."""
+    end = _record_end(buf, start)
+    if end < 0:
+        if not at_eof or start >= len(buf):
+            return -1
+        end = len(buf)
+    if _field_count(buf[start:end], sep) != ncols:
+        return -1
+    # The next record must line up too (unless the buffer ends first)
+    nxt = _record_end(buf, end)
+    if nxt >= 0 and _field_count(buf[end:nxt], sep) != ncols:
+        return -1
+    return end
+
+
+def _first_boundary(buf: bytes, ncols: int, sep: str, at_eof: bool) -> int:
+    """Start of the first row in buf (which begins mid-file), or -1."""
+    nl = -1
+    for _ in range(_CANDIDATES):
+        nl = buf.find(b"\n", nl + 1)
+        if nl < 0:
+            return -1
+        if _aligned_record(buf, nl + 1, ncols, sep, at_eof) > 0:
+            return nl + 1
+    return -1
+
+
+def _row_at(
+    f: io.BufferedReader, offset: int, body_start: int, size: int, ncols: int, sep: str
+) -> tuple[int, bytes] | None:
+    """(start, record bytes) of the row containing byte offset, or None."""
+    window = _WINDOW
+    while window <= _MAX_WINDOW:
+        base = max(body_start, offset - window // 2)
+        f.seek(base)
+        buf = f.read(window)
+        at_eof = base + len(buf) >= size
+        pos = 0 if base == body_start else _first_boundary(buf, ncols, sep, at_eof)
+        while 0 <= pos and base + pos <= offset:
+            end = _record_end(buf, pos)
+            if end < 0:
+                if not at_eof:
+                    break
+                end = len(buf)
+            if base + end > offset:
+                return base + pos, buf[pos:end]
+            pos = end
+        if at_eof and base == body_start:
+            return None
+        window *= 2
+    return None
+
+
+def _head(path: Path, sep: str) -> tuple[bytes, list[str], list[bytes]]:
+    """(header bytes, header columns, up to _HEAD_ROWS complete records that follow it)."""
+    with path.open("rb") as f:
+        buf = f.read(_HEAD)
+    end = _record_end(buf, 0)
+    if end < 0:
+        end = len(buf)
+    header_bytes = buf[:end]
+    text = header_bytes.decode("utf-8-sig", errors="replace").rstrip("\r\n")
+    header = next(csv.reader(io.StringIO(text), delimiter=sep), [])
+    records, i = [], end
+    while len(records) < _HEAD_ROWS and (j := _record_end(buf, i)) > 0:
+        records.append(buf[i:j])
+        i = j
+    return header_bytes, header, records
+
+
+def _frame(header_bytes: bytes, records: list[bytes], sep: str, usecols: set[str]) -> pd.DataFrame:
+    body = b"".join(r if r.endswith(b"\n") else r + b"\n" for r in records)
+    data = header_bytes if header_bytes.endswith(b"\n") else header_bytes + b"\n"
+    header = pd.read_csv(io.BytesIO(data), sep=sep, dtype=str, nrows=0).columns.tolist()
+    cols, parse = _projection(header, usecols)
+    df = pd.read_csv(
+        io.BytesIO(data + body),
+        sep=sep,
+        dtype=str,
+        keep_default_na=False,
+        usecols=parse,
+    )
+    if not cols:
+        df = df.iloc[:, :0]
+    df.attrs[HEADER_ATTR] = header
+    return df
+
+
+def _byte_offset_sample(
+    path: Path, spec: SampleSpec, usecols: set[str], rng: np.random.Generator
+) -> tuple[pd.DataFrame, SampleInfo] | None:
+    """Sample by seeking; None when the input is small enough to be read whole."""
+    sep = infer_sep(path)
+    size = path.stat().st_size
+    header_bytes, header, head_records = _head(path, sep)
+    body_bytes = size - len(header_bytes)
+    if size <= _HEAD or not head_records:
+        return None
+    mean_len = sum(map(len, head_records)) / len(head_records)
+    want = spec.rows_for(body_bytes / mean_len)
+    if want >= body_bytes / mean_len:
+        return None
+
+    picked: dict[int, bytes] = {}
+    start = len(header_bytes)
+    with path.open("rb") as f:
+        # Offsets in rows too long for the window yield nothing; redraw (a few rounds)
+        for _ in range(8):
+            need = want - len(picked)
+            if need <= 0:
+                break
+            for off in rng.integers(start, size, size=need * 2).tolist():
+                hit = _row_at(f, off, start, size, len(header), sep)
+                if hit is not None:
+                    picked.setdefault(*hit)
+                    if len(picked) >= want:
+                        break
+    records = [picked[at] for at in sorted(picked)]
+    if not records:
+        return None
+    weights = tuple(1 / len(r) for r in records)
+    # E[1 / row length] under length-proportional picks is rows / bytes
+    estimated = round(body_bytes * sum(weights) / len(weights))
+    df = _frame(header_bytes, records, sep, usecols)
+    if len(df) != len(records):
+        return None
+    return df, SampleInfo("byte_offset", len(df), max(estimated, len(df)), weights)
+
+
+def _reservoir_sample(
+    path: Path, spec: SampleSpec, usecols: set[str], rng: np.random.Generator
+) -> tuple[pd.DataFrame, InputStats, SampleInfo]:
+    """One streamed pass: the rows with the smallest random keys (or a Bernoulli sample)."""
+    chunks = ChunkedInput(path, usecols, _CHUNKSIZE)
+    kept: list[pd.DataFrame] = []
+    keys = np.empty(0)
+    for chunk in chunks:
+        draw = rng.random(len(chunk))
+        if spec.size is None:
+            kept.append(chunk[draw < (spec.fraction or 0)])
+            continue
+        frame = pd.concat([*kept, chunk], ignore_index=False) if kept else chunk
+        keys = np.concatenate([keys, draw])
+        if len(keys) > spec.size:
+            top = np.sort(np.argpartition(keys, spec.size)[: spec.size])
+            frame, keys = frame.iloc[top], keys[top]
+        kept = [frame]
+    assert chunks.stats is not None
+    df = pd.concat(kept, ignore_index=True) if kept else chunk.iloc[:0]
+    df.attrs = dict(chunk.attrs)
+    method = "full" if len(df) == chunks.stats.rows else "reservoir"
+    return df, chunks.stats, SampleInfo(method, len(df), chunks.stats.rows)
+
+
+def sample_input(
+    path: Path, spec: SampleSpec, usecols: set[str], rng: np.random.Generator
+) -> tuple[pd.DataFrame, InputStats | None, SampleInfo]:
+    """
+    (sampled rows, input stats when the whole file was read anyway, how it was sampled).
+    Sampled rows keep file order.
+    """
+    if _compression(path) is None:
+        hit = _byte_offset_sample(path, spec, usecols, rng)
+        if hit is not None:
+            return hit[0], None, hit[1]
+        df, stats = read_input(path, usecols=usecols)
+        return df, stats, SampleInfo("full", stats.rows, stats.rows)
+    return _reservoir_sample(path, spec, usecols, rng)
+
+
+def is_global(rule: CompiledRule) -> bool:
+    """Whether the rule's outcome depends on rows outside any sample (unique, dup, foreign_key)."""
+    return rule.cross_table or getattr(rule.kernel, "func", None) in (check_dup, check_unique)
+
+
+def sampled_results(
+    plan: ExecutionPlan, inputs_map: dict[str, Path], spec: SampleSpec
+) -> tuple[dict[str, InputStats], dict[str, list[RuleResult]], dict[str, SampleInfo]]:
+    """
+    Run the row-local rules of each input on a sample of its rows (spec must be
+    seeded); global rules are SKIPPED. Returns (stats, results, sample info) per input.
+    """
+    rng = np.random.default_rng(spec.seed)
+    known: dict[str, InputStats | None] = {}
+    infos: dict[str, SampleInfo] = {}
+    results: dict[str, list[RuleResult]] = {}
+    for name, path in inputs_map.items():
+        rules = plan.rules_for(path)
+        usecols = {c for r in rules if not is_global(r) for c in r.columns}
+        with hooks.input_scope(name):
+            t0 = time.perf_counter()
+            df, known[name], infos[name] = sample_input(path, spec, usecols, rng)
+            HOOKS.emit("on_load", rows=len(df), seconds=time.perf_counter() - t0)
+            cache = ColumnCache(df)
+            out: list[RuleResult] = []
+            for rule in rules:
+                if is_global(rule):
+                    out.append((rule, *skipped("sample")))
+                else:
+                    out.append((rule, *_execute_rule(rule, df, {}, cache)))
+            results[name] = out
+    return sampled_stats(inputs_map, known, infos), results, infos
+
+
+def wilson_interval(p: float, n: float, z: float = _Z95) -> tuple[float, float]:
+    """Wilson score interval for a proportion p observed over n (effective) trials."""
+    if n <= 0:
+        return 0.0, 1.0
+    p = min(max(p, 0.0), 1.0)
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def _offending_rows(ev: dict[str, Any]) -> set[int]:
+    """1-based rows listed anywhere in evidence (remediation links and samples aside)."""
+    rows: set[int] = set()
+    for k, v in ev.items():
+        if k in _ROW_LISTS and isinstance(v, list):
+            rows.update(v)
+        elif k == "rows_by_column":
+            for r in v.values():
+                rows.update(r)
+        elif isinstance(v, dict) and k != "remediation":
+            rows |= _offending_rows(v)
+    return rows
+
+
+def estimate(ev: dict[str, Any], info: SampleInfo) -> dict[str, Any]:
+    """A rule's `estimate` block: violation rate in the sample, its 95% interval, scaled counts."""
+    # The rate is per row: k counts cells for multi-column rules such as required
+    k, n, w = violations(ev), info.rows, info.weights
+    rows = [r for r in _offending_rows(ev) if 0 < r <= n]
+    if w is not None and n:
+        total_w = sum(w)
+        rate = sum(w[r - 1] for r in rows) / total_w
+        n_eff = total_w * total_w / sum(x * x for x in w)
+    else:
+        rate, n_eff = (len(rows) / n if n else 0.0), float(n)
+    lo, hi = (rate, rate) if info.method == "full" else wilson_interval(rate, n_eff)
+    total = info.estimated_rows
+    return {
+        "sample_rows": n,
+        "violations": k,
+        "rate": round(rate, 6),
+        "rate_ci95": [round(lo, 6), round(hi, 6)],
+        "estimated_count": round(rate * total),
+        "estimated_count_ci95": [math.floor(lo * total), math.ceil(hi * total)],
+    }
+
+
+def sampled_stats(
+    inputs_map: dict[str, Path], known: dict[str, InputStats | None], infos: dict[str, SampleInfo]
+) -> dict[str, InputStats]:
+    """
+    Attestation stats. Inputs read whole keep theirs; sampled ones get no sha256
+    (not computed) and their sampled rows as a lower bound.
+    """
+    stats = {}
+    for name, path in inputs_map.items():
+        st = known.get(name)
+        if st is None:
+            st = InputStats(None, path.stat().st_size, infos[name].rows, complete=False)
+        stats[name] = st
+    return stats
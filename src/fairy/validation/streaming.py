@@ -0,0 +1,362 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/streaming.py
+"""
+Chunked (streaming) execution of a compiled rulepack.
+
+Each input is read in fixed-size row chunks and every applicable rule keeps an
+accumulator that merges per-chunk results, so inputs larger than memory can be
+validated. The report is the same as the in-memory path:
+
+- row-local rules (required, enum, range, url, regex, non_empty_trimmed) run
+  their kernel per chunk; row numbers are shifted to file positions and
+  counts, row lists, samples and remediation links are merged;
+- unique / dup keep the set of keys seen in earlier chunks;
+- the distinct values of fields that foreign_key rules read are gathered
+  as a key-set index; those rules run once every input has been streamed.
+
+With ScanLimits (fairy.validation.limits), a rule stops being fed once it has
+max_violations offenders, and reading stops as soon as nothing needs more rows.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from . import hooks, timing
+from .column_cache import ColumnCache
+from .hooks import HOOKS
+from .ingest import ChunkedInput, InputStats
+from .keys import duplicate_mask
+from .limits import ScanLimits, lower_bound, skipped, violations
+from .rulepack_runner import (
+    _RX_IGNORED,
+    CompiledRule,
+    LocalResults,
+    _collect_remediation_links,
+    _column_not_found_error,
+    _key_frame,
+    _regex_kernel,
+    _regex_outcomes,
+    _status_from_severity,
+    check_dup,
+    check_unique,
+)
+
+DEFAULT_CHUNKSIZE = 100_000
+
+# Evidence keys holding 1-based row numbers, and counters summed across chunks
+_ROW_LISTS = frozenset({"rows", "invalid_url_rows", "empty_or_whitespace_rows"})
+_COUNTS = frozenset({"count", "non_numeric_count", "ignored_empty_count"})
+_MAX_SAMPLES = 10
+
+
+def _map_rows(ev: dict[str, Any], to_file: Callable[[np.ndarray], np.ndarray]) -> dict[str, Any]:
+    """Copy of evidence with every 1-based row number mapped (as an array) through to_file."""
+
+    def rows(v: list[int]) -> list[int]:
+        return to_file(np.asarray(v, dtype=np.int64)).tolist() if v else []
+
+    out: dict[str, Any] = {}
+    for k, v in ev.items():
+        if k in _ROW_LISTS and isinstance(v, list):
+            out[k] = rows(v)
+        elif k in ("samples", "links"):
+            moved = rows([d["row"] for d in v])
+            out[k] = [{**d, "row": r} for d, r in zip(v, moved, strict=True)]
+        elif k == "rows_by_column":
+            out[k] = {c: rows(r) for c, r in v.items()}
+        elif isinstance(v, dict):
+            out[k] = _map_rows(v, to_file)
+        else:
+            out[k] = v
+    return out
+
+
+def _shift(ev: dict[str, Any], offset: int) -> dict[str, Any]:
+    """Copy of chunk evidence with chunk-relative row numbers moved to file positions."""
+    return _map_rows(ev, lambda r: r + offset)
+
+
+def _merge(acc: dict[str, Any], ev: dict[str, Any]) -> None:
+    """Merge shifted chunk evidence into acc (chunks arrive in row order)."""
+    for k, v in ev.items():
+        if k not in acc:
+            acc[k] = v
+            continue
+        cur = acc[k]
+        if k in _COUNTS:
+            acc[k] = cur + v
+        elif k in _ROW_LISTS or k == "links":
+            acc[k] = cur + v
+        elif k == "samples":
+            acc[k] = (cur + v)[:_MAX_SAMPLES]
+        elif k == "rows_by_column":
+            merged = {c: cur.get(c, []) + v.get(c, []) for c in {*cur, *v}}
+            acc[k] = dict(sorted(merged.items()))
+        elif k == "columns" and isinstance(cur, list):
+            acc[k] = sorted({*cur, *v})
+        elif isinstance(cur, dict):
+            _merge(cur, v)
+
+
+class _KernelAccumulator:
+    """Runs a row-local kernel on each chunk and merges the evidence."""
+
+    def __init__(self, rule: CompiledRule):
+        self.rule = rule
+        self.result: tuple[str, dict[str, Any]] | None = None
+        self.first_pass: dict[str, Any] | None = None
+        self.status: str | None = None
+        self.evidence: dict[str, Any] = {}
+        self.extra_ignored = 0
+
+    def feed(self, chunk: pd.DataFrame, offset: int, cache: ColumnCache) -> None:
+        if self.result is not None:
+            return
+        status, ev = self.rule.run(chunk, {}, cache)
+        if "error" in ev:
+            # Config / column errors do not depend on the rows: the first one is final
+            self.result = (status, ev)
+            return
+        if status == "PASS":
+            if self.first_pass is None:
+                self.first_pass = ev
+            self._count_ignored(cache)
+            return
+        self.status = status
+        _merge(self.evidence, _shift(ev, offset))
+
+    @property
+    def settled(self) -> bool:
+        return self.result is not None
+
+    def offenders(self) -> int:
+        return violations(self.evidence) if self.status is not None else 0
+
+    def failing(self) -> bool:
+        return (self.result[0] if self.result is not None else self.status) == "FAIL"
+
+    def _count_ignored(self, cache: ColumnCache) -> None:
+        # Passing regex chunks don't report skipped empties; the merged FAIL evidence needs them
+        kernel = self.rule.kernel
+        if getattr(kernel, "func", None) is not _regex_kernel:
+            return
+        kw = kernel.keywords
+        if not kw.get("ignore_empty") or kw.get("rx") is None:
+            return
+        outcome = _regex_outcomes(cache, kw["column"], kw["rx"], kw["mode"], True)
+        self.extra_ignored += int(np.count_nonzero(outcome == _RX_IGNORED))
+
+    def finish(self) -> tuple[str, dict[str, Any]]:
+        if self.result is not None:
+            return self.result
+        if self.status is None:
+            return "PASS", dict(self.first_pass or {"count": 0})
+        ev = self.evidence
+        if self.extra_ignored:
+            ev["ignored_empty_count"] = ev.get("ignored_empty_count", 0) + self.extra_ignored
+        return self.status, ev
+
+
+class _KeyAccumulator:
+    """unique / dup across chunks: keys seen in earlier chunks make later rows repeats."""
+
+    def __init__(self, rule: CompiledRule, keys: list[str], missing_error: str):
+        kw = rule.kernel.keywords
+        self.keys = list(keys or [])
+        self.missing_error = missing_error
+        self.severity = kw["severity"]
+        self.rem_col = kw.get("rem_col")
+        self.rem_label = kw.get("rem_label")
+        self.result: tuple[str, dict[str, Any]] | None = None
+        self.checked = False
+        self.seen: set[Any] = set()
+        self.rows: list[int] = []
+        self.links: list[dict[str, Any]] = []
+
+    def feed(self, chunk: pd.DataFrame, offset: int, cache: ColumnCache) -> None:
+        if self.result is not None:
+            return
+        if not self.checked:
+            self.checked = True
+            if not self.keys:
+                self.result = ("FAIL", {"error": self.missing_error})
+                return
+            for k in self.keys:
+                if k not in chunk.columns:
+                    self.result = _column_not_found_error(k, chunk)
+                    return
+
+        dup = duplicate_mask(chunk, self.keys, keep="first")
+        firsts = np.flatnonzero(~dup)
+        if len(self.keys) == 1:
+            values = chunk[self.keys[0]].to_numpy(dtype=object)[firsts].tolist()
+        else:
+            cols = [chunk[k].to_numpy(dtype=object)[firsts] for k in self.keys]
+            values = list(zip(*cols, strict=True))
+        seen = self.seen
+        repeat = np.fromiter((v in seen for v in values), dtype=bool, count=len(values))
+        seen.update(values)
+        dup[firsts[repeat]] = True
+
+        local = (np.flatnonzero(dup) + 1).tolist()
+        self.rows.extend(r + offset for r in local)
+        rem = _collect_remediation_links(chunk, local, self.rem_col, self.rem_label)
+        if rem:
+            self.links.extend({**d, "row": d["row"] + offset} for d in rem["links"])
+
+    @property
+    def settled(self) -> bool:
+        return self.result is not None
+
+    def offenders(self) -> int:
+        return len(self.rows)
+
+    def failing(self) -> bool:
+        if self.result is not None:
+            return self.result[0] == "FAIL"
+        return bool(self.rows) and _status_from_severity(self.severity) == "FAIL"
+
+    def finish(self) -> tuple[str, dict[str, Any]]:
+        if self.result is not None:
+            return self.result
+        if not self.rows:
+            return "PASS", {"count": 0}
+        ev: dict[str, Any] = {"duplicates": [{"rows": self.rows}], "count": len(self.rows)}
+        if self.links:
+            rem: dict[str, Any] = {"column": self.rem_col, "links": self.links}
+            if self.rem_label:
+                rem["label"] = self.rem_label
+            ev["remediation"] = rem
+        return _status_from_severity(self.severity), ev
+
+
+class _GuardedAccumulator:
+    """Turns an exception in any chunk into the runtime_error result _execute_rule gives."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.error: dict[str, Any] | None = None
+
+    def feed(self, chunk: pd.DataFrame, offset: int, cache: ColumnCache) -> None:
+        if self.error is not None:
+            return
+        try:
+            self.inner.feed(chunk, offset, cache)
+        except Exception as e:
+            self.error = {"error": "runtime_error", "message": str(e)}
+
+    @property
+    def settled(self) -> bool:
+        """The result no longer depends on further rows (a config, column or runtime error)."""
+        return self.error is not None or self.inner.settled
+
+    def offenders(self) -> int:
+        return self.inner.offenders()
+
+    def failing(self) -> bool:
+        """The rule will be reported as FAIL whatever the remaining rows hold."""
+        return self.error is not None or self.inner.failing()
+
+    def finish(self) -> tuple[str, dict[str, Any]]:
+        if self.error is not None:
+            return "FAIL", self.error
+        try:
+            return self.inner.finish()
+        except Exception as e:
+            return "FAIL", {"error": "runtime_error", "message": str(e)}
+
+
+def _accumulator(rule: CompiledRule) -> _GuardedAccumulator:
+    func = getattr(rule.kernel, "func", None)
+    if func is check_dup:
+        inner: Any = _KeyAccumulator(rule, rule.kernel.keywords["keys"], "config_missing_keys")
+    elif func is check_unique:
+        inner = _KeyAccumulator(rule, rule.kernel.keywords["columns"], "config_missing_columns")
+    else:
+        inner = _KernelAccumulator(rule)
+    return _GuardedAccumulator(inner)
+
+
+def stream_input(
+    path: Path,
+    rules: tuple[CompiledRule, ...],
+    usecols: set[str],
+    key_fields: set[str],
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    limits: ScanLimits | None = None,
+) -> tuple[InputStats, LocalResults, pd.DataFrame]:
+    """
+    Streaming counterpart of rulepack_runner._input_results for one input.
+
+    Returns (input stats, per-rule results with None for cross-table rules,
+    distinct rows over key_fields, gathered chunk by chunk). With limits, the
+    read may stop early; stats.complete then is False.
+    """
+    limits = limits or ScanLimits()
+    cap = limits.max_violations
+    accs = [None if r.cross_table else _accumulator(r) for r in rules]
+    # Rule position -> rows scanned when it reached max_violations
+    capped: dict[int, int] = {}
+    key_parts: list[pd.DataFrame] = []
+    offset = 0
+    chunks = ChunkedInput(path, usecols, chunksize)
+    it = iter(chunks)
+    t0 = time.perf_counter()
+    for chunk in it:
+        HOOKS.emit("on_load", rows=len(chunk), seconds=time.perf_counter() - t0)
+        cache = ColumnCache(chunk)
+        offset_end = offset + len(chunk)
+        for i, (rule, acc) in enumerate(zip(rules, accs, strict=True)):
+            if acc is not None and i not in capped:
+                with timing.measure(id(rule), len(chunk)), hooks.rule_span(rule.id, len(chunk)):
+                    acc.feed(chunk, offset, cache)
+                if cap is not None and not acc.settled and acc.offenders() >= cap:
+                    capped[i] = offset_end
+        if key_fields:
+            key_parts.append(_key_frame(chunk, key_fields))
+        offset = offset_end
+        if limits and _done(accs, capped, key_fields, limits):
+            it.close()
+            break
+        t0 = time.perf_counter()
+    stats = chunks.stats
+    assert stats is not None
+    keys = pd.concat(key_parts).drop_duplicates(ignore_index=True) if key_parts else pd.DataFrame()
+
+    local: LocalResults = []
+    for i, acc in enumerate(accs):
+        if acc is None:
+            local.append(None)
+            continue
+        status, ev = acc.finish()
+        if i in capped:
+            if not stats.complete or capped[i] < stats.rows:
+                ev = lower_bound(ev)
+        elif not stats.complete and not acc.settled:
+            # fail_fast stopped the read before this rule saw every row
+            status, ev = skipped() if status == "PASS" else (status, lower_bound(ev))
+        local.append((status, ev))
+    return stats, local, keys
+
+
+def _done(
+    accs: list[_GuardedAccumulator | None],
+    capped: dict[int, int],
+    key_fields: set[str],
+    limits: ScanLimits,
+) -> bool:
+    """Whether the rest of the input can go unread under limits."""
+    if limits.fail_fast and any(acc is not None and acc.failing() for acc in accs):
+        return True
+    # Cross-table rules need every key row; otherwise stop once each rule is capped or settled
+    live = [acc for i, acc in enumerate(accs) if acc is not None and i not in capped]
+    return bool(capped) and not key_fields and all(acc.settled for acc in live)
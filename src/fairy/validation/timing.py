@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+# fairy/validation/timing.py
+"""
+Opt-in timing and memory instrumentation for validate / preflight runs.
+
+While a Stopwatch is active (`with Stopwatch(): ...`), every rule evaluation
+that goes through rulepack_runner._execute_rule (or is fed a chunk in
+streaming mode) is recorded under the current input (hooks.input_scope()):
+wall time, rows it was evaluated on, and the peak bytes allocated during it
+(tracemalloc; tracing slows pandas down noticeably, which is why all of this
+is opt-in). Phases (load, hash, rules, report, serialize) are timed by the
+callers.
+
+Reports carry the results as `timing` blocks; they vary run to run and are
+left out of golden comparisons.
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any
+
+from .hooks import current_input
+
+PHASES = ("load", "hash", "rules", "report", "serialize")
+
+
+@dataclass
+class RuleTiming:
+    """Totals over every evaluation of one rule on one input (peak: the largest)."""
+
+    seconds: float = 0.0
+    rows: int = 0
+    peak_bytes: int = 0
+    cached: bool = False
+
+    def add(self, other: RuleTiming) -> None:
+        self.seconds += other.seconds
+        self.rows += other.rows
+        self.peak_bytes = max(self.peak_bytes, other.peak_bytes)
+
+    def as_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "seconds": round(self.seconds, 6),
+            "rows": self.rows,
+            "peak_bytes": self.peak_bytes,
+        }
+        if self.cached:
+            out["cached"] = True
+        return out
+
+
+_ACTIVE: ContextVar[Stopwatch | None] = ContextVar("fairy_stopwatch", default=None)
+
+
+def active() -> Stopwatch | None:
+    """The Stopwatch recording the current run, if any."""
+    return _ACTIVE.get()
+
+
+def measure(key: Hashable, rows: int) -> AbstractContextManager[None]:
+    """Stopwatch.rule() of the active Stopwatch; does nothing when there is none."""
+    watch = _ACTIVE.get()
+    return nullcontext() if watch is None else watch.rule(key, rows)
+
+
+def phase(name: str) -> AbstractContextManager[None]:
+    """Stopwatch.phase() of the active Stopwatch; does nothing when there is none."""
+    watch = _ACTIVE.get()
+    return nullcontext() if watch is None else watch.phase(name)
+
+
+class Stopwatch:
+    """Per-rule timings (grouped by input name) and phase totals of one run."""
+
+    def __init__(self, memory: bool = True):
+        self.memory = memory
+        self.phases: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self._inputs: dict[str | None, dict[Hashable, RuleTiming]] = {}
+        self._started = 0.0
+        self._own_trace = False
+        self._token: Token | None = None
+
+    def __enter__(self) -> Stopwatch:
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._own_trace = True
+        self._token = _ACTIVE.set(self)
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.phases["total"] = time.perf_counter() - self._started
+        if self._token is not None:
+            _ACTIVE.reset(self._token)
+        if self._own_trace:
+            tracemalloc.stop()
+            self._own_trace = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - t0
+
+    @contextmanager
+    def rule(self, key: Hashable, rows: int) -> Iterator[None]:
+        """Time one evaluation of the rule identified by key over rows rows."""
+        base = 0
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - t0
+            peak = 0
+            if self.memory and tracemalloc.is_tracing():
+                peak = max(tracemalloc.get_traced_memory()[1] - base, 0)
+            self.record(key, RuleTiming(seconds, int(rows), peak))
+
+    def record(self, key: Hashable, timing: RuleTiming) -> None:
+        """Add timing to the rule's totals for the current input (and to the rules phase)."""
+        rules = self._inputs.setdefault(current_input(), {})
+        if key in rules:
+            rules[key].add(timing)
+        else:
+            rules[key] = RuleTiming(timing.seconds, timing.rows, timing.peak_bytes, timing.cached)
+        self.phases["rules"] += timing.seconds
+
+    def get(self, input_name: str | None, key: Hashable) -> RuleTiming | None:
+        return self._inputs.get(input_name, {}).get(key)
+
+    def run_block(self) -> dict[str, float]:
+        """The run-level `timing` block: seconds per phase plus total."""
+        return {k: round(v, 6) for k, v in self.phases.items()}
+
+
+def dumps_timed(report: dict[str, Any], dumps: Callable[[dict[str, Any]], str]) -> str:
+    """
+    dumps(report); when the report has a run-level `timing` block, the time the
+    first serialization took is written into it as `serialize` before the final one.
+    """
+    timing = report.get("timing")
+    if not isinstance(timing, dict):
+        return dumps(report)
+    t0 = time.perf_counter()
+    dumps(report)
+    seconds = time.perf_counter() - t0
+    timing["serialize"] = round(seconds, 6)
+    if "total" in timing:
+        timing["total"] = round(timing["total"] + seconds, 6)
+    return dumps(report)
@@ -0,0 +1,34 @@
+import pytest
+
+from benchmarks.cases import CASES, make_case
+from benchmarks.run import compare, measure, run_suite
+from fairy.validation.rulepack_runner import CHECK_TYPES
+
+
+def test_every_rule_type_has_a_case():
+    assert set(CASES) == CHECK_TYPES
+
+
+@pytest.mark.parametrize("rtype", sorted(CHECK_TYPES))
+def test_violation_rate_controls_the_outcome(rtype):
+    clean = measure(make_case(rtype, 500, violation_rate=0.0, cardinality=20), repeat=1)
+    dirty = measure(make_case(rtype, 500, violation_rate=0.2, cardinality=20), repeat=1)
+    assert (clean["status"], dirty["status"]) == ("PASS", "FAIL")
+    assert dirty["rows"] == 500 and dirty["peak_bytes"] > 0
+
+
+def test_compare_flags_slowdowns_beyond_threshold():
+    baseline = run_suite(["enum", "url"], [200], repeat=1, memory=False, log=lambda _: None)
+    current = {
+        "meta": dict(baseline["meta"]),
+        "results": {
+            "enum": {"200": {"rows_per_s": baseline["results"]["enum"]["200"]["rows_per_s"] * 0.5}},
+            "url": {"200": {"rows_per_s": baseline["results"]["url"]["200"]["rows_per_s"] * 0.9}},
+        },
+    }
+    (slower,) = compare(current, baseline, threshold=0.25)
+    assert slower.startswith("enum @ 200 rows")
+
+    current["meta"]["cardinality"] = 5
+    with pytest.raises(ValueError, match="cardinality"):
+        compare(current, baseline, threshold=0.25)
@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 
 from fairy.cli import cmd_preflight
+from fairy.core.services.provenance import FileHashes
 
 
 class DummyArgs:
@@ -36,21 +37,27 @@ def test_preflight_main_emits_out_dir_contract(tmp_path, monkeypatch):
     }
 
     def fake_run_profile(
-        profile_id: str, *, rulepack: Path, inputs: dict, fairy_version: str, params=None
+        profile_id: str,
+        *,
+        rulepack: Path,
+        inputs: dict,
+        fairy_version: str,
+        params=None,
+        timings=False,
     ):
         assert profile_id == "geo"  # optional
         assert "samples" in inputs and "files" in inputs
         return fake_report
 
-    def fake_sha256_file(path: Path, newline_stable: bool = True) -> str:
-        return "deadbeef"
+    def fake_sha256_files(paths: list[Path], newline_stable: bool = True) -> FileHashes:
+        return FileHashes(["deadbeef"] * len(paths), 0, 0.0)
 
     def fake_emit_md(md_path: Path, report: dict, resolved_codes, prior_codes):
         md_path.parent.mkdir(parents=True, exist_ok=True)
         md_path.write_text("# md", encoding="utf-8")
 
     monkeypatch.setattr("fairy.cli.cmd_preflight.run_profile", fake_run_profile)
-    monkeypatch.setattr("fairy.cli.cmd_preflight.sha256_file", fake_sha256_file)
+    monkeypatch.setattr("fairy.cli.cmd_preflight.sha256_files", fake_sha256_files)
     monkeypatch.setattr("fairy.cli.cmd_preflight.emit_preflight_markdown", fake_emit_md)
 
     rc = cmd_preflight.main(DummyArgs(out_dir))
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from fairy.cli import cmd_preflight
+from fairy.core.services.provenance import FileHashes
 
 
 class DummyArgs:
@@ -56,7 +57,13 @@ def test_preflight_main_emits_files(tmp_path, monkeypatch):
     }
 
     def fake_run_profile(
-        profile_id: str, *, rulepack: Path, inputs: dict, fairy_version: str, params=None
+        profile_id: str,
+        *,
+        rulepack: Path,
+        inputs: dict,
+        fairy_version: str,
+        params=None,
+        timings=False,
     ):
         return fake
 
@@ -81,19 +88,21 @@ def test_preflight_geo_does_not_emit_legacy_guidance(tmp_path, monkeypatch, caps
         "_legacy": {"attestation": {"fairy_version": "0.1.0"}},
     }
 
-    def fake_run_profile(profile_id: str, *, rulepack, inputs, fairy_version, params=None):
+    def fake_run_profile(
+        profile_id: str, *, rulepack, inputs, fairy_version, params=None, timings=False
+    ):
         assert profile_id == "geo"
         return fake_report
 
-    def fake_sha256_file(path: Path, newline_stable: bool = True) -> str:
-        return "deadbeef"
+    def fake_sha256_files(paths: list[Path], newline_stable: bool = True) -> FileHashes:
+        return FileHashes(["deadbeef"] * len(paths), 0, 0.0)
 
     def fake_emit_md(md_path: Path, report: dict, resolved_codes, prior_codes):
         md_path.parent.mkdir(parents=True, exist_ok=True)
         md_path.write_text("# md", encoding="utf-8")
 
     monkeypatch.setattr("fairy.cli.cmd_preflight.run_profile", fake_run_profile)
-    monkeypatch.setattr("fairy.cli.cmd_preflight.sha256_file", fake_sha256_file)
+    monkeypatch.setattr("fairy.cli.cmd_preflight.sha256_files", fake_sha256_files)
     monkeypatch.setattr("fairy.cli.cmd_preflight.emit_preflight_markdown", fake_emit_md)
 
     args = DummyArgs(out_json)
@@ -118,19 +127,21 @@ def test_preflight_legacy_emits_guidance(tmp_path, monkeypatch, capsys):
         "_legacy": {"attestation": {"fairy_version": "0.1.0"}},
     }
 
-    def fake_run_profile(profile_id: str, *, rulepack, inputs, fairy_version, params=None):
+    def fake_run_profile(
+        profile_id: str, *, rulepack, inputs, fairy_version, params=None, timings=False
+    ):
         assert profile_id == "geo"
         return fake_report
 
-    def fake_sha256_file(path: Path, newline_stable: bool = True) -> str:
-        return "deadbeef"
+    def fake_sha256_files(paths: list[Path], newline_stable: bool = True) -> FileHashes:
+        return FileHashes(["deadbeef"] * len(paths), 0, 0.0)
 
     def fake_emit_md(md_path: Path, report: dict, resolved_codes, prior_codes):
         md_path.parent.mkdir(parents=True, exist_ok=True)
         md_path.write_text("# md", encoding="utf-8")
 
     monkeypatch.setattr("fairy.cli.cmd_preflight.run_profile", fake_run_profile)
-    monkeypatch.setattr("fairy.cli.cmd_preflight.sha256_file", fake_sha256_file)
+    monkeypatch.setattr("fairy.cli.cmd_preflight.sha256_files", fake_sha256_files)
     monkeypatch.setattr("fairy.cli.cmd_preflight.emit_preflight_markdown", fake_emit_md)
 
     args = DummyArgs(out_json)
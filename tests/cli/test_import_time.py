@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+import pytest
+
+# Import-time budget (microseconds) for what fairy itself pulls in, measured with
+# `python -X importtime`; interpreter start-up imports are not counted
+BUDGET_US = 100_000
+HEAVY = ("pandas", "numpy", "pydantic", "yaml", "fairy.validation.rulepack_runner")
+
+
+def _importtime(*argv: str) -> tuple[int, set[str]]:
+    """(microseconds spent importing fairy's top-level imports, every module imported)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "fairy.cli", *argv],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total, modules = 0, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _self, cumulative, name = line[len("import time:") :].split("|")
+        modules.add(name.strip())
+        # Top-level entries (one leading space) include everything they imported
+        if name.startswith(" fairy"):
+            total += int(cumulative)
+    return total, modules
+
+
+@pytest.mark.parametrize("argv", [["--version"], ["--help"]])
+def test_top_level_cli_stays_light(argv):
+    total, modules = _importtime(*argv)
+    assert not modules & set(HEAVY)
+    assert total < BUDGET_US, f"fairy {' '.join(argv)} spent {total / 1000:.0f} ms importing"
+
+
+def test_subcommand_modules_load_when_chosen():
+    # -X importtime does not log importlib.import_module itself, only what the module imports
+    _total, modules = _importtime("rulepack", "--help")
+    assert "fairy.rulepack.loader" in modules
+    # validate / serve, and preflight
+    assert not modules & {"fairy.validation.result_cache", "fairy.core.services.preflight_profiles"}
@@ -0,0 +1,35 @@
+import pytest
+
+from fairy.cli import parser
+from fairy.cli.__main__ import main as fairy_main
+
+COMMANDS = [[name] for name in parser._COMMANDS]
+RUN_COMMANDS = [["run", name] for name in ("validate", "preflight", "rulepack")]
+
+
+def _help(argv, capsys):
+    with pytest.raises(SystemExit) as e:
+        fairy_main([*argv, "--help"])
+    assert e.value.code == 0
+    return capsys.readouterr().out
+
+
+def test_top_level_help_lists_every_command(capsys):
+    out = " ".join(_help([], capsys).split())
+    for name, (_module, help) in parser._COMMANDS.items():
+        assert name in out and help in out
+    assert "run" in out
+
+
+@pytest.mark.parametrize("argv", [[], ["run"], *COMMANDS, *RUN_COMMANDS])
+def test_lazy_help_matches_eager_registration(argv, capsys, monkeypatch):
+    lazy = _help(argv, capsys)
+    monkeypatch.setattr(parser, "_LAZY", False)
+    assert lazy == _help(argv, capsys)
+
+
+def test_unknown_command_is_rejected(capsys):
+    with pytest.raises(SystemExit) as e:
+        fairy_main(["nope"])
+    assert e.value.code == 2
+    assert "invalid choice: 'nope'" in capsys.readouterr().err
@@ -0,0 +1,213 @@
+import datetime
+import http.client
+import json
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+import yaml
+
+from fairy.cli import serve
+from fairy.cli.__main__ import main as fairy_main
+from fairy.validation.rulepack_runner import run_rulepack
+
+ART = Path("tests/fixtures/art-collections").resolve()
+ART_INPUTS = {
+    "artists": str(ART / "artists.csv"),
+    "artworks": str(ART / "artworks_fail_missing_artist.csv"),
+}
+PREFLIGHT = Path("tests/fixtures/preflight").resolve()
+GEO_RP = Path("tests/fixtures/rulepacks/geo_bulk_seq_min_v0_2_0.json").resolve()
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path):
+        super().__init__("localhost")
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.unix_path)
+
+
+@pytest.fixture
+def running(tmp_path):
+    servers = []
+
+    def start(service=None, **where):
+        service = service or serve.Service(workers=2, queue_size=2)
+        server = serve.make_server(service, **where)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append((server, service))
+        if "socket_path" in where:
+            return lambda: _UnixConnection(str(where["socket_path"]))
+        return lambda: http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+
+    yield start
+    for server, service in servers:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+
+def _request(connect, method, path, body=None):
+    conn = connect()
+    conn.request(method, path, body=json.dumps(body) if body is not None else None)
+    resp = conn.getresponse()
+    payload = json.loads(resp.read())
+    conn.close()
+    return resp.status, payload
+
+
+def _strip_times(report):
+    report = json.loads(json.dumps(report))
+    report["attestation"].pop("timestamp")
+    return report
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+def test_validate_answers_with_the_cli_report(running, tmp_path):
+    connect = running(socket_path=tmp_path / "fairy.sock")
+    body = {"rulepack": str(ART / "rulepack.yaml"), "inputs": ART_INPUTS}
+    status, answer = _request(connect, "POST", "/validate", body)
+    assert status == 200 and answer["exit_code"] == 1
+
+    rp = yaml.safe_load((ART / "rulepack.yaml").read_text())
+    inputs = {name: Path(p) for name, p in ART_INPUTS.items()}
+    expected = run_rulepack(inputs, rp, ART / "rulepack.yaml", datetime.datetime.now().isoformat())
+    assert _strip_times(answer["report"]) == _strip_times(expected)
+
+
+def test_rulepack_is_recompiled_only_when_it_changes(running, tmp_path):
+    service = serve.Service(workers=1, queue_size=0)
+    connect = running(service, port=0)
+    rp = tmp_path / "rp.yaml"
+    rp.write_text((ART / "rulepack.yaml").read_text())
+    body = {"rulepack": str(rp), "inputs": ART_INPUTS}
+    for _ in range(3):
+        assert _request(connect, "POST", "/validate", body)[1]["exit_code"] == 1
+    assert service.plans.compiles == 1
+
+    # Drop the foreign key rule: the next request sees the edit
+    text = yaml.safe_load(rp.read_text())
+    for res in text["resources"]:
+        res["rules"] = [r for r in res["rules"] if r["type"] != "foreign_key"]
+    rp.write_text(yaml.safe_dump(text))
+    assert _request(connect, "POST", "/validate", body)[1]["exit_code"] == 0
+    assert service.plans.compiles == 2
+    assert _request(connect, "GET", "/health")[1]["rulepacks"] == 1
+
+
+def test_preflight_answers_with_the_cli_report(running):
+    connect = running(port=0)
+    body = {
+        "profile": "geo",
+        "rulepack": str(GEO_RP),
+        "samples": str(PREFLIGHT / "samples.tsv"),
+        "files": str(PREFLIGHT / "files.tsv"),
+    }
+    status, answer = _request(connect, "POST", "/preflight", body)
+    assert status == 200
+    assert answer["exit_code"] == (0 if answer["report"]["summary"]["submission_ready"] else 1)
+    assert answer["report"]["metadata"]["inputs"]["samples"]["path"].endswith("samples.tsv")
+
+
+def test_full_queue_is_refused(running, monkeypatch):
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow(self, body):
+        started.set()
+        release.wait(10)
+        return {"exit_code": 0, "report": {}}
+
+    monkeypatch.setattr(serve.Service, "validate", slow)
+    connect = running(serve.Service(workers=1, queue_size=0), port=0)
+    first = threading.Thread(target=_request, args=(connect, "POST", "/validate", {}))
+    first.start()
+    assert started.wait(10)
+    status, answer = _request(connect, "POST", "/validate", {})
+    assert status == 503 and "busy" in answer["error"]
+    release.set()
+    first.join(10)
+    assert _request(connect, "POST", "/validate", {})[0] == 200
+
+
+@pytest.mark.parametrize(
+    "body, message",
+    [
+        ({"inputs": ART_INPUTS}, "rulepack must be a path"),
+        ({"rulepack": str(ART / "rulepack.yaml"), "input": "nope.csv"}, "input not found"),
+        (
+            {"rulepack": str(ART / "rulepack.yaml"), "inputs": ART_INPUTS, "chunksize": 0},
+            "--chunksize",
+        ),
+        ({"rulepack": str(ART / "rulepack.yaml"), "inputs": ART_INPUTS, "jobs": 4}, "unknown"),
+    ],
+)
+def test_bad_requests_are_answered_with_400(running, body, message):
+    connect = running(port=0)
+    status, answer = _request(connect, "POST", "/validate", body)
+    assert status == 400 and answer["exit_code"] == 2
+    assert message in answer["error"]
+
+
+def test_warm_cache_reuses_opened_key_indexes(tmp_path, monkeypatch):
+    service = serve.Service(workers=1, queue_size=0, cache=serve._WarmCache(tmp_path / "cache"))
+    artworks = tmp_path / "artworks_fail_missing_artist.csv"
+    body = {
+        "rulepack": str(ART / "rulepack.yaml"),
+        "inputs": {**ART_INPUTS, "artworks": str(artworks)},
+    }
+    text = Path(ART_INPUTS["artworks"]).read_text()
+    # Each edit of the source table re-runs its foreign key against the stored
+    # reference index: the first run builds it, the second opens it
+    codes = []
+    for edit in range(2):
+        artworks.write_text(text + "\n" * edit)
+        codes.append(service.submit("validate", body)["exit_code"])
+
+    opened = []
+    open_index = serve.KeyIndex.open
+    monkeypatch.setattr(
+        serve.KeyIndex, "open", lambda root: opened.append(root) or open_index(root)
+    )
+    artworks.write_text(text + "\n\n")
+    codes.append(service.submit("validate", body)["exit_code"])
+    service.close()
+    assert opened == []
+    assert codes == [1, 1, 1]
+
+
+@pytest.mark.parametrize("host", ["0.0.0.0", "192.0.2.1", "example.org"])
+def test_non_loopback_host_needs_allow_remote(host, capsys):
+    assert fairy_main(["serve", "--host", host, "--port", "0"]) == 2
+    assert "--allow-remote" in capsys.readouterr().err
+
+
+def test_result_cache_is_opt_in(tmp_path, monkeypatch):
+    caches = []
+    service = serve.Service
+
+    def recording(**kw):
+        caches.append(kw["cache"])
+        return service(**kw)
+
+    def no_listen(*args, **kwargs):
+        raise OSError("not listening in tests")
+
+    monkeypatch.setattr(serve, "Service", recording)
+    monkeypatch.setattr(serve, "make_server", no_listen)
+    monkeypatch.chdir(tmp_path)
+    assert fairy_main(["serve", "--port", "0"]) == 2
+    assert fairy_main(["serve", "--port", "0", "--cache-dir", str(tmp_path / "c")]) == 2
+    assert caches[0] is None and caches[1].root == tmp_path / "c"
+    assert not (tmp_path / ".fairy_cache").exists()
+
+
+def test_socket_without_unix_sockets_is_refused(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(serve, "_UnixServer", None)
+    assert fairy_main(["serve", "--socket", str(tmp_path / "fairy.sock")]) == 2
+    assert "use --port" in capsys.readouterr().err
+    assert not (tmp_path / "fairy.sock").exists()
@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from fairy.cli import validate_batch
+from fairy.cli.__main__ import main as fairy_main
+
+ART = Path("tests/fixtures/art-collections").resolve()
+
+
+def _jobs(tmp_path: Path, *jobs: dict) -> Path:
+    path = tmp_path / "jobs.jsonl"
+    path.write_text("\n".join(json.dumps(j) for j in jobs) + "\n")
+    return path
+
+
+def _job(job_id: str, artworks: str) -> dict:
+    return {
+        "id": job_id,
+        "inputs": {"artists": str(ART / "artists.csv"), "artworks": str(ART / artworks)},
+        "report_json": f"out/{job_id}.json",
+        "report_md": f"out/{job_id}.md",
+    }
+
+
+def _single(tmp_path: Path, artworks: str) -> dict:
+    out = tmp_path / f"single-{artworks}.json"
+    argv = [
+        "validate",
+        "--inputs",
+        f"artists={ART / 'artists.csv'}",
+        "--inputs",
+        f"artworks={ART / artworks}",
+        "--rulepack",
+        str(ART / "rulepack.yaml"),
+        "--report-json",
+        str(out),
+    ]
+    fairy_main(argv)
+    return json.loads(out.read_text())
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_batch_writes_each_job_and_a_summary(tmp_path, jobs):
+    jobs_file = _jobs(
+        tmp_path,
+        _job("ok", "artworks_pass.csv"),
+        _job("bad", "artworks_fail_missing_artist.csv"),
+        {"input": "missing.csv", "report_json": "out/missing.json"},
+    )
+    argv = ["validate", "--batch", str(jobs_file), "--rulepack", str(ART / "rulepack.yaml")]
+    assert fairy_main([*argv, "--jobs", jobs]) == 2
+
+    summary = json.loads((tmp_path / "jobs.summary.json").read_text())
+    assert summary["totals"] == {"jobs": 3, "pass": 1, "fail": 1, "error": 1}
+    ok, bad, missing = summary["jobs"]
+    assert (ok["id"], ok["exit_code"], bad["exit_code"]) == ("ok", 0, 1)
+    assert missing["id"] == "3" and "input not found" in missing["error"]
+    assert not (tmp_path / "out" / "missing.json").exists()
+    assert [rp["jobs"] for rp in summary["rulepacks"]] == [3]
+
+    for job, artworks in (("ok", "artworks_pass.csv"), ("bad", "artworks_fail_missing_artist.csv")):
+        report = json.loads((tmp_path / "out" / f"{job}.json").read_text())
+        assert report["resources"] == _single(tmp_path, artworks)["resources"]
+        assert (tmp_path / "out" / f"{job}.md").exists()
+
+
+def test_each_rulepack_is_compiled_once(tmp_path, monkeypatch):
+    compiled = []
+    compile_rulepack = validate_batch.compile_rulepack
+
+    def counting(rulepack):
+        compiled.append(rulepack["id"])
+        return compile_rulepack(rulepack)
+
+    monkeypatch.setattr(validate_batch, "compile_rulepack", counting)
+    jobs = [_job(f"j{i}", "artworks_pass.csv") for i in range(4)]
+    jobs_file = _jobs(tmp_path, *jobs)
+    summary = tmp_path / "summary.json"
+    argv = ["validate", "--batch", str(jobs_file), "--batch-summary", str(summary)]
+    assert fairy_main([*argv, "--rulepack", str(ART / "rulepack.yaml")]) == 0
+    assert len(compiled) == 1
+    assert json.loads(summary.read_text())["totals"]["pass"] == 4
+
+
+def test_bad_rulepack_errors_only_its_jobs(tmp_path):
+    (tmp_path / "broken.yaml").write_text("rules: [")
+    broken = {**_job("broken", "artworks_pass.csv"), "rulepack": "broken.yaml"}
+    jobs_file = _jobs(tmp_path, _job("ok", "artworks_pass.csv"), broken)
+    argv = ["validate", "--batch", str(jobs_file), "--rulepack", str(ART / "rulepack.yaml")]
+    assert fairy_main(argv) == 2
+    ok, broken = json.loads((tmp_path / "jobs.summary.json").read_text())["jobs"]
+    assert ok["exit_code"] == 0
+    assert broken["exit_code"] == 2 and "broken.yaml" in broken["error"]
+
+
+@pytest.mark.parametrize(
+    "line, message",
+    [
+        ("not json", "jobs.jsonl:2"),
+        ('{"id": "x"}', "needs inputs or input"),
+        ('{"id": "a", "input": "a.csv"}', "duplicate job id"),
+    ],
+)
+def test_malformed_jobs_file_runs_nothing(tmp_path, capsys, line, message):
+    jobs_file = tmp_path / "jobs.jsonl"
+    jobs_file.write_text(json.dumps({"id": "a", "input": "a.csv"}) + "\n" + line + "\n")
+    argv = ["validate", "--batch", str(jobs_file), "--rulepack", str(ART / "rulepack.yaml")]
+    assert fairy_main(argv) == 2
+    assert message in capsys.readouterr().err
+    assert not (tmp_path / "jobs.summary.json").exists()
+
+
+def test_batch_rejects_single_run_flags(tmp_path):
+    jobs_file = _jobs(tmp_path, _job("ok", "artworks_pass.csv"))
+    argv = ["validate", "--batch", str(jobs_file), "--rulepack", str(ART / "rulepack.yaml")]
+    assert fairy_main([*argv, "--report-json", "x.json"]) == 2
+    assert fairy_main(["validate", "--batch-summary", "s.json", "x.csv"]) == 2
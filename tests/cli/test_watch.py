@@ -0,0 +1,141 @@
+import functools
+import json
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from fairy.cli import cmd_preflight, watch
+from fairy.cli import validate as cmd_validate
+from fairy.cli.__main__ import main as fairy_main
+from fairy.validation import rulepack_runner
+
+ART = Path("tests/fixtures/art-collections").resolve()
+PREFLIGHT = Path("tests/fixtures/preflight").resolve()
+GEO_RP = Path("tests/fixtures/rulepacks/geo_bulk_seq_min_v0_2_0.json").resolve()
+
+
+def _until(predicate, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for a watch run"
+        time.sleep(0.02)
+
+
+def _start(monkeypatch, argv):
+    """Run `fairy <argv> --watch` in a thread; returns (stop, thread, result)."""
+    stop = threading.Event()
+    monkeypatch.setattr(watch, "watch", functools.partial(watch.watch, stop=stop))
+    monkeypatch.setattr(cmd_preflight, "watch", functools.partial(watch.watch, stop=stop))
+    result = []
+    thread = threading.Thread(
+        target=lambda: result.append(fairy_main([*argv, "--watch", "--watch-interval", "0.05"])),
+        daemon=True,
+    )
+    thread.start()
+    return stop, thread, result
+
+
+def test_validate_watch_reruns_on_save(tmp_path, monkeypatch):
+    rp = tmp_path / "rulepack.yaml"
+    shutil.copy(ART / "rulepack.yaml", rp)
+    artworks = tmp_path / "artworks_fail_missing_artist.csv"
+    shutil.copy(ART / "artworks_fail_missing_artist.csv", artworks)
+    report = tmp_path / "report.json"
+
+    compiles, reports = [], []
+    compile_rulepack = rulepack_runner.compile_rulepack
+    monkeypatch.setattr(
+        rulepack_runner, "compile_rulepack", lambda r: compiles.append(1) or compile_rulepack(r)
+    )
+    write_reports = cmd_validate._write_reports
+    monkeypatch.setattr(
+        cmd_validate,
+        "_write_reports",
+        lambda r, *a, **k: write_reports(r, *a, **k) or reports.append(r),
+    )
+    argv = ["validate", "--inputs", f"artists={ART / 'artists.csv'}"]
+    argv += ["--inputs", f"artworks={artworks}", "--rulepack", str(rp)]
+    stop, thread, result = _start(monkeypatch, [*argv, "--report-json", str(report)])
+    try:
+        _until(lambda: len(reports) == 1)
+        assert reports[0]["summary"]["fail"] == 1
+
+        # Fixing the data re-runs it against the same compiled rulepack
+        artworks.write_text((ART / "artworks_pass.csv").read_text())
+        _until(lambda: len(reports) == 2)
+        assert reports[1]["summary"]["fail"] == 0
+        assert json.loads(report.read_text())["summary"]["fail"] == 0
+        assert len(compiles) == 1
+
+        # Only a rulepack edit compiles it again
+        rp.write_text(rp.read_text() + "\n# edited\n")
+        _until(lambda: len(reports) == 3)
+        assert len(compiles) == 2
+    finally:
+        stop.set()
+        thread.join(10)
+    assert result == [0]
+
+
+def test_validate_watch_keeps_going_after_a_bad_save(tmp_path, monkeypatch, capsys):
+    rp = tmp_path / "rulepack.yaml"
+    shutil.copy(ART / "rulepack.yaml", rp)
+    data = tmp_path / "artworks_pass.csv"
+    shutil.copy(ART / "artworks_pass.csv", data)
+    report = tmp_path / "report.json"
+    stop, thread, result = _start(
+        monkeypatch, ["validate", str(data), "--rulepack", str(rp), "--report-json", str(report)]
+    )
+    try:
+        _until(report.exists)
+        rp.write_text("rules: [")
+        _until(lambda: "ERROR" in capsys.readouterr().err)
+        report.unlink()
+        shutil.copy(ART / "rulepack.yaml", rp)
+        _until(report.exists)
+    finally:
+        stop.set()
+        thread.join(10)
+    assert len(result) == 1
+
+
+def test_preflight_watch_rewrites_the_reports(tmp_path, monkeypatch):
+    samples = tmp_path / "samples.tsv"
+    shutil.copy(PREFLIGHT / "samples.tsv", samples)
+    out = tmp_path / "out"
+    argv = ["preflight", "geo", "--rulepack", str(GEO_RP), "--samples", str(samples)]
+    argv += ["--files", str(PREFLIGHT / "files.tsv"), "--out-dir", str(out)]
+    stop, thread, _result = _start(monkeypatch, argv)
+    report = out / "preflight_report.json"
+    try:
+        _until(report.exists)
+        first = json.loads(report.read_text())["metadata"]["inputs"]["samples"]["sha256"]
+        samples.write_text(samples.read_text() + "\n")
+        _until(
+            lambda: json.loads(report.read_text())["metadata"]["inputs"]["samples"]["sha256"]
+            != first
+        )
+        assert (out / "preflight_report.md").exists()
+    finally:
+        stop.set()
+        thread.join(10)
+    assert not thread.is_alive()
+
+
+def test_watch_rejects_batch_and_bad_interval(tmp_path):
+    rp = str(ART / "rulepack.yaml")
+    assert fairy_main(["validate", "--batch", "jobs.jsonl", "--rulepack", rp, "--watch"]) == 2
+    argv = ["validate", str(ART / "artworks_pass.csv"), "--rulepack", rp, "--watch"]
+    assert fairy_main([*argv, "--watch-interval", "0"]) == 2
+
+
+def test_file_watcher_waits_for_a_save_to_settle(tmp_path):
+    path = tmp_path / "samples.tsv"
+    path.write_text("a\n")
+    watcher = watch.FileWatcher([path], interval=0.05)
+    path.write_text("a\nb\n")
+    assert watcher.wait() == [path]
+    stop = threading.Event()
+    stop.set()
+    assert watcher.wait(stop) is None
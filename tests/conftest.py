@@ -1,4 +1,6 @@
+import shutil
 import subprocess
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -9,6 +11,7 @@ except ImportError:
     freeze_time = None  # freezegun not installed
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ART_DIR = PROJECT_ROOT / "tests" / "fixtures" / "art-collections"
 
 
 def _find_rulepack() -> Path:
@@ -43,6 +46,36 @@ def files_path() -> Path:
     return p
 
 
+@pytest.fixture(scope="session")
+def art_rulepack() -> Path:
+    return ART_DIR / "rulepack.yaml"
+
+
+@pytest.fixture
+def art_inputs() -> dict[str, Path]:
+    """The art-collections tables, with one artwork citing a missing artist."""
+    return {
+        "artists": ART_DIR / "artists.csv",
+        "artworks": ART_DIR / "artworks_fail_missing_artist.csv",
+    }
+
+
+@pytest.fixture
+def art_inputs_copy(tmp_path, art_inputs) -> dict[str, Path]:
+    """art_inputs copied into tmp_path (same file names), for tests that edit them."""
+    out = {}
+    for name, src in art_inputs.items():
+        out[name] = tmp_path / src.name
+        shutil.copy(src, out[name])
+    return out
+
+
+@pytest.fixture(scope="session")
+def now() -> str:
+    """A fixed run timestamp for run_rulepack."""
+    return datetime(2025, 1, 1).isoformat()
+
+
 @pytest.fixture
 def run_cli():
     """Run the argparse CLI (module = fairy.cli.run). Returns (code, stdout, stderr)."""
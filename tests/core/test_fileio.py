@@ -0,0 +1,54 @@
+import os
+import stat
+
+import pytest
+
+from fairy.core.fileio import write_text_atomic
+
+
+def _mode(path):
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+@pytest.fixture
+def umask_022():
+    old = os.umask(0o022)
+    yield
+    os.umask(old)
+
+
+def test_new_file_gets_the_plain_write_mode(tmp_path, umask_022):
+    plain, atomic = tmp_path / "plain.json", tmp_path / "atomic.json"
+    plain.write_text("{}")
+    write_text_atomic(atomic, "{}")
+    assert _mode(atomic) == _mode(plain)
+    assert _mode(atomic) & 0o044 == 0o044  # group and others can read it
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_new_file_follows_the_current_umask(tmp_path):
+    old = os.umask(0o077)  # set after fairy.core.fileio was imported
+    try:
+        write_text_atomic(tmp_path / "private.json", "{}")
+    finally:
+        os.umask(old)
+    assert _mode(tmp_path / "private.json") == 0o600
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_replacing_keeps_the_existing_mode(tmp_path):
+    path = tmp_path / "report.md"
+    path.write_text("old")
+    path.chmod(0o640)
+    write_text_atomic(path, "new")
+    assert path.read_text() == "new"
+    assert _mode(path) == 0o640
+
+
+def test_failed_write_leaves_the_old_file(tmp_path):
+    path = tmp_path / "report.json"
+    write_text_atomic(path, "old")
+    with pytest.raises(UnicodeEncodeError):
+        write_text_atomic(path, "new \ud800")
+    assert path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["report.json"]
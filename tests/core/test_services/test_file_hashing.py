@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2025 Jennifer Slotnick
+
+import os
+import threading
+from hashlib import sha256
+
+import pytest
+
+from fairy.core.services import provenance
+from fairy.core.services.provenance import sha256_file, sha256_files
+
+
+@pytest.mark.parametrize("block", [1, 2, 3, 1 << 20])
+def test_newline_stable_hash_ignores_line_endings(tmp_path, monkeypatch, block):
+    monkeypatch.setattr(provenance, "_BLOCK_BYTES", block)
+    lf = tmp_path / "lf.tsv"
+    lf.write_bytes(b"a\tb\n1\t2\n\n3\t4\n")
+    expected = sha256(lf.read_bytes()).hexdigest()
+    for name, data in (("crlf", b"a\tb\r\n1\t2\r\n\r\n3\t4\r\n"), ("cr", b"a\tb\r1\t2\r\r3\t4\r")):
+        p = tmp_path / f"{name}.tsv"
+        p.write_bytes(data)
+        assert sha256_file(p, newline_stable=True) == expected
+        assert sha256_file(p) == sha256(data).hexdigest()
+
+
+def test_sha256_files_keeps_order_and_reports_throughput(tmp_path):
+    paths = []
+    for i in range(4):
+        p = tmp_path / f"f{i}.csv"
+        p.write_bytes(b"x,y\r\n" * i)  # f0 is empty
+        paths.append(p)
+    got = sha256_files(paths, newline_stable=True, max_workers=3)
+    assert got.digests == [sha256(b"x,y\n" * i).hexdigest() for i in range(4)]
+    assert got.bytes == sum(5 * i for i in range(4))
+    assert got.mb_per_s >= 0
+
+
+CRLF = b"a\tb\r\n1\t2\r\n\r\n3\t4\r"
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs os.mkfifo")
+@pytest.mark.parametrize("newline_stable", [False, True])
+def test_pipes_are_read_in_blocks(tmp_path, monkeypatch, newline_stable):
+    monkeypatch.setattr(provenance, "_BLOCK_BYTES", 3)  # CRs land on block edges
+    fifo = tmp_path / "in.tsv"
+    os.mkfifo(fifo)
+    writer = threading.Thread(target=fifo.write_bytes, args=(CRLF,))
+    writer.start()
+    got = sha256_file(fifo, newline_stable=newline_stable)
+    writer.join()
+    regular = tmp_path / "regular.tsv"
+    regular.write_bytes(CRLF)
+    assert got == sha256_file(regular, newline_stable=newline_stable) != sha256(b"").hexdigest()
+
+
+def test_unmappable_file_is_read_in_blocks(tmp_path, monkeypatch):
+    def no_mmap(*a, **kw):
+        raise OSError("mmap not supported")
+
+    p = tmp_path / "data.tsv"
+    p.write_bytes(CRLF)
+    expected = sha256_file(p, newline_stable=True)
+    monkeypatch.setattr(provenance.mmap, "mmap", no_mmap)
+    assert sha256_file(p, newline_stable=True) == expected
+    assert sha256_file(p) == sha256(CRLF).hexdigest()
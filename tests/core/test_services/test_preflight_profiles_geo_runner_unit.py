@@ -18,12 +18,15 @@ def test_geo_runner_calls_validator_run_rulepack_with_expected_args(tmp_path, mo
 
     captured = {}
 
-    def fake_run_rulepack(*, rulepack_path, samples_path, files_path, fairy_version, params):
+    def fake_run_rulepack(
+        *, rulepack_path, samples_path, files_path, fairy_version, params, timings=False
+    ):
         captured["rulepack_path"] = rulepack_path
         captured["samples_path"] = samples_path
         captured["files_path"] = files_path
         captured["fairy_version"] = fairy_version
         captured["params"] = params
+        captured["timings"] = timings
         return {"ok": True}
 
     # IMPORTANT: _run_geo imports validator.run_rulepack inside the function.
@@ -47,6 +50,7 @@ def test_geo_runner_calls_validator_run_rulepack_with_expected_args(tmp_path, mo
     assert captured["files_path"] == files
     assert captured["fairy_version"] == "9.9.9"
     assert captured["params"] == params
+    assert captured["timings"] is False
 
 
 def test_geo_runner_requires_samples_and_files_paths(tmp_path):
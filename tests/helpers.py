@@ -9,6 +9,7 @@ VOLATILE_KEYS = {
     "sha256",
     "timestamp",
     "duration_ms",
+    "timing",  # --timings blocks (per rule and per run)
     "run_id",
     "path",
 }
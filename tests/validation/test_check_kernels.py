@@ -0,0 +1,57 @@
+import pandas as pd
+
+from fairy.validation.rulepack_runner import check_enum, check_range
+
+
+def _rows(result):
+    status, ev = result
+    return status, (ev.get("out_of_set") or {}).get("rows", [])
+
+
+def test_check_enum_normalized_membership():
+    df = pd.DataFrame({"c": [" PreservedSpecimen ", "humanobservation", "Bogus", "", None]})
+    allow = ["PreservedSpecimen", "HumanObservation"]
+    status, rows = _rows(check_enum(df, "c", allow, {"trim": True, "casefold": True}, "warn"))
+    assert status == "WARN"
+    # Bogus, empty and NA are out of set (1-based rows)
+    assert rows == [3, 4, 5]
+
+
+def test_check_enum_without_normalize_compares_exact_strings():
+    df = pd.DataFrame({"c": ["US", "us", " US", 1]})
+    status, rows = _rows(check_enum(df, "c", ["US", 1], {}, "fail"))
+    assert status == "FAIL"
+    # values are compared as strings, so the int allow entry never matches
+    assert rows == [2, 3, 4]
+
+
+def test_check_enum_pass_and_config_errors():
+    df = pd.DataFrame({"c": ["a", "b"]})
+    assert check_enum(df, "c", ["a", "b"], {}, "fail") == ("PASS", {"normalized": False})
+    assert check_enum(df, "c", [], {}, "fail") == ("FAIL", {"error": "config_missing_allow"})
+    assert check_enum(df, "zz", ["a"], {}, "fail")[1]["error"] == "column_not_found"
+
+
+def test_check_range_counts_each_row_once_and_reports_non_numeric():
+    df = pd.DataFrame({"x": ["-1", "oops", "0", "5", "", "10"]})
+    status, ev = check_range(df, "x", 0, 9, True, "fail")
+    assert status == "FAIL"
+    oob = ev["out_of_bounds"]
+    assert oob["rows"] == [1, 2, 5, 6]
+    assert oob["count"] == 4
+    assert oob["non_numeric_count"] == 2
+
+    # inverted bounds: every numeric value breaks both, but is still counted once
+    status, ev = check_range(df, "x", 100, -100, False, "warn")
+    assert ev["out_of_bounds"]["count"] == 6
+    assert ev["out_of_bounds"]["rows"] == [1, 2, 3, 4, 5, 6]
+
+
+def test_check_range_per_side_inclusive():
+    df = pd.DataFrame({"x": ["0", "5", "9"]})
+    assert check_range(df, "x", 0, 9, "both", "fail") == ("PASS", {"count": 0})
+    assert check_range(df, "x", 0, 9, "left", "fail")[1]["out_of_bounds"]["rows"] == [3]
+    assert check_range(df, "x", 0, 9, "right", "fail")[1]["out_of_bounds"]["rows"] == [1]
+    assert check_range(df, "x", 0, 9, "neither", "fail")[1]["out_of_bounds"]["rows"] == [1, 3]
+    status, ev = check_range(df, "x", 0, 9, "sideways", "fail")
+    assert status == "FAIL" and ev["error"] == "config_invalid_inclusive"
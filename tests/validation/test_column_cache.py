@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from fairy.validation.column_cache import ColumnCache
+from fairy.validation.rulepack_runner import check_non_empty_trimmed, check_required
+
+
+def test_views_are_memoized_and_match_pandas():
+    df = pd.DataFrame({"c": [" A ", "b", "", " A ", None, "3"]}, dtype=object)
+    cache = ColumnCache(df)
+
+    assert cache.distinct("c") is cache.distinct("c")
+    codes, distinct = cache.distinct("c")
+    assert cache.stripped("c").iloc[codes].tolist()[:3] == ["A", "b", ""]
+    assert cache.casefolded("c").iloc[codes[0]] == " a "
+    assert cache.normalized("c", trim=True, casefold=True).iloc[codes[0]] == "a"
+    assert cache.blank("c").tolist() == [False, False, True, False, True, False]
+    assert cache.blank("c") is cache.blank("c")
+
+    expected = pd.to_numeric(df["c"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    assert np.array_equal(cache.numeric("c"), expected, equal_nan=True)
+
+
+def test_eviction_keeps_cache_under_budget():
+    df = pd.DataFrame({f"c{i}": [str(j) for j in range(1000)] for i in range(4)})
+    cache = ColumnCache(df, max_bytes=20_000)
+    for c in df.columns:
+        cache.numeric(c)  # 8 KB each
+    assert cache.nbytes <= 20_000
+    assert ("numeric", "c3") in cache._views
+    assert ("numeric", "c0") not in cache._views
+
+    # A view larger than the whole budget is computed but not kept
+    tiny = ColumnCache(df, max_bytes=100)
+    assert len(tiny.numeric("c0")) == 1000
+    assert tiny.nbytes == 0
+
+
+def test_rules_share_a_cache():
+    df = pd.DataFrame({"c": ["x", " ", "y"]})
+    cache = ColumnCache(df)
+    status, ev = check_required(df, ["c"], "fail", cache=cache)
+    assert status == "FAIL" and ev["nullish"]["rows_by_column"] == {"c": [2]}
+    blank = cache._views[("blank", "c")][0]
+    check_non_empty_trimmed(df, "c", "fail", cache=cache)
+    assert cache._views[("blank", "c")][0] is blank
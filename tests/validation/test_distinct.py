@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from fairy.validation.distinct import eval_distinct, factorize_distinct, map_distinct
+
+
+def test_map_distinct_calls_predicate_once_per_value():
+    s = pd.Series(["a", "b", "a", None, "b", None, "a"])
+    seen = []
+
+    def pred(v):
+        seen.append(v)
+        return pd.isna(v) or v == "a"
+
+    out = map_distinct(s, pred)
+    assert out.tolist() == [True, False, True, True, False, True, True]
+    # a, b and one NA slot
+    assert len(seen) == 3
+
+
+def test_mixed_object_columns_are_not_collapsed():
+    # 1, 1.0 and True hash equal but stringify differently
+    s = pd.Series([1, 1.0, True, "1"], dtype=object)
+    assert map_distinct(s, lambda v: str(v) == "1").tolist() == [True, False, False, True]
+
+
+def test_eval_distinct_vectorized_fn_and_empty():
+    s = pd.Series(["x", "Y", "x"], dtype="string")
+    out = eval_distinct(s, lambda u: u.str.lower().eq("y").to_numpy(dtype=bool))
+    assert out.tolist() == [False, True, False]
+
+    codes, distinct = factorize_distinct(pd.Series([], dtype=object))
+    assert len(codes) == 0 and len(distinct) == 0
+    assert map_distinct(pd.Series([], dtype=object), bool).dtype == np.bool_
@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+
+from fairy.validation.evidence import EvidencePolicy, bound_evidence, row_ranges
+from fairy.validation.rulepack_runner import run_rulepack, write_markdown
+
+
+def test_row_ranges():
+    assert row_ranges([]) == []
+    assert row_ranges([1, 2, 3, 5, 8, 9, 10]) == [[1, 3], [5, 5], [8, 10]]
+
+
+def test_bound_evidence_caps_every_row_list():
+    ev = {
+        "count": 5,
+        "duplicates": [{"rows": [1, 2, 3, 4, 9]}],
+        "nullish": {"rows_by_column": {"a": [1, 2, 3], "b": [4]}},
+        "remediation": {"links": [{"row": r, "url": "u"} for r in range(1, 6)]},
+    }
+    got, cut = bound_evidence(ev, EvidencePolicy(max_rows=2))
+
+    assert got["count"] == 5
+    assert got["duplicates"] == [{"rows": [1, 2], "rows_total": 5, "rows_ranges": [[1, 4], [9, 9]]}]
+    assert got["nullish"] == {
+        "rows_by_column": {"a": [1, 2], "b": [4]},
+        "rows_by_column_total": {"a": 3},
+        "rows_by_column_ranges": {"a": [[1, 3]]},
+    }
+    assert len(got["remediation"]["links"]) == 2 and got["remediation"]["links_total"] == 5
+    assert [where for where, _ in cut] == [
+        "duplicates[0].rows",
+        "nullish.rows_by_column.a",
+        "remediation.links",
+    ]
+    assert bound_evidence(ev, EvidencePolicy()) == (ev, [])
+
+
+def test_run_rulepack_evidence_policy_and_sidecar(tmp_path):
+    data = tmp_path / "data.csv"
+    data.write_text("v\n" + "bad\n" * 50 + "ok\n", encoding="utf-8")
+    rule = {"id": "v_enum", "type": "enum", "severity": "fail", "column": "v", "allow": ["ok"]}
+    rp = {"resources": [{"pattern": "*.csv", "rules": [rule]}]}
+    sidecar = tmp_path / "rows.jsonl"
+
+    report = run_rulepack(
+        {"default": data},
+        rp,
+        Path("rp.yml"),
+        "2025-01-01T00:00:00",
+        evidence=EvidencePolicy(max_rows=3, sidecar=sidecar),
+    )
+
+    o = report["resources"][0]["rules"][0]["evidence"]["out_of_set"]
+    assert o == {"count": 50, "rows": [1, 2, 3], "rows_total": 50, "rows_ranges": [[1, 50]]}
+    assert report["metadata"]["evidence"] == {"max_rows": 3, "sidecar": str(sidecar)}
+    (rec,) = [json.loads(line) for line in sidecar.read_text().splitlines()]
+    assert rec == {
+        "resource": "default",
+        "rule": "v_enum",
+        "path": "out_of_set.rows",
+        "rows": list(range(1, 51)),
+    }
+    assert "Out of set rows [1, 2, 3] (+47 more) (count=50)" in write_markdown(report)
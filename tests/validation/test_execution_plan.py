@@ -0,0 +1,107 @@
+from pathlib import Path
+
+import yaml
+
+from fairy.validation.rulepack_runner import ExecutionPlan, compile_rulepack, run_rulepack
+
+
+def test_compile_rulepack_resolves_rules_per_filename(art_rulepack):
+    plan = compile_rulepack(yaml.safe_load(art_rulepack.read_text()))
+    assert isinstance(plan, ExecutionPlan)
+    assert plan.rulepack_id == "art-collections"
+
+    ids = [r.id for r in plan.rules_for(Path("artworks_pass.csv"))]
+    assert ids == sorted(ids)
+    assert "artworks_artist_fk" in ids
+    assert [r.id for r in plan.rules_for(Path("unrelated.csv"))] == []
+
+    fk = next(r for r in plan.rules_for(Path("artworks_pass.csv")) if r.type == "foreign_key")
+    assert fk.cross_table
+
+
+def test_compile_rulepack_old_schema_patterns():
+    rp = yaml.safe_load(Path("tests/fixtures/rulepacks/regex_demo.yaml").read_text())
+    plan = compile_rulepack(rp)
+    assert [r.id for r in plan.rules_for(Path("regex_demo.csv"))] == [
+        "product_name_no_control_chars",
+        "sample_id_format",
+    ]
+    # old schema only globs when the pattern contains '*'
+    assert plan.rules_for(Path("other.csv")) == ()
+
+
+def test_columns_for_groups_rules_by_column(art_rulepack):
+    plan = compile_rulepack(yaml.safe_load(art_rulepack.read_text()))
+    by_col = plan.columns_for(Path("artists.csv"))
+    assert by_col["artistId"] == ("artists_required", "artists_unique_id")
+    assert by_col["artistName"] == ("artists_name_non_empty", "artists_required")
+
+
+def test_run_rulepack_accepts_precompiled_plan(art_rulepack, art_inputs, now):
+    rp = yaml.safe_load(art_rulepack.read_text())
+    from_dict = run_rulepack(art_inputs, rp, art_rulepack, now)
+    plan = compile_rulepack(rp)
+    assert run_rulepack(art_inputs, plan, art_rulepack, now) == from_dict
+    # a plan is reusable across runs
+    assert run_rulepack(art_inputs, plan, art_rulepack, now) == from_dict
+
+
+def test_compiled_config_errors_keep_column_precedence(tmp_path, now):
+    csv = tmp_path / "data.csv"
+    csv.write_text("a\nx\n")
+    rp = {
+        "id": "cfg",
+        "version": "0",
+        "resources": [
+            {
+                "pattern": "data.csv",
+                "rules": [
+                    {"id": "r1", "type": "regex", "column": "a", "regex": "["},
+                    {"id": "r2", "type": "regex", "column": "missing", "regex": "["},
+                    {"id": "r3", "type": "nope"},
+                ],
+            }
+        ],
+    }
+    report = run_rulepack({"default": csv}, rp, tmp_path / "rp.yml", now)
+    by_id = {r["id"]: r["evidence"] for r in report["resources"][0]["rules"]}
+    assert by_id["r1"]["error"] == "invalid_regex"
+    assert by_id["r2"]["error"] == "column_not_found"
+    assert by_id["r3"]["error"] == "unknown_rule_type"
+
+
+def test_projection_loads_only_referenced_columns(tmp_path, now):
+    data = tmp_path / "wide.csv"
+    data.write_text("id,name,unused1,unused2\n1,a,x,y\n1,b,x,y\n")
+    refs = tmp_path / "refs.csv"
+    refs.write_text("ref,other\n1,z\n")
+    rp = {
+        "id": "wide",
+        "version": "0.1.0",
+        "resources": [
+            {
+                "pattern": "wide.csv",
+                "rules": [
+                    {"id": "id_unique", "type": "unique", "columns": ["id"]},
+                    {"id": "need_cols", "type": "required", "columns": ["name", "missing"]},
+                    {
+                        "id": "fk",
+                        "type": "foreign_key",
+                        "from": {"table": "wide", "field": "id"},
+                        "to": {"table": "refs", "field": "ref"},
+                    },
+                    {"id": "bad_col", "type": "enum", "column": "nope", "allow": ["a"]},
+                ],
+            }
+        ],
+    }
+    plan = compile_rulepack(rp)
+    inputs = {"wide": data, "refs": refs}
+    assert plan.projection(inputs) == {"wide": {"id", "name", "missing", "nope"}, "refs": {"ref"}}
+
+    report = run_rulepack(inputs, plan, Path("rp.yml"), now)
+    rules = {r["id"]: r for r in report["resources"][0]["rules"]}
+    assert rules["need_cols"]["evidence"]["missing_columns"] == ["missing"]
+    # column_not_found still lists the whole header, not just the loaded columns
+    assert rules["bad_col"]["evidence"]["available_columns"] == ["id", "name", "unused1", "unused2"]
+    assert [i["rows"] for i in report["attestation"]["inputs"]] == [2, 1]
@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+
+from fairy.validation import foreign_keys
+from fairy.validation.foreign_keys import ReferenceIndex
+from fairy.validation.rulepack_runner import run_rulepack
+
+
+def test_reference_index_composite_missing_skips_null_keys():
+    ref = pd.DataFrame({"a": ["1", "1", "2", None], "b": ["x", "y", "x", "z"]})
+    src = pd.DataFrame({"a": ["1", "2", "2", None, "3"], "b": ["y", "y", "x", "q", "x"]})
+    index = ReferenceIndex(ref, ("a", "b"))
+    assert index.missing(src, ("a", "b")).tolist() == [False, True, False, False, True]
+    assert ReferenceIndex(ref, ("a",)).missing(src, ("a",)).tolist() == [
+        False,
+        False,
+        False,
+        False,
+        True,
+    ]
+
+
+def _write(tmp_path):
+    (tmp_path / "items.csv").write_text(
+        "id,site,plot\n1,S1,P1\n2,S1,P9\n3,S2,P1\n4,S9,P1\n5,S1,P9\n", encoding="utf-8"
+    )
+    (tmp_path / "plots.csv").write_text("site,plot\nS1,P1\nS2,P1\nS2,P2\n", encoding="utf-8")
+    inputs = {"items": tmp_path / "items.csv", "plots": tmp_path / "plots.csv"}
+    rules = [
+        {
+            "id": "plot_fk",
+            "type": "foreign_key",
+            "severity": "fail",
+            "from": {"table": "items", "fields": ["site", "plot"]},
+            "to": {"table": "plots", "fields": ["site", "plot"]},
+        },
+        {
+            "id": "site_fk",
+            "type": "foreign_key",
+            "severity": "warn",
+            "from": {"table": "items", "field": "site"},
+            "to": {"table": "plots", "field": "site"},
+        },
+    ]
+    return inputs, {"resources": [{"pattern": "items.csv", "rules": rules}]}
+
+
+@pytest.mark.parametrize("kw", [{}, {"jobs": 2}, {"chunksize": 2}])
+def test_composite_foreign_key_rows(tmp_path, kw, now):
+    inputs, rp = _write(tmp_path)
+    report = run_rulepack(inputs, rp, tmp_path / "rp.yml", now, **kw)
+    plot_fk, site_fk = report["resources"][0]["rules"]
+
+    assert plot_fk["status"] == "FAIL"
+    assert plot_fk["evidence"] == {
+        "missing_values": [["S1", "P9"], ["S9", "P1"]],
+        "missing_count_estimate": 2,
+        "count": 3,
+        "rows": [2, 4, 5],
+        "from": {"table": "items", "fields": ["site", "plot"]},
+        "to": {"table": "plots", "fields": ["site", "plot"]},
+    }
+    assert site_fk["status"] == "WARN"
+    assert site_fk["evidence"]["rows"] == [4]
+    assert site_fk["evidence"]["from"] == {"table": "items", "field": "site"}
+
+
+def test_reference_index_is_built_once_per_table_and_fields(tmp_path, monkeypatch, now):
+    inputs, rp = _write(tmp_path)
+    rules = rp["resources"][0]["rules"]
+    rules.append({**rules[0], "id": "plot_fk_again"})
+    built = []
+    real = foreign_keys.ReferenceIndex.__init__
+
+    def spy(self, frame, fields):
+        built.append(fields)
+        real(self, frame, fields)
+
+    monkeypatch.setattr(foreign_keys.ReferenceIndex, "__init__", spy)
+    run_rulepack(inputs, rp, tmp_path / "rp.yml", now)
+    assert sorted(built) == [("site",), ("site", "plot")]
+
+
+def test_mismatched_fk_fields_is_a_config_error(tmp_path, now):
+    inputs, rp = _write(tmp_path)
+    rp["resources"][0]["rules"][0]["to"]["fields"] = ["site"]
+    report = run_rulepack(inputs, rp, tmp_path / "rp.yml", now)
+    assert report["resources"][0]["rules"][0]["evidence"]["error"] == "config_fk_fields_mismatch"
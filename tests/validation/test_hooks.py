@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from fairy.cli import validate as cmd_validate
+from fairy.core.services import validator
+from fairy.validation.hooks import HOOKS
+from fairy.validation.rulepack_runner import run_rulepack
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def on_load(self, event):
+        self.events.append(event)
+
+    def on_rule_start(self, event):
+        self.events.append(event)
+
+    def on_rule_end(self, event):
+        self.events.append(event)
+
+    def on_write(self, event):
+        self.events.append(event)
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_rule_events_pair_up_per_input(chunksize, art_rulepack, art_inputs, now):
+    rp = yaml.safe_load(art_rulepack.read_text())
+    with HOOKS.registered(Recorder()) as rec:
+        report = run_rulepack(art_inputs, rp, art_rulepack, now, chunksize=chunksize)
+
+    loads = [e for e in rec.events if e.stage == "on_load"]
+    assert {e.input for e in loads} == set(art_inputs)
+    for att in report["attestation"]["inputs"]:
+        assert sum(e.rows for e in loads if e.input == att["name"]) == att["rows"]
+
+    starts = [(e.input, e.rule, e.rows) for e in rec.events if e.stage == "on_rule_start"]
+    ends = [(e.input, e.rule, e.rows) for e in rec.events if e.stage == "on_rule_end"]
+    assert starts == ends
+    ran = {(res["name"], r["id"]) for res in report["resources"] for r in res["rules"]}
+    assert {(i, r) for i, r, _ in ends} == ran
+    assert all(e.seconds >= 0 for e in rec.events)
+    assert not HOOKS.rules
+
+
+def test_preflight_reports_tables_a_rule_reads(samples_path, files_path):
+    with HOOKS.registered(Recorder()) as rec, pytest.warns(DeprecationWarning):
+        validator.run_rulepack(
+            Path("tests/fixtures/rulepacks/geo_bulk_seq_min_v0_2_0.json"),
+            samples_path,
+            files_path,
+            "0",
+            {},
+        )
+    assert [(e.stage, e.input) for e in rec.events] == [
+        ("on_load", "samples"),
+        ("on_load", "files"),
+        ("on_rule_start", "samples"),
+        ("on_rule_end", "samples"),
+    ]
+    assert rec.events[-1].rule == "GEO.REQ.MISSING_FIELD"
+
+
+def test_cli_reports_written_files(tmp_path, art_rulepack):
+    out_json, out_md = tmp_path / "report.json", tmp_path / "report.md"
+    with HOOKS.registered(Recorder()) as rec:
+        cmd_validate.main(
+            [
+                "tests/fixtures/penguins_small.csv",
+                "--rulepack",
+                str(art_rulepack),
+                "--report-json",
+                str(out_json),
+                "--report-md",
+                str(out_md),
+            ]
+        )
+    writes = [e.path for e in rec.events if e.stage == "on_write"]
+    assert writes == [str(out_json), str(out_md)]
+
+
+def test_register_needs_a_hook_method():
+    with pytest.raises(ValueError, match="on_load"):
+        HOOKS.register(object())
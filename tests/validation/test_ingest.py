@@ -0,0 +1,49 @@
+import gzip
+import hashlib
+
+from fairy.validation.ingest import HEADER_ATTR, ChunkedInput, read_input
+
+CSV = b'id,name,note\r\n1,a,"multi\r\nline"\r\n2,b,x\r\n3,c,\r\n'
+
+
+def test_read_input_hashes_while_parsing(tmp_path):
+    p = tmp_path / "t.csv"
+    p.write_bytes(CSV)
+
+    df, stats = read_input(p)
+    assert list(df.columns) == ["id", "name", "note"]
+    assert stats.sha256 == hashlib.sha256(CSV).hexdigest()
+    assert stats.bytes == len(CSV)
+    assert stats.rows == 3
+
+    projected, pstats = read_input(p, usecols={"note", "missing"})
+    assert list(projected.columns) == ["note"]
+    assert projected.attrs[HEADER_ATTR] == ["id", "name", "note"]
+    assert pstats == stats
+
+    # nothing referenced: no columns, but rows still counted
+    empty, estats = read_input(p, usecols=set())
+    assert empty.shape == (3, 0)
+    assert estats.rows == 3
+
+
+def test_chunked_input_stats_after_iteration(tmp_path):
+    p = tmp_path / "t.tsv"
+    p.write_bytes(CSV.replace(b",", b"\t"))
+    chunks = ChunkedInput(p, {"name"}, chunksize=2)
+    assert chunks.stats is None
+
+    frames = list(chunks)
+    assert [len(f) for f in frames] == [2, 1]
+    assert all(f.attrs[HEADER_ATTR] == ["id", "name", "note"] for f in frames)
+    assert chunks.stats.rows == 3
+    assert chunks.stats.sha256 == hashlib.sha256(p.read_bytes()).hexdigest()
+
+
+def test_compressed_input_hashes_the_file_bytes(tmp_path):
+    p = tmp_path / "t.csv.gz"
+    p.write_bytes(gzip.compress(CSV))
+    df, stats = read_input(p, usecols={"id"})
+    assert df["id"].tolist() == ["1", "2", "3"]
+    assert stats.sha256 == hashlib.sha256(p.read_bytes()).hexdigest()
+    assert stats.bytes == p.stat().st_size
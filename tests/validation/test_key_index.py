@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import yaml
+
+from fairy.validation import key_index
+from fairy.validation.key_index import KeyIndex
+from fairy.validation.result_cache import ResultCache
+from fairy.validation.rulepack_runner import run_rulepack
+
+
+def test_key_index_is_exact_for_composite_keys_and_collisions(tmp_path, monkeypatch):
+    ref = pd.DataFrame({"a": ["1", "1:", "", None], "b": ["2", "", "x", "y"]})
+    src = pd.DataFrame({"a": ["1", "1", "1:", "", None], "b": ["2", ":", "", "y", "q"]})
+    KeyIndex.build(ref, ("a", "b"), tmp_path / "ab")
+    index = KeyIndex.open(tmp_path / "ab")
+    assert index.missing(src, ("a", "b")).tolist() == [False, True, False, True, False]
+
+    # Every key hashing alike must still be told apart by the stored strings
+    monkeypatch.setattr(key_index, "_hash", lambda keys: np.zeros(len(keys), dtype=np.uint64))
+    KeyIndex.build(ref, ("a",), tmp_path / "a")
+    index = KeyIndex.open(tmp_path / "a")
+    assert index.missing(src, ("a",)).tolist() == [False, False, False, False, False]
+    assert index.missing(pd.DataFrame({"a": ["2"]}), ("a",)).tolist() == [True]
+
+
+def test_open_missing_index_is_none(tmp_path):
+    assert KeyIndex.open(tmp_path / "nope") is None
+
+
+def test_changed_reference_table_is_reindexed(tmp_path, art_rulepack, art_inputs_copy, now):
+    rp = yaml.safe_load(art_rulepack.read_text())
+    inputs = art_inputs_copy
+    cache_dir = tmp_path / "cache"
+    run_rulepack(inputs, rp, art_rulepack, now, cache=ResultCache(cache_dir))
+    assert len(list((cache_dir / "keys").iterdir())) == 1
+
+    # Drop the last artist: a stale index would hide the new missing references
+    header, *rows = inputs["artists"].read_text(encoding="utf-8").splitlines()
+    inputs["artists"].write_text("\n".join([header, *rows[:-1]]) + "\n", encoding="utf-8")
+    got = run_rulepack(inputs, rp, art_rulepack, now, cache=ResultCache(cache_dir))
+    assert got == run_rulepack(inputs, rp, art_rulepack, now)
+    assert len(list((cache_dir / "keys").iterdir())) == 2
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairy.validation import keys
+from fairy.validation.keys import duplicate_mask
+
+
+@pytest.mark.parametrize("keep", ["first", "last", False])
+def test_duplicate_mask_matches_pandas(keep):
+    df = pd.DataFrame(
+        {
+            "a": ["x", "x", "y", "x", "y", None, None],
+            "b": ["1", "1", "1", "2", "1", "1", "1"],
+            "c": [1, 1.0, 2, 1, 2, 3, 3],
+        }
+    )
+    cols = ["a", "b", "c"]
+    expected = df.duplicated(subset=cols, keep=keep).to_numpy()
+    assert duplicate_mask(df, cols, keep=keep).tolist() == expected.tolist()
+
+
+def test_single_column_and_empty():
+    df = pd.DataFrame({"id": ["a", "b", "a"]})
+    assert duplicate_mask(df, ["id"]).tolist() == [False, False, True]
+    assert duplicate_mask(df.iloc[:0], ["id", "id"]).dtype == np.bool_
+
+
+def test_hashed_keys_resolve_collisions(monkeypatch):
+    # Force the hashed path with a hash that collides constantly
+    real_row_keys = keys.row_keys
+    monkeypatch.setattr(pd.util, "hash_array", lambda a: (np.asarray(a) % 2).astype(np.uint64))
+    monkeypatch.setattr(
+        keys, "row_keys", lambda codes, sizes, n: real_row_keys(codes, [2**40] * len(sizes), n)
+    )
+    df = pd.DataFrame({"a": list("abcdabcd"), "b": list("11223344")})
+    got = duplicate_mask(df, ["a", "b"], keep=False)
+    assert got.tolist() == df.duplicated(keep=False).tolist()
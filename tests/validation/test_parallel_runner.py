@@ -0,0 +1,22 @@
+import pytest
+import yaml
+
+from fairy.cli import validate as cmd_validate
+from fairy.validation.rulepack_runner import run_rulepack
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_jobs_report_matches_sequential(chunksize, art_rulepack, art_inputs, now):
+    rp = yaml.safe_load(art_rulepack.read_text())
+    expected = run_rulepack(art_inputs, rp, art_rulepack, now)
+    got = run_rulepack(art_inputs, rp, art_rulepack, now, jobs=2, chunksize=chunksize)
+    assert got == expected
+    assert [r["name"] for r in got["resources"]] == list(art_inputs)
+
+
+def test_cli_rejects_non_positive_jobs(capsys, art_rulepack):
+    rc = cmd_validate.main(
+        ["tests/fixtures/penguins_small.csv", "--rulepack", str(art_rulepack), "--jobs", "0"]
+    )
+    assert rc == 2
+    assert "--jobs" in capsys.readouterr().err
@@ -0,0 +1,98 @@
+import yaml
+
+from fairy.validation import rulepack_runner
+from fairy.validation.result_cache import ResultCache
+from fairy.validation.rulepack_runner import run_rulepack
+
+
+def test_cached_run_matches_uncached(tmp_path, art_rulepack, art_inputs_copy, now):
+    rp = yaml.safe_load(art_rulepack.read_text())
+    inputs = art_inputs_copy
+    expected = run_rulepack(inputs, rp, art_rulepack, now)
+
+    cache = ResultCache(tmp_path / "cache")
+    assert run_rulepack(inputs, rp, art_rulepack, now, cache=cache) == expected
+    assert cache.hits == 0
+
+    warm = ResultCache(tmp_path / "cache")
+    assert run_rulepack(inputs, rp, art_rulepack, now, cache=warm) == expected
+    assert warm.misses == 0 and warm.hits > 0
+
+
+def test_changed_input_reevaluates_only_its_rules(
+    tmp_path, monkeypatch, art_rulepack, art_inputs_copy, now
+):
+    rp = yaml.safe_load(art_rulepack.read_text())
+    inputs = art_inputs_copy
+    run_rulepack(inputs, rp, art_rulepack, now, cache=ResultCache(tmp_path / "cache"))
+
+    with inputs["artworks"].open("a", encoding="utf-8") as f:
+        f.write("\n")  # same rows, different bytes
+    parsed = []
+    real = rulepack_runner._input_results
+    monkeypatch.setattr(
+        rulepack_runner,
+        "_input_results",
+        lambda path, rules, *a: parsed.append((path.name, len(rules))) or real(path, rules, *a),
+    )
+    got = run_rulepack(inputs, rp, art_rulepack, now, cache=ResultCache(tmp_path / "cache"))
+    monkeypatch.undo()
+
+    # artists is not read at all: the re-run foreign_key uses its stored key index
+    assert "artists.csv" not in dict(parsed)
+    assert dict(parsed)["artworks_fail_missing_artist.csv"] > 0
+    assert got == run_rulepack(inputs, rp, art_rulepack, now)
+
+
+def test_edited_rows_are_revalidated_alone(
+    tmp_path, monkeypatch, art_rulepack, art_inputs_copy, now
+):
+    rp = yaml.safe_load(art_rulepack.read_text())
+    inputs = art_inputs_copy
+    run_rulepack(inputs, rp, art_rulepack, now, cache=ResultCache(tmp_path / "cache"))
+
+    # Insert a new first row; the existing rows move down but keep their content
+    path = inputs["artworks"]
+    header, *rows = path.read_text(encoding="utf-8").splitlines()
+    path.write_text("\n".join([header, "9,Sketch,A1", *rows]) + "\n", encoding="utf-8")
+
+    from fairy.validation import incremental
+
+    seen = {}
+    real = incremental._execute_rule
+
+    def spy(rule, df, *a):
+        seen[rule.type] = len(df)
+        return real(rule, df, *a)
+
+    monkeypatch.setattr(incremental, "_execute_rule", spy)
+    got = run_rulepack(inputs, rp, art_rulepack, now, cache=ResultCache(tmp_path / "cache"))
+    monkeypatch.undo()
+
+    assert got == run_rulepack(inputs, rp, art_rulepack, now)
+    # Row-local rules see only the new row (the old ones passed); unique sees them all
+    assert seen["required"] == seen["non_empty_trimmed"] == 1
+    assert seen["unique"] == len(rows) + 1
+
+
+def test_inputs_are_read_at_most_once(tmp_path, monkeypatch, art_rulepack, art_inputs_copy, now):
+    rp = yaml.safe_load(art_rulepack.read_text())
+    inputs = art_inputs_copy
+    run_rulepack(inputs, rp, art_rulepack, now, cache=ResultCache(tmp_path / "cache"))
+
+    def no_hashing(paths, *a, **kw):
+        raise AssertionError(f"hashed apart from parsing: {paths}")
+
+    # Unchanged inputs are known by their stat stamp; an edited one is hashed while parsed
+    monkeypatch.setattr(rulepack_runner, "sha256_files", no_hashing)
+    warm = ResultCache(tmp_path / "cache")
+    assert run_rulepack(inputs, rp, art_rulepack, now, cache=warm)
+    assert warm.misses == 0
+    with inputs["artworks"].open("a", encoding="utf-8") as f:
+        f.write("\n")
+    got = run_rulepack(inputs, rp, art_rulepack, now, cache=ResultCache(tmp_path / "cache"))
+    again = ResultCache(tmp_path / "cache")
+    assert run_rulepack(inputs, rp, art_rulepack, now, cache=again) == got
+    assert again.misses == 0
+    monkeypatch.undo()
+    assert got == run_rulepack(inputs, rp, art_rulepack, now)
@@ -0,0 +1,173 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from fairy.cli import validate as cmd_validate
+from fairy.validation.rulepack_runner import run_rulepack
+from fairy.validation.sampling import SampleSpec, wilson_interval
+
+MULTILINE = '"two\nlines, ""quoted""\n1,2,3"'
+VALUE = 'two\nlines, "quoted"\n1,2,3'
+RP = {
+    "id": "sample",
+    "version": "0.1.0",
+    "resources": [
+        {
+            "pattern": "*",
+            "rules": [
+                {"id": "n_range", "type": "range", "column": "n", "min": 0, "max": 4},
+                {"id": "note_enum", "type": "enum", "column": "note", "allow": ["plain"]},
+                {"id": "id_unique", "type": "unique", "columns": ["id"]},
+            ],
+        }
+    ],
+}
+
+
+def _write(path: Path, rows: int) -> Path:
+    # n is out of range on half the rows; every 7th note is a long quoted multi-line field
+    lines = ["id,n,note"]
+    for i in range(1, rows + 1):
+        lines.append(f"{i},{i % 10},{MULTILINE if i % 7 == 0 else 'plain'}")
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.fixture(scope="module")
+def big(tmp_path_factory):
+    # Over the 1 MiB head, so it is sampled by byte offsets
+    return _write(tmp_path_factory.mktemp("sample") / "big.csv", 100_000)
+
+
+def _rules(report):
+    return {r["id"]: r for res in report["resources"] for r in res["rules"]}
+
+
+@pytest.mark.parametrize(
+    "text, spec",
+    [("1000", SampleSpec(size=1000)), ("0.01", SampleSpec(fraction=0.01)), ("1", SampleSpec(1))],
+)
+def test_parse_sample(text, spec):
+    assert SampleSpec.parse(text) == spec
+
+
+@pytest.mark.parametrize("text", ["0", "1.5", "-3", "abc", "1.0"])
+def test_parse_sample_rejects(text):
+    with pytest.raises(ValueError):
+        SampleSpec.parse(text)
+
+
+def test_byte_offset_sample_finds_row_boundaries(big, now):
+    known = [
+        {"id": "note_known", "type": "enum", "column": "note", "allow": ["plain", VALUE]},
+        {"id": "id_known", "type": "regex", "column": "id", "regex": "[1-9][0-9]*"},
+    ]
+    rp = {**RP, "resources": [{"pattern": "*", "rules": RP["resources"][0]["rules"] + known}]}
+    spec = SampleSpec(size=800, seed=7)
+    report = run_rulepack({"big": big}, rp, Path("rp.yml"), now, sample=spec)
+    info = report["metadata"]["sample"]["inputs"]["big"]
+    assert info["method"] == "byte_offset" and info["rows"] == 800
+    assert abs(info["estimated_rows"] - 100_000) < 10_000
+
+    rules = _rules(report)
+    # Every sampled row parsed whole: a misaligned one would break these value sets
+    assert rules["note_known"]["status"] == rules["id_known"]["status"] == "PASS"
+    for rule, truth in (("n_range", 0.5), ("note_enum", 1 / 7)):
+        lo, hi = rules[rule]["estimate"]["rate_ci95"]
+        assert lo <= truth <= hi
+    assert rules["id_unique"]["status"] == "SKIPPED"
+    assert rules["id_unique"]["evidence"] == {"skipped": "sample"}
+    assert "estimate" not in rules["id_unique"]
+
+    att = report["attestation"]["inputs"][0]
+    assert att["sha256"] is None  # sampled, so not read in full
+    assert att["bytes"] == big.stat().st_size
+    assert att["rows"] == 800 and att["rows_is_lower_bound"] is True
+    assert report["metadata"]["sample"]["seed"] == 7
+
+
+def test_same_seed_same_sample(big, now):
+    spec = SampleSpec(fraction=0.01, seed=3)
+    first = run_rulepack({"big": big}, RP, Path("rp.yml"), now, sample=spec)
+    assert run_rulepack({"big": big}, RP, Path("rp.yml"), now, sample=spec) == first
+    assert first["metadata"]["sample"]["fraction"] == 0.01
+
+
+def test_unseeded_run_records_its_seed(big, now):
+    report = run_rulepack({"big": big}, RP, Path("rp.yml"), now, sample=SampleSpec(size=10))
+    seed = report["metadata"]["sample"]["seed"]
+    again = run_rulepack(
+        {"big": big}, RP, Path("rp.yml"), now, sample=SampleSpec(size=10, seed=seed)
+    )
+    assert again == report
+
+
+def test_compressed_input_uses_reservoir(tmp_path, now):
+    plain = _write(tmp_path / "data.csv", 2_000)
+    gz = tmp_path / "data.csv.gz"
+    gz.write_bytes(gzip.compress(plain.read_bytes()))
+    report = run_rulepack(
+        {"data": gz}, RP, Path("rp.yml"), now, sample=SampleSpec(size=300, seed=1)
+    )
+    info = report["metadata"]["sample"]["inputs"]["data"]
+    assert info == {"method": "reservoir", "rows": 300, "estimated_rows": 2_000}
+    assert report["attestation"]["inputs"][0]["rows"] == 2_000
+
+
+def test_multi_column_rule_rate_counts_rows(tmp_path, now):
+    # required reports one violation per blank cell; the rate is per row
+    lines = ["id,a,b,c"] + [f"{i},,," if i % 2 else f"{i},1,2,3" for i in range(5_000)]
+    gz = tmp_path / "data.csv.gz"
+    gz.write_bytes(gzip.compress(("\n".join(lines) + "\n").encode()))
+    rp = {
+        "id": "sample",
+        "version": "0.1.0",
+        "resources": [
+            {
+                "pattern": "*",
+                "rules": [{"id": "abc", "type": "required", "columns": ["a", "b", "c"]}],
+            }
+        ],
+    }
+    report = run_rulepack(
+        {"data": gz}, rp, Path("rp.yml"), now, sample=SampleSpec(size=100, seed=1)
+    )
+    est = _rules(report)["abc"]["estimate"]
+    assert est["violations"] > est["sample_rows"]
+    assert 0 < est["rate_ci95"][0] <= est["rate"] <= est["rate_ci95"][1] < 1
+    assert est["estimated_count"] <= 5_000
+
+
+def test_small_input_is_read_whole(tmp_path, now):
+    data = _write(tmp_path / "data.csv", 200)
+    full = _rules(run_rulepack({"data": data}, RP, Path("rp.yml"), now))
+    report = run_rulepack(
+        {"data": data}, RP, Path("rp.yml"), now, sample=SampleSpec(size=50, seed=1)
+    )
+    assert report["metadata"]["sample"]["inputs"]["data"]["method"] == "full"
+    rules = _rules(report)
+    est = rules["n_range"]["estimate"]
+    assert est["rate_ci95"] == [0.5, 0.5] and est["estimated_count"] == 100
+    assert rules["n_range"]["evidence"] == full["n_range"]["evidence"]
+
+
+def test_wilson_interval_contains_rate():
+    lo, hi = wilson_interval(0.0, 100)
+    assert lo == pytest.approx(0.0) and 0 < hi < 0.05
+    lo, hi = wilson_interval(0.5, 1000)
+    assert lo < 0.5 < hi and hi - lo < 0.07
+    assert wilson_interval(1.5, 100) == wilson_interval(1.0, 100)
+
+
+def test_cli_records_sample(big, tmp_path):
+    rp = tmp_path / "rp.json"
+    rp.write_text(json.dumps(RP))
+    out = tmp_path / "report.json"
+    argv = [str(big), "--rulepack", str(rp), "--report-json", str(out)]
+    assert cmd_validate.main([*argv, "--sample", "100", "--seed", "5"]) == 1
+    assert json.loads(out.read_text())["metadata"]["sample"]["size"] == 100
+    assert cmd_validate.main([*argv, "--seed", "5"]) == 2
+    assert cmd_validate.main([*argv, "--sample", "2.5"]) == 2
+    assert cmd_validate.main([*argv, "--sample", "100", "--fail-fast"]) == 2
@@ -0,0 +1,124 @@
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from fairy.cli import validate as cmd_validate
+from fairy.validation.result_cache import ResultCache
+from fairy.validation.rulepack_runner import run_rulepack, write_markdown
+
+RP = {
+    "id": "limits",
+    "version": "0.1.0",
+    "resources": [
+        {
+            "pattern": "data.csv",
+            "rules": [
+                {"id": "n_range", "type": "range", "column": "n", "min": 0, "max": 4},
+                {"id": "code_req", "type": "required", "columns": ["code"], "severity": "warn"},
+                {"id": "id_unique", "type": "unique", "columns": ["id"]},
+                {
+                    "id": "id_fk",
+                    "type": "foreign_key",
+                    "from": {"table": "data", "field": "id"},
+                    "to": {"table": "other", "field": "id"},
+                },
+            ],
+        },
+        {
+            "pattern": "other.csv",
+            "rules": [{"id": "o_unique", "type": "unique", "columns": ["id"]}],
+        },
+    ],
+}
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    # n is out of range on half the rows, code is empty on every third row
+    rows = [f"{i},{i % 10},{'ab' if i % 3 else ''}" for i in range(1, 101)]
+    (tmp_path / "data.csv").write_text("id,n,code\n" + "\n".join(rows) + "\n")
+    (tmp_path / "other.csv").write_text("id\n1\n2\n")
+    return {"data": tmp_path / "data.csv", "other": tmp_path / "other.csv"}
+
+
+def _rules(report):
+    return {r["id"]: r for res in report["resources"] for r in res["rules"]}
+
+
+def test_max_violations_reports_lower_bounds(inputs, now):
+    full = _rules(run_rulepack(inputs, RP, Path("rp.yml"), now))
+    report = run_rulepack(inputs, RP, Path("rp.yml"), now, max_violations=5, chunksize=10)
+    rules = _rules(report)
+
+    ev = rules["n_range"]["evidence"]
+    assert rules["n_range"]["status"] == "FAIL" and ev["count_is_lower_bound"] is True
+    assert 5 <= ev["out_of_bounds"]["count"] < full["n_range"]["evidence"]["out_of_bounds"]["count"]
+    assert rules["code_req"]["evidence"]["count_is_lower_bound"] is True
+    fk = rules["id_fk"]["evidence"]
+    assert fk["count_is_lower_bound"] is True and 5 <= fk["count"] < 98
+    # Rules that never reach the cap are exact, so the read ran to the end
+    assert rules["id_unique"] == full["id_unique"]
+    assert "rows_is_lower_bound" not in report["attestation"]["inputs"][0]
+    assert report["metadata"]["limits"] == {"fail_fast": False, "max_violations": 5}
+
+
+def test_capped_input_stops_reading_but_hashes_whole_file(inputs, now):
+    rp = {"id": "limits", "version": "0.1.0", "resources": [RP["resources"][0]]}
+    rp["resources"][0] = {**rp["resources"][0], "rules": rp["resources"][0]["rules"][:1]}
+    report = run_rulepack({"data": inputs["data"]}, rp, Path("rp.yml"), now, max_violations=3)
+    att = report["attestation"]["inputs"][0]
+    assert att["rows_is_lower_bound"] is True
+    assert att["sha256"] == hashlib.sha256(inputs["data"].read_bytes()).hexdigest()
+    assert att["bytes"] == inputs["data"].stat().st_size
+
+
+def test_max_violations_above_every_count_changes_nothing(inputs, now):
+    plain = run_rulepack(inputs, RP, Path("rp.yml"), now)
+    capped = run_rulepack(inputs, RP, Path("rp.yml"), now, max_violations=1000)
+    assert capped["metadata"].pop("limits") == {"fail_fast": False, "max_violations": 1000}
+    assert capped == plain
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_fail_fast_skips_what_it_did_not_reach(inputs, jobs, now):
+    report = run_rulepack(inputs, RP, Path("rp.yml"), now, fail_fast=True, chunksize=10, jobs=jobs)
+    rules = _rules(report)
+    assert rules["n_range"]["status"] == "FAIL"
+    assert rules["code_req"]["status"] == "WARN"
+    assert rules["code_req"]["evidence"]["count_is_lower_bound"] is True
+    # Nothing found yet in the rows read: not a PASS
+    assert rules["id_unique"]["status"] == "SKIPPED"
+    assert rules["o_unique"]["evidence"] == {"skipped": "fail_fast"}
+    assert rules["id_fk"]["status"] == "SKIPPED"
+    assert report["summary"] == {"pass": 0, "warn": 1, "fail": 1, "skipped": 3}
+
+    data, other = report["attestation"]["inputs"]
+    assert data["rows"] == 10 and data["rows_is_lower_bound"] is True
+    assert other["rows"] == 0 and other["rows_is_lower_bound"] is True
+    assert other["sha256"] == hashlib.sha256(inputs["other"].read_bytes()).hexdigest()
+    assert "- SKIPPED: 3" in write_markdown(report)
+
+
+def test_fail_fast_matches_a_full_run_that_passes(art_rulepack, art_inputs, now):
+    rp = yaml.safe_load(art_rulepack.read_text())
+    inputs = {**art_inputs, "artworks": art_rulepack.with_name("artworks_pass.csv")}
+    report = run_rulepack(inputs, rp, art_rulepack, now, fail_fast=True)
+    report["metadata"].pop("limits")
+    assert report == run_rulepack(inputs, rp, art_rulepack, now)
+
+
+def test_limited_results_are_not_cached(inputs, tmp_path, now):
+    cache = ResultCache(tmp_path / "cache")
+    run_rulepack(inputs, RP, Path("rp.yml"), now, cache=cache, max_violations=5, chunksize=10)
+    again = run_rulepack(inputs, RP, Path("rp.yml"), now, cache=cache)
+    assert again == run_rulepack(inputs, RP, Path("rp.yml"), now)
+
+
+def test_cli_rejects_non_positive_max_violations(inputs, tmp_path):
+    rp = tmp_path / "rp.json"
+    rp.write_text(json.dumps(RP))
+    argv = [str(inputs["data"]), "--rulepack", str(rp), "--max-violations", "0"]
+    assert cmd_validate.main(argv) == 2
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from fairy.validation.rulepack_runner import run_rulepack
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 1000])
+def test_streaming_report_matches_in_memory_art(chunksize, art_rulepack, art_inputs, now):
+    rp = yaml.safe_load(art_rulepack.read_text())
+    expected = run_rulepack(art_inputs, rp, art_rulepack, now)
+    assert run_rulepack(art_inputs, rp, art_rulepack, now, chunksize=chunksize) == expected
+
+
+@pytest.mark.parametrize("chunksize", [1, 3])
+def test_streaming_merges_rows_across_chunks(tmp_path, chunksize, now):
+    data = tmp_path / "data.csv"
+    data.write_text(
+        "id,code,n,link\n"
+        "1,ab,1,http://x/1\n"
+        "2,,9,http://x/2\n"
+        "1,zz,q,http://x/3\n"
+        "3, ,2,http://x/4\n"
+        "2,ab,7,http://x/5\n"
+    )
+    rp = {
+        "id": "stream",
+        "version": "0.1.0",
+        "resources": [
+            {
+                "pattern": "data.csv",
+                "rules": [
+                    {
+                        "id": "id_unique",
+                        "type": "unique",
+                        "columns": ["id"],
+                        "remediation_link_column": "link",
+                    },
+                    {"id": "n_range", "type": "range", "column": "n", "min": 0, "max": 5},
+                    {"id": "code_fmt", "type": "regex", "column": "code", "regex": "[a-c]+"},
+                    {"id": "code_req", "type": "required", "columns": ["code", "missing"]},
+                ],
+            }
+        ],
+    }
+    inputs = {"data": data}
+    expected = run_rulepack(inputs, rp, Path("rp.yml"), now)
+    got = run_rulepack(inputs, rp, Path("rp.yml"), now, chunksize=chunksize)
+    assert got == expected
+
+    rules = {r["id"]: r for r in got["resources"][0]["rules"]}
+    assert rules["id_unique"]["evidence"]["duplicates"] == [{"rows": [3, 5]}]
+    assert [link["row"] for link in rules["id_unique"]["evidence"]["remediation"]["links"]] == [
+        3,
+        5,
+    ]
+    assert rules["n_range"]["evidence"]["out_of_bounds"]["rows"] == [2, 3, 5]
+    assert rules["code_fmt"]["evidence"]["ignored_empty_count"] == 2
+    assert got["attestation"]["inputs"][0]["rows"] == 5
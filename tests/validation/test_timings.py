@@ -0,0 +1,89 @@
+import json
+import tracemalloc
+from pathlib import Path
+
+import jsonschema
+import pytest
+import yaml
+
+from fairy.cli import validate as cmd_validate
+from fairy.core.services import validator
+from fairy.validation import timing
+from fairy.validation.hooks import input_scope
+from fairy.validation.result_cache import ResultCache
+from fairy.validation.rulepack_runner import run_rulepack
+from fairy.validation.timing import Stopwatch
+
+GEO_RP = Path("tests/fixtures/rulepacks/geo_bulk_seq_min_v0_2_0.json")
+
+
+def _rule_timings(report):
+    return [rule.pop("timing") for res in report["resources"] for rule in res["rules"]]
+
+
+@pytest.mark.parametrize("kw", [{}, {"jobs": 2}, {"chunksize": 2}])
+def test_timings_only_add_timing_blocks(kw, art_rulepack, art_inputs, now):
+    rp = yaml.safe_load(art_rulepack.read_text())
+    plain = run_rulepack(art_inputs, rp, art_rulepack, now, **kw)
+    timed = run_rulepack(art_inputs, rp, art_rulepack, now, timings=True, **kw)
+
+    run = timed.pop("timing")
+    assert set(run) == {"load", "hash", "rules", "report", "serialize", "total"}
+    assert run["total"] >= run["rules"] > 0
+    for t in _rule_timings(timed):
+        assert t["rows"] > 0 and t["seconds"] >= 0 and t["peak_bytes"] >= 0
+    assert timed == plain
+    assert not tracemalloc.is_tracing()
+
+
+def test_cached_rules_are_marked(tmp_path, art_rulepack, art_inputs, now):
+    rp = yaml.safe_load(art_rulepack.read_text())
+    cache = ResultCache(tmp_path / "cache")
+    run_rulepack(art_inputs, rp, art_rulepack, now, cache=cache)
+    again = run_rulepack(art_inputs, rp, art_rulepack, now, cache=cache, timings=True)
+    assert all(
+        t == {"seconds": 0.0, "rows": 0, "peak_bytes": 0, "cached": True}
+        for t in _rule_timings(again)
+    )
+
+
+def test_stopwatch_sums_evaluations_and_keeps_largest_peak():
+    with Stopwatch() as watch:
+        with input_scope("t"):
+            with timing.measure("r", 10):
+                buf = bytearray(4_000_000)
+                del buf
+            with timing.measure("r", 5):
+                pass
+    t = watch.get("t", "r")
+    assert t.rows == 15
+    assert t.peak_bytes >= 4_000_000
+    assert timing.active() is None and not tracemalloc.is_tracing()
+
+
+def test_cli_writes_serialize_phase(tmp_path, art_rulepack, art_inputs):
+    out = tmp_path / "report.json"
+    cmd_validate.main(
+        [
+            *[f"--inputs={name}={path}" for name, path in art_inputs.items()],
+            "--rulepack",
+            str(art_rulepack),
+            "--report-json",
+            str(out),
+            "--timings",
+        ]
+    )
+    report = json.loads(out.read_text())
+    assert report["timing"]["serialize"] > 0
+    assert all("timing" in rule for res in report["resources"] for rule in res["rules"])
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_preflight_timings_conform_to_schema(samples_path, files_path):
+    schema = json.loads(Path("schemas/preflight_report_v1.schema.json").read_text())
+    report = validator.run_rulepack(GEO_RP, samples_path, files_path, "0", {}, timings=True)
+    props = schema["properties"]
+    jsonschema.validate(instance=report["results"], schema=props["results"])
+    jsonschema.validate(instance=report["timing"], schema=props["timing"])
+    assert report["results"] and all(r["timing"]["rows"] > 0 for r in report["results"])
+    assert report["timing"]["rules"] > 0